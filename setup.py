@@ -38,12 +38,14 @@ setup(
         "dev": [
             "pytest>=7.0",
             "pytest-cov>=4.0",
+            "pytest-xdist>=3.0",
             "black>=23.0",
             "mypy>=1.0",
             "pylint>=2.17",
         ],
         "test": [
             "pytest>=7.0",
+            "pytest-xdist>=3.0",
             # Note: pyewts is installed locally from ../pyewts directory
             # Install with: pip install -e ../pyewts
         ],
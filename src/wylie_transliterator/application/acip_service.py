@@ -3,11 +3,31 @@ ACIP Service - Application Layer
 Provides high-level use cases for ACIP transliteration operations.
 """
 
-from typing import List
+import re
+from typing import List, Tuple
 from ..domain.services.acip_converter import ACIPConverter
 from .transliteration_service import TransliterationService
 
 
+# Any character of the Tibetan Unicode block (U+0F00 to U+0FFF)
+_TIBETAN_CHAR_RE = re.compile('[\u0F00-\u0FFF]')
+
+# ASCII letters by case, as deletion sets for bytes.translate
+_ASCII_UPPERCASE = bytes(range(ord('A'), ord('Z') + 1))
+_ASCII_LOWERCASE = bytes(range(ord('a'), ord('z') + 1))
+
+
+def _count_cases(text: str) -> Tuple[int, int]:
+    """Count (uppercase, lowercase) characters of text"""
+    if text.isascii():
+        # Counted in C: the letters of one case are whatever translate drops
+        data = text.encode('ascii')
+        return (len(data) - len(data.translate(None, _ASCII_UPPERCASE)),
+                len(data) - len(data.translate(None, _ASCII_LOWERCASE)))
+    return (sum(1 for c in text if c.isupper()),
+            sum(1 for c in text if c.islower()))
+
+
 class ACIPService:
     """
     Application Service for ACIP transliteration.
@@ -148,10 +168,13 @@ class ACIPService:
             བླ་མ
             སངས་རྒྱས
         """
-        return [
-            self.acip_to_unicode(text, preserve_spaces)
-            for text in acip_texts
-        ]
+        # Run each stage over the whole batch with its method bound once;
+        # a single joined conversion is not possible, as ACIP rules anchor
+        # at the start of the text and span any separator
+        acip_to_ewts = self._acip_converter.acip_to_ewts
+        to_unicode = self._transliteration_service.transliterate_wylie_to_tibetan
+        ewts_texts = [acip_to_ewts(text) for text in acip_texts]
+        return [to_unicode(text, preserve_spaces) for text in ewts_texts]
     
     def unicode_to_acip_batch(
         self,
@@ -176,10 +199,10 @@ class ACIPService:
             BLA MA
             SANGS RGYAS
         """
-        return [
-            self.unicode_to_acip(text)
-            for text in tibetan_texts
-        ]
+        to_ewts = self._transliteration_service.transliterate_tibetan_to_wylie
+        ewts_to_acip = self._acip_converter.ewts_to_acip
+        ewts_texts = [to_ewts(text) for text in tibetan_texts]
+        return [ewts_to_acip(text) for text in ewts_texts]
     
     def detect_format(self, text: str) -> str:
         """
@@ -206,7 +229,7 @@ class ACIPService:
             'unicode'
         """
         # Check for Tibetan Unicode characters
-        if any('\u0F00' <= c <= '\u0FFF' for c in text):
+        if _TIBETAN_CHAR_RE.search(text):
             return 'unicode'
         
         # Check for ACIP-specific markers
@@ -215,8 +238,7 @@ class ACIPService:
             return 'acip'
         
         # Check case: ACIP uses mostly uppercase
-        upper_count = sum(1 for c in text if c.isupper())
-        lower_count = sum(1 for c in text if c.islower())
+        upper_count, lower_count = _count_cases(text)
         total_alpha = upper_count + lower_count
         
         if total_alpha > 0:
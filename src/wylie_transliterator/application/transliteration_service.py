@@ -3,6 +3,7 @@ Transliteration Service - Application Layer
 Provides high-level use cases for transliteration operations.
 """
 
+from dataclasses import dataclass
 from ..domain.services.transliterator import WylieToTibetanTransliterator
 from ..domain.services.tibetan_to_wylie import TibetanToWylieTransliterator
 
@@ -17,6 +18,9 @@ class TransliterationService:
     Supports bidirectional transliteration:
     - Wylie → Tibetan Unicode
     - Tibetan Unicode → Wylie
+    
+    Both directions pass newlines through unchanged, so output has exactly
+    as many lines as input.
     """
     
     def __init__(self):
@@ -101,20 +105,13 @@ class TransliterationService:
         return [self.transliterate_tibetan_to_wylie(text) for text in tibetan_texts]
 
 
+@dataclass(frozen=True, slots=True)
 class TransliterationStatistics:
     """Value Object for transliteration statistics"""
-    
-    def __init__(
-        self,
-        input_chars: int,
-        output_chars: int,
-        input_lines: int,
-        output_lines: int
-    ):
-        self.input_chars = input_chars
-        self.output_chars = output_chars
-        self.input_lines = input_lines
-        self.output_lines = output_lines
+    input_chars: int
+    output_chars: int
+    input_lines: int
+    output_lines: int
     
     def __str__(self) -> str:
         return (
@@ -4,7 +4,7 @@ Provides use cases for Wylie input validation.
 """
 
 from typing import Dict, Any
-from ..domain.services.wylie_validator import WylieValidator
+from ..domain.services.wylie_validator import WylieValidator, get_validator
 from ..domain.value_objects.validation_rules import ValidationResult
 
 
@@ -28,9 +28,10 @@ class ValidationService:
         Initialize validation service.
         
         Args:
-            validator: Optional validator instance (for testing/DI)
+            validator: Optional validator instance (for testing/DI);
+                defaults to the shared process-wide validator
         """
-        self.validator = validator or WylieValidator()
+        self.validator = validator or get_validator()
     
     def validate_wylie(self, wylie_text: str) -> ValidationResult:
         """
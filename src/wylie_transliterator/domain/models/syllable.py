@@ -4,17 +4,39 @@ Represents the structure of a Tibetan syllable according to EWTS specification.
 """
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import NamedTuple, Optional
 
 
-@dataclass(frozen=True)
-class SyllableComponents:
+_tuple_new = tuple.__new__
+
+
+class _SyllableFields(NamedTuple):
+    """Field layout of SyllableComponents (see its docstring)"""
+    root: str
+    prescript: Optional[str] = None
+    superscript: Optional[str] = None
+    subscript: Optional[str] = None
+    vowel: str = 'a'
+    postscript1: Optional[str] = None
+    postscript2: Optional[str] = None
+    subscript_wylie_len: Optional[int] = None
+
+
+# Fields that define the value; subscript_wylie_len only records input spelling
+_VALUE_FIELDS = len(_SyllableFields._fields) - 1
+
+
+class SyllableComponents(_SyllableFields):
     """
     Value Object representing the 7 possible components of a Tibetan syllable.
     
     According to THL EWTS, a syllable has the structure:
     [prescript] [superscript] ROOT [subscript] [vowel] [postscript1] [postscript2]
     
+    Parsers build and discard several candidates per syllable, so this is an
+    immutable named tuple rather than a frozen dataclass: construction is a
+    single tuple allocation.
+    
     Attributes:
         prescript: Optional leading consonant (g, d, b, m, ')
         superscript: Optional top consonant (r, l, s)
@@ -23,19 +45,53 @@ class SyllableComponents:
         vowel: Vowel marker (a is inherent/default)
         postscript1: Optional first  final consonant
         postscript2: Optional second final consonant
+        subscript_wylie_len: Number of Wylie characters the subscript occupied
+            in the input, including any explicit '+'. Derived from subscript
+            when the parser does not supply it. Not part of equality.
     """
-    root: str
-    prescript: Optional[str] = None
-    superscript: Optional[str] = None
-    subscript: Optional[str] = None
-    vowel: str = 'a'
-    postscript1: Optional[str] = None
-    postscript2: Optional[str] = None
+    __slots__ = ()
     
-    def __post_init__(self):
+    def __new__(
+        cls,
+        root: str,
+        prescript: Optional[str] = None,
+        superscript: Optional[str] = None,
+        subscript: Optional[str] = None,
+        vowel: str = 'a',
+        postscript1: Optional[str] = None,
+        postscript2: Optional[str] = None,
+        subscript_wylie_len: Optional[int] = None
+    ):
         """Validate syllable structure"""
-        if not self.root:
+        if not root:
             raise ValueError("Syllable must have a root consonant")
+        if subscript_wylie_len is None:
+            # Implicit stacks are written without '+', e.g. 'r+w' from 'drwa'
+            subscript_wylie_len = len(subscript.replace('+', '')) if subscript else 0
+        return _tuple_new(cls, (
+            root, prescript, superscript, subscript,
+            vowel, postscript1, postscript2, subscript_wylie_len
+        ))
+    
+    def __eq__(self, other):
+        if isinstance(other, SyllableComponents):
+            return self[:_VALUE_FIELDS] == other[:_VALUE_FIELDS]
+        return NotImplemented
+    
+    def __ne__(self, other):
+        if isinstance(other, SyllableComponents):
+            return self[:_VALUE_FIELDS] != other[:_VALUE_FIELDS]
+        return NotImplemented
+    
+    def __hash__(self) -> int:
+        return hash(self[:_VALUE_FIELDS])
+    
+    def __repr__(self) -> str:
+        fields = ', '.join(
+            f'{name}={value!r}'
+            for name, value in zip(self._fields[:_VALUE_FIELDS], self)
+        )
+        return f'SyllableComponents({fields})'
 
 
 @dataclass
@@ -3,12 +3,28 @@ ACIP Converter Domain Service
 Handles conversion logic between ACIP and EWTS transliteration systems.
 """
 
-import re
 from typing import List
 from ..value_objects.acip_mappings import (
     ACIPAlphabet,
-    ACIPPatterns,
-    ACIPStandardStacks
+    ACIPStandardStacks,
+    A_BEFORE_VOWEL,
+    APOSTROPHE_VARIANTS,
+    APOSTROPHE_VOWEL,
+    ASTERISK_ENCODING,
+    COMMENT_AT,
+    COMMENT_BRACKET,
+    CONSONANT_TOKEN,
+    CONSONANTS_BEFORE_VOWEL,
+    ESCAPED_0F38,
+    GA_YAS_PATTERN,
+    INDEPENDENT_VOWEL,
+    LEADING_ASTERISK,
+    LEADING_HASH,
+    PARENS,
+    PARENS_EWTS,
+    REVERSE_VOWEL,
+    REVERSE_VOWEL_AFTER_APOSTROPHE,
+    SPACE_NORMALIZE,
 )
 
 
@@ -27,7 +43,6 @@ class ACIPConverter:
     
     def __init__(self):
         self._alphabet = ACIPAlphabet()
-        self._patterns = ACIPPatterns()
         self._stacks = ACIPStandardStacks()
     
     def acip_to_ewts(self, acip_text: str) -> str:
@@ -57,14 +72,14 @@ class ACIPConverter:
         
         # Step 3: Convert ACIP parentheses notation to EWTS
         # /.../ in ACIP = (...) in EWTS
-        result = self._patterns.PARENS.sub(r'(\1)', result)
+        result = PARENS.sub(r'(\1)', result)
         result = result.replace('/', '')  # Remove remaining slashes
         
-        # Step 4: Convert simple punctuation
+        # Step 4: Convert simple punctuation and special characters
         result = self._convert_simple_punctuation(result)
         
-        # Step 5: Handle special characters
-        result = self._convert_special_characters(result)
+        # Step 5: Encode asterisks
+        result = self._encode_asterisks(result)
         
         # Step 6: Handle TS/TZ distinction
         # Must do this before case conversion!
@@ -123,7 +138,7 @@ class ACIPConverter:
         
         # Step 2: Convert parentheses notation
         # (...) in EWTS = /.../ in ACIP
-        result = re.sub(r'\(([^)]*)\)', r'/\1/', result)
+        result = PARENS_EWTS.sub(r'/\1/', result)
         
         # Step 3: Convert simple punctuation (reverse)
         result = self._convert_punctuation_to_acip(result)
@@ -163,30 +178,20 @@ class ACIPConverter:
     
     def _remove_comments(self, text: str) -> str:
         """Remove ACIP comments: @... and [...]"""
-        text = self._patterns.COMMENT_BRACKET.sub('', text)
-        text = self._patterns.COMMENT_AT.sub('', text)
+        text = COMMENT_BRACKET.sub('', text)
+        text = COMMENT_AT.sub('', text)
         return text
     
     def _convert_simple_punctuation(self, text: str) -> str:
-        """Convert simple ACIP punctuation to EWTS."""
-        text = text.replace(';', '|')
-        text = text.replace('#', '@##')  # Temporary marker
-        # Handle asterisks
-        text = self._patterns.ASTERISK_ENCODING.sub(
+        """Convert simple ACIP punctuation and special characters to EWTS."""
+        return text.translate(self._alphabet.SINGLE_CHAR_TRANSLATION)
+    
+    def _encode_asterisks(self, text: str) -> str:
+        """Encode runs of asterisks."""
+        return ASTERISK_ENCODING.sub(
             lambda m: '@' + '#' * len(m.group(0)),
             text
         )
-        text = text.replace('\\', '?')
-        text = text.replace(',', '/')
-        text = text.replace('`', '!')
-        return text
-    
-    def _convert_special_characters(self, text: str) -> str:
-        """Convert special ACIP characters."""
-        text = text.replace('^', '\\u0F38')
-        text = text.replace('%', '~x')
-        text = text.replace('V', 'W')  # ACIP V = EWTS w
-        return text
     
     def _handle_ts_tz(self, text: str) -> str:
         """Handle TS/TZ distinction before case conversion."""
@@ -201,35 +206,36 @@ class ACIPConverter:
     def _convert_dots(self, text: str) -> str:
         """Convert GA-YAS pattern dots."""
         # GA-YAS in ACIP = g.yas in EWTS
-        text = self._patterns.GA_YAS_PATTERN.sub(r'\1.', text)
+        text = GA_YAS_PATTERN.sub(r'\1.', text)
         text = text.replace('-', '.')
         return text
     
     def _convert_vowels(self, text: str) -> str:
         """Convert ACIP vowels (before case swap)."""
         # Handle special vowel patterns
-        text = re.sub(r'A?i', '-I', text)  # Ai or i → -I
-        text = re.sub(r"A?'-I", '-i', text)  # A'i or 'i → -i
+        text = REVERSE_VOWEL.sub('-I', text)  # Ai or i → -I
+        text = REVERSE_VOWEL_AFTER_APOSTROPHE.sub('-i', text)  # A'i or 'i → -i
         text = text.replace('o', 'x')  # Temporary marker
         return text
     
     def _handle_consonant_vowel_patterns(self, text: str) -> str:
         """Handle consonant + apostrophe + vowel patterns."""
-        # B'I in ACIP = bi in EWTS
-        text = self._patterns.VOWEL_AFTER_CONS.sub(
-            lambda m: m.group(1) + m.group(2).lower(),
-            text
-        )
-        # Special case: A is main letter
-        text = re.sub(
-            r"(^|[^BCDGHJKLMNPR'STWYZhdtn])A'([AEOUI])",
-            lambda m: m.group(1) + m.group(2).lower(),
-            text
-        )
+        # B'I in ACIP = bi in EWTS; special case: A is main letter (A'I = i)
+        text = APOSTROPHE_VOWEL.sub(self._lower_apostrophe_vowel, text)
         # A + vowel → vowel
-        text = re.sub(r'A([AEIOUaeiou])', r'\1', text)
+        text = A_BEFORE_VOWEL.sub(r'\1', text)
         return text
     
+    @staticmethod
+    def _lower_apostrophe_vowel(match) -> str:
+        """Drop the apostrophe (and a main-letter A) and lowercase the vowel."""
+        consonant, vowel, next_vowel, before, a_vowel = match.groups()
+        if consonant is None:
+            return before + a_vowel.lower()
+        if next_vowel is None:
+            return consonant + vowel.lower()
+        return consonant + vowel.lower() + next_vowel.lower()
+    
     def _handle_sh_pattern(self, text: str) -> str:
         """Handle special 'sh' patterns."""
         # In ACIP: sh (lowercase) = Sanskrit Sh
@@ -240,7 +246,7 @@ class ACIPConverter:
     
     def _normalize_apostrophes(self, text: str) -> str:
         """Normalize different apostrophe characters."""
-        text = re.sub(r"['ʼʹ'ʾ]", "'", text)
+        text = APOSTROPHE_VARIANTS.sub("'", text)
         return text
     
     def _convert_final_vowels(self, text: str) -> str:
@@ -274,7 +280,7 @@ class ACIPConverter:
             # Check if first two tokens form a valid stack with prefix
             if len(tokens) >= 2:
                 first_two = tokens[0] + tokens[1]
-                if first_two.lower() in [s.lower() for s in ACIPStandardStacks.STD_TIB_STACKS_PREFIX]:
+                if first_two.lower() in ACIPStandardStacks.STD_TIB_STACKS_PREFIX_SET:
                     # First token is prefix, rest need +
                     return tokens[0] + '+'.join(tokens[1:]) + vowel
             
@@ -282,62 +288,31 @@ class ACIPConverter:
             return '+'.join(tokens) + vowel
         
         # Apply to consonant sequences before vowels
-        # Modified pattern to include + in consonant groups
-        pattern = re.compile(r"([bcdgjklm'nprstwyzhSDTN+]+)([aeiouAEIOU.-])")
-        text = pattern.sub(process_consonants, text)
+        # (the pattern includes + in consonant groups)
+        text = CONSONANTS_BEFORE_VOWEL.sub(process_consonants, text)
         return text
     
     def _tokenize_consonants(self, consonants: str) -> List[str]:
         """Tokenize consonant string into individual letters/digraphs."""
-        # Multi-character tokens (must check longest first)
-        multi_tokens = ['zh', 'ny', 'dz', 'ts', 'tsh', 'ch', 'ph', 'th', 
-                       'sh', 'Sh', 'kh', 'ng']
-        single_chars = 'NDTRYWbcdghjklmnprstwyz\''
-        
-        result = []
-        i = 0
-        while i < len(consonants):
-            matched = False
-            # Try multi-character tokens
-            for token in multi_tokens:
-                if consonants[i:].startswith(token):
-                    result.append(token)
-                    i += len(token)
-                    matched = True
-                    break
-            
-            if not matched:
-                # Single character
-                if i < len(consonants) and consonants[i] in single_chars:
-                    result.append(consonants[i])
-                i += 1
-        
-        return result
+        return CONSONANT_TOKEN.findall(consonants)
     
     def _normalize_spaces(self, text: str) -> str:
         """Normalize spaces in EWTS (space vs underscore for tsheg)."""
         # In context where space should be tsheg, use space
         # Where actual space needed, it should be underscore
-        text = self._patterns.SPACE_BEFORE_PUNCT.sub(
-            lambda m: m.group(1) + '_' + m.group(2),
-            text
-        )
-        text = self._patterns.SPACE_AFTER_PUNCT.sub(
-            lambda m: m.group(1) + '_',
-            text
-        )
-        return text
+        # Only one of the two groups takes part in a match; the other is empty
+        return SPACE_NORMALIZE.sub(r'\1\2_', text)
     
     def _convert_punctuation_to_acip(self, text: str) -> str:
         """Convert EWTS punctuation to ACIP."""
         text = text.replace('|', ';')
         # Remove * not after [
-        text = re.sub(r'(^|\[)\*', lambda m: m.group(1), text)
+        text = LEADING_ASTERISK.sub(r'\1', text)
         text = text.replace('@##', 'ZZ')  # Temporary
         text = text.replace('@#', '*')
         text = text.replace('_', ' ')
         # Remove # not after [
-        text = re.sub(r'(^|\[)#', lambda m: m.group(1), text)
+        text = LEADING_HASH.sub(r'\1', text)
         text = text.replace('ZZ', '#')
         text = text.replace('?', '\\')
         text = text.replace('/', ',')
@@ -346,7 +321,7 @@ class ACIPConverter:
     
     def _convert_special_to_acip(self, text: str) -> str:
         """Convert special EWTS characters to ACIP."""
-        text = re.sub(r'\\U0F38', '^', text, flags=re.I)
+        text = ESCAPED_0F38.sub('^', text)
         text = text.replace('~X', '%')
         text = text.replace('H', ':')
         return text
@@ -370,11 +345,7 @@ class ACIPConverter:
     def _add_a_for_independent_vowels(self, text: str) -> str:
         """Add 'A' prefix for independent vowels in ACIP."""
         # In ACIP, independent vowels need 'A' prefix
-        text = re.sub(
-            r"(^|[^BCDGHJKLMNPR'STVYZhdtnEO])([AEOUIqaewiou])",
-            lambda m: m.group(1) + 'A' + m.group(2),
-            text
-        )
+        text = INDEPENDENT_VOWEL.sub(r'\1A\2', text)
         return text
     
     def _handle_apostrophe_vowels_acip(self, text: str) -> str:
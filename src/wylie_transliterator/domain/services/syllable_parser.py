@@ -3,11 +3,24 @@ Syllable Parser Domain Service
 Parses Wylie text into syllable components using multi-strategy approach.
 """
 
-from typing import Optional
+from typing import Dict, Optional
 from ..models.syllable import SyllableComponents
 from ..value_objects.character_mappings import TibetanAlphabet, SyllableRules
 
 
+def _by_length(keys) -> tuple:
+    """Return keys ordered longest first, for greedy prefix matching"""
+    return tuple(sorted(keys, key=len, reverse=True))
+
+
+def _by_first_char(keys: tuple) -> Dict[str, tuple]:
+    """Bucket keys by first character, keeping their order within a bucket"""
+    buckets = {}
+    for key in keys:
+        buckets.setdefault(key[0], []).append(key)
+    return {first: tuple(bucket) for first, bucket in buckets.items()}
+
+
 class SyllableParsingStrategy:
     """Strategy interface for different parsing approaches"""
     
@@ -26,6 +39,21 @@ class MultiStrategySyllableParser(SyllableParsingStrategy):
     Implements greedy longest-match parsing with lookahead for ambiguous cases.
     """
     
+    def __init__(self):
+        super().__init__()
+        # Longest-first key orders, computed once rather than on every match
+        self._prescripts_by_len = _by_length(self.rules.PRESCRIPTS)
+        self._superscripts_by_len = _by_length(self.rules.SUPERSCRIPTS)
+        self._postscripts_by_len = _by_length(self.rules.POSTSCRIPTS)
+        self._consonants_by_len = _by_length(self.alphabet.CONSONANTS)
+        self._consonants_lower_by_len = tuple(c.lower() for c in self._consonants_by_len)
+        # A consonant matching at pos can only come from the bucket of text[pos]
+        self._consonants_by_first = _by_first_char(self._consonants_by_len)
+        self._consonants_lower_by_first = _by_first_char(self._consonants_lower_by_len)
+        self._subjoined_by_len = _by_length(self.alphabet.SUBJOINED)
+        self._subscripts_by_len = _by_length(self.alphabet.SUBSCRIPTS)
+        self._vowels_by_len = _by_length(self.alphabet.VOWELS)
+    
     def parse_syllable(self, text: str) -> Optional[SyllableComponents]:
         """
         Parse Wylie text into syllable components.
@@ -36,20 +64,24 @@ class MultiStrategySyllableParser(SyllableParsingStrategy):
         
         best_components = None
         best_length = 0
+        # Lowercased once here; every strategy and matcher shares it
+        text_lower = text.lower()
         
         # Try different parsing strategies in order
         strategies = ['simple', 'with_super', 'with_pre', 'full']
         
         for strategy in strategies:
-            components, length = self._try_strategy(text, strategy)
+            components, length = self._try_strategy(text, text_lower, strategy)
             if components and length > best_length:
                 best_length = length
                 best_components = components
         
         return best_components
     
-    def _try_strategy(self, text: str, strategy: str) -> tuple[Optional[SyllableComponents], int]:
-        """Try a specific parsing strategy"""
+    def _try_strategy(
+        self, text: str, text_lower: str, strategy: str
+    ) -> tuple[Optional[SyllableComponents], int]:
+        """Try a specific parsing strategy (text_lower is text.lower())"""
         pos = 0
         prescript = None
         superscript = None
@@ -65,29 +97,29 @@ class MultiStrategySyllableParser(SyllableParsingStrategy):
         
         # Strategy 2: With prescript
         elif strategy == 'with_pre':
-            prescript, pre_len = self._match_prescript(text[pos:])
+            prescript, pre_len = self._match_prescript(text_lower, pos)
             if prescript:
                 pos += pre_len
         
         # Strategy 3: With superscript
         elif strategy in ['with_super', 'full']:
             if strategy == 'full':
-                prescript, pre_len = self._match_prescript(text[pos:])
+                prescript, pre_len = self._match_prescript(text_lower, pos)
                 if prescript:
                     pos += pre_len
             
-            superscript, sup_len = self._match_superscript(text[pos:])
+            superscript, sup_len = self._match_superscript(text_lower, pos)
             if superscript:
                 pos += sup_len
         
         # Match root (required)
-        root, root_len = self._match_root(text[pos:])
+        root, root_len = self._match_root(text, text_lower, pos)
         vowel = None  # Will be set below
         is_vowel_initial = False  # Track if this is a vowel-initial syllable
         
         if not root:
             # Check if syllable starts with a vowel (vowel-initial syllable)
-            vowel, vowel_len = self._match_vowel(text[pos:])
+            vowel, vowel_len = self._match_vowel(text, pos)
             if vowel and vowel != 'a':
                 # Vowel-initial syllable: use 'a' as implicit root
                 root = 'a'
@@ -106,26 +138,34 @@ class MultiStrategySyllableParser(SyllableParsingStrategy):
         
         # Match subscript (can be double) - only for non-vowel-initial syllables
         subscript = None
+        subscript_wylie_len = 0
         if not is_vowel_initial:
-            subscript, sub_len = self._match_subscript(text[pos:])
+            subscript, sub_len = self._match_subscript(text, text_lower, pos)
             if subscript:
+                # Explicit stacks ('n+D', 'k+r+w') are written as '+' plus the
+                # subscript string; implicit ones ('bla', 'drwa') without '+'.
+                # A dangling '+' consumed after an explicit stack is not counted.
+                if text.startswith('+', pos):
+                    subscript_wylie_len = 1 + len(subscript)
+                else:
+                    subscript_wylie_len = len(subscript.replace('+', ''))
                 pos += sub_len
         
         # Match vowel (only if not already matched above for vowel-initial syllables)
         if vowel is None:
-            vowel, vowel_len = self._match_vowel(text[pos:])
+            vowel, vowel_len = self._match_vowel(text, pos)
             if vowel:
                 pos += vowel_len
             else:
                 vowel = 'a'  # Default inherent vowel
         
         # Match postscript 1
-        postscript1, post1_len = self._match_postscript(text[pos:])
+        postscript1, post1_len = self._match_postscript(text, text_lower, pos)
         if postscript1:
             pos += post1_len
             
             # Match postscript 2 if postscript1 exists
-            postscript2, post2_len = self._match_postscript(text[pos:])
+            postscript2, post2_len = self._match_postscript(text, text_lower, pos)
             if postscript2:
                 pos += post2_len
         
@@ -137,90 +177,93 @@ class MultiStrategySyllableParser(SyllableParsingStrategy):
                 subscript=subscript,
                 vowel=vowel,
                 postscript1=postscript1,
-                postscript2=postscript2
+                postscript2=postscript2,
+                subscript_wylie_len=subscript_wylie_len
             )
             return components, pos
         except ValueError:
             return None, 0
     
-    def _match_prescript(self, text: str) -> tuple[Optional[str], int]:
-        """Match prescript, checking for multi-char consonant lookahead"""
-        for pre in sorted(self.rules.PRESCRIPTS, key=len, reverse=True):
-            if text.lower().startswith(pre):
+    def _match_prescript(self, text_lower: str, pos: int = 0) -> tuple[Optional[str], int]:
+        """Match prescript at pos in lowercased text, checking for multi-char consonant lookahead"""
+        for pre in self._prescripts_by_len:
+            if text_lower.startswith(pre, pos):
                 # Check if remainder could be multi-char consonant
-                remainder = text[len(pre):]
-                if self._could_be_multichar_consonant(remainder):
+                remainder_pos = pos + len(pre)
+                if self._could_be_multichar_consonant(text_lower, remainder_pos):
                     continue
                 
                 # Look ahead for valid root
-                if self._has_valid_root_ahead(remainder):
+                if self._has_valid_root_ahead(text_lower, remainder_pos):
                     return pre, len(pre)
         return None, 0
     
-    def _match_superscript(self, text: str) -> tuple[Optional[str], int]:
-        """Match superscript, checking for multi-char consonant lookahead"""
-        for sup in sorted(self.rules.SUPERSCRIPTS, key=len, reverse=True):
-            if text.lower().startswith(sup):
-                remainder = text[len(sup):]
-                if self._could_be_multichar_consonant(remainder):
+    def _match_superscript(self, text_lower: str, pos: int = 0) -> tuple[Optional[str], int]:
+        """Match superscript at pos in lowercased text, checking for multi-char consonant lookahead"""
+        for sup in self._superscripts_by_len:
+            if text_lower.startswith(sup, pos):
+                remainder_pos = pos + len(sup)
+                if self._could_be_multichar_consonant(text_lower, remainder_pos):
                     continue
-                if self._has_valid_root_ahead(remainder):
+                if self._has_valid_root_ahead(text_lower, remainder_pos):
                     return sup, len(sup)
         return None, 0
     
-    def _match_root(self, text: str) -> tuple[Optional[str], int]:
-        """Match root consonant (longest first, preserving case for Sanskrit)"""
+    def _match_root(self, text: str, text_lower: str, pos: int = 0) -> tuple[Optional[str], int]:
+        """Match root consonant at pos (longest first, preserving case for Sanskrit)"""
         # First try case-sensitive match for Sanskrit retroflexes
-        for root in sorted(self.alphabet.CONSONANTS.keys(), key=len, reverse=True):
-            if text.startswith(root):
+        for root in self._consonants_by_first.get(text[pos:pos + 1], ()):
+            if text.startswith(root, pos):
                 return root, len(root)
         
         # Then try case-insensitive match for regular consonants
-        for root in sorted(self.alphabet.CONSONANTS.keys(), key=len, reverse=True):
-            if text.lower().startswith(root.lower()):
-                return root.lower(), len(root)
+        for root in self._consonants_lower_by_first.get(text_lower[pos:pos + 1], ()):
+            if text_lower.startswith(root, pos):
+                return root, len(root)
         return None, 0
     
-    def _match_subscript(self, text: str) -> tuple[Optional[str], int]:
+    def _match_subscript(
+        self, text: str, text_lower: str, start: int = 0
+    ) -> tuple[Optional[str], int]:
         """
-        Match subscript (can be double like 'r+w')
+        Match subscript at start (can be double like 'r+w')
         Also handles explicit + notation for Sanskrit stacks (e.g., 'n+D')
         """
         subscripts_matched = []
-        pos = 0
+        pos = start
         
         # Check for explicit + notation (Sanskrit stacks)
-        if text.startswith('+'):
+        if text.startswith('+', pos):
             pos += 1  # Skip the +
             # Match any consonant from SUBJOINED as subscript
-            for cons in sorted(self.alphabet.SUBJOINED.keys(), key=len, reverse=True):
-                if text[pos:].startswith(cons):  # Case-sensitive for Sanskrit
+            for cons in self._subjoined_by_len:
+                if text.startswith(cons, pos):  # Case-sensitive for Sanskrit
                     subscripts_matched.append(cons)
                     pos += len(cons)
                     
                     # Check for another + (double subscript)
                     if pos < len(text) and text[pos] == '+':
                         pos += 1
-                        for cons2 in sorted(self.alphabet.SUBJOINED.keys(), key=len, reverse=True):
-                            if text[pos:].startswith(cons2):
+                        for cons2 in self._subjoined_by_len:
+                            if text.startswith(cons2, pos):
                                 subscripts_matched.append(cons2)
                                 pos += len(cons2)
                                 break
                     break
             
             if subscripts_matched:
-                return '+'.join(subscripts_matched), pos
+                return '+'.join(subscripts_matched), pos - start
             return None, 0
         
         # Standard implicit subscripts (r, l, y, w)
-        for sub in sorted(self.alphabet.SUBSCRIPTS.keys(), key=len, reverse=True):
-            if text[pos:].lower().startswith(sub):
+        for sub in self._subscripts_by_len:
+            if text_lower.startswith(sub, pos):
                 subscripts_matched.append(sub)
                 pos += len(sub)
                 
                 # Try to match second subscript
-                for sub2 in sorted(self.alphabet.SUBSCRIPTS.keys(), key=len, reverse=True):
-                    if text[pos:].lower().startswith(sub2):
+                for sub2 in self._subscripts_by_len:
+                    if text_lower.startswith(sub2, pos):
                         subscripts_matched.append(sub2)
                         pos += len(sub2)
                         break
@@ -228,14 +271,14 @@ class MultiStrategySyllableParser(SyllableParsingStrategy):
         
         if subscripts_matched:
             if len(subscripts_matched) > 1:
-                return '+'.join(subscripts_matched), pos
-            return subscripts_matched[0], pos
+                return '+'.join(subscripts_matched), pos - start
+            return subscripts_matched[0], pos - start
         return None, 0
     
-    def _match_vowel(self, text: str) -> tuple[Optional[str], int]:
-        """Match vowel sign"""
-        for vowel in sorted(self.alphabet.VOWELS.keys(), key=len, reverse=True):
-            if text.startswith(vowel):
+    def _match_vowel(self, text: str, pos: int = 0) -> tuple[Optional[str], int]:
+        """Match vowel sign at pos"""
+        for vowel in self._vowels_by_len:
+            if text.startswith(vowel, pos):
                 return vowel, len(vowel)
         return None, 0
     
@@ -252,21 +295,23 @@ class MultiStrategySyllableParser(SyllableParsingStrategy):
             # If rules don't have validation, allow all (backward compatibility)
             return True
         
-        valid_roots = self.rules.VALID_SUPERSCRIPT_COMBINATIONS.get(superscript, [])
+        valid_roots = self.rules.VALID_SUPERSCRIPT_COMBINATIONS.get(superscript, ())
         return root in valid_roots
     
-    def _match_postscript(self, text: str) -> tuple[Optional[str], int]:
-        """Match postscript consonant (capitals signal new syllable, not postscripts)"""
+    def _match_postscript(
+        self, text: str, text_lower: str, pos: int = 0
+    ) -> tuple[Optional[str], int]:
+        """Match postscript consonant at pos (capitals signal new syllable, not postscripts)"""
         # Don't match if starting with capital (Sanskrit consonant starts new syllable)
-        if text and text[0].isupper():
+        if pos < len(text) and text[pos].isupper():
             return None, 0
         
-        for post in sorted(self.rules.POSTSCRIPTS, key=len, reverse=True):
-            if text.lower().startswith(post):
+        for post in self._postscripts_by_len:
+            if text_lower.startswith(post, pos):
                 # Special case: apostrophe followed by vowel starts new syllable
                 # e.g., "ba'i" should be "ba" + "'i", not "ba'" + "i"
-                if post == "'" and len(text) > 1:
-                    next_char = text[1]
+                if post == "'" and pos + 1 < len(text):
+                    next_char = text[pos + 1]
                     # Check if next char is a vowel (i, u, e, o, etc.)
                     if next_char in ['i', 'u', 'e', 'o', 'a', 'A', 'I', 'U', 'E', 'O']:
                         return None, 0  # Don't treat as postscript
@@ -274,17 +319,17 @@ class MultiStrategySyllableParser(SyllableParsingStrategy):
                 return post, len(post)
         return None, 0
     
-    def _could_be_multichar_consonant(self, text: str) -> bool:
-        """Check if text starts with a multi-char consonant (3+ chars)"""
-        for cons in self.alphabet.CONSONANTS.keys():
-            if len(cons) > 2 and text.lower().startswith(cons):
+    def _could_be_multichar_consonant(self, text_lower: str, pos: int = 0) -> bool:
+        """Check if lowercased text has a multi-char consonant (3+ chars) at pos"""
+        for cons in self._consonants_by_first.get(text_lower[pos:pos + 1], ()):
+            if len(cons) > 2 and text_lower.startswith(cons, pos):
                 return True
         return False
     
-    def _has_valid_root_ahead(self, text: str) -> bool:
-        """Check if there's a valid root consonant ahead"""
-        for root in self.alphabet.CONSONANTS.keys():
-            if root != 'a' and text.lower().startswith(root):
+    def _has_valid_root_ahead(self, text_lower: str, pos: int = 0) -> bool:
+        """Check if there's a valid root consonant at pos in lowercased text"""
+        for root in self._consonants_by_first.get(text_lower[pos:pos + 1], ()):
+            if root != 'a' and text_lower.startswith(root, pos):
                 return True
         return False
 
@@ -3,8 +3,21 @@ Tibetan to Wylie Transliterator Domain Service
 Converts Tibetan Unicode to Extended Wylie transliteration.
 """
 
+import re
 from typing import List, Tuple, Optional
 from ..value_objects.reverse_mappings import ReverseCharacterMappings
+from ..value_objects.character_mappings import SyllableRules
+
+
+# Consonants, vowel signs, marks and subjoined letters: anything that can
+# take part in a syllable
+_SYLLABLE_CHAR_RE = re.compile('[\u0F40-\u0FBC]')
+
+# Intersyllabic tsheg, the syllable separator
+_TSHEG = '\u0F0B'
+
+# Anusvara, visarga and the other standalone Sanskrit marks
+_SANSKRIT_MARK_CHARS = frozenset('\u0F7E\u0F7F\u0F83')
 
 
 class TibetanToWylieTransliterator:
@@ -28,17 +41,25 @@ class TibetanToWylieTransliterator:
     """
     
     # Valid prescripts
-    PRESCRIPTS = {'g', 'd', 'b', 'm', "'"}
+    PRESCRIPTS = SyllableRules.PRESCRIPTS
     
     # Valid superscripts  
-    SUPERSCRIPTS = {'r', 'l', 's'}
+    SUPERSCRIPTS = SyllableRules.SUPERSCRIPTS
     
     # Valid subscripts
-    SUBSCRIPTS = {'r', 'l', 'y', 'w', 'm'}
+    SUBSCRIPTS = frozenset({'r', 'l', 'y', 'w', 'm'})
     
     def __init__(self):
         """Initialize with reverse character mappings"""
         self.mappings = ReverseCharacterMappings()
+        # Character classes as plain sets: classifying a character is one
+        # C-level membership test instead of a predicate method call
+        self._consonant_chars = frozenset(self.mappings.consonants)
+        self._vowel_chars = frozenset(self.mappings.vowels)
+        self._punctuation_chars = frozenset(self.mappings.punctuation)
+        self._consonant_roots = dict(self.mappings.consonant_roots)
+        # Plain dict for the per-character lookups in the hot loops
+        self._all_chars = dict(self.mappings.all_characters)
     
     def transliterate(self, tibetan_text: str) -> str:
         """
@@ -58,6 +79,12 @@ class TibetanToWylieTransliterator:
         if not tibetan_text:
             return ''
         
+        # Without syllable characters (numerals, punctuation, tsheg) every
+        # character maps on its own: translate the whole text in C
+        if not _SYLLABLE_CHAR_RE.search(tibetan_text):
+            return self.mappings.translate_text(tibetan_text.replace('\u0F0E', '//'))
+        
+        all_chars = self._all_chars
         result = []
         i = 0
         
@@ -65,44 +92,39 @@ class TibetanToWylieTransliterator:
             char = tibetan_text[i]
             
             # Check for tsheg (syllable separator) first
-            if self.mappings.is_tsheg(char):
+            if char == _TSHEG:
                 result.append(' ')
                 i += 1
                 continue
             
             # Check for Tibetan numerals (U+0F20 - U+0F29)
             if '\u0F20' <= char <= '\u0F29':
-                wylie = self.mappings.get_wylie(char)
-                result.append(wylie if wylie else char)
+                result.append(all_chars.get(char) or char)
                 i += 1
                 continue
             
             # Check for punctuation
-            if self.mappings.is_punctuation(char):
+            if char in self._punctuation_chars:
                 # Handle multi-char punctuation
                 if char == '\u0F0E':  # Double shad
                     result.append('//')
                 else:
-                    wylie = self.mappings.get_wylie(char)
-                    result.append(wylie if wylie else char)
+                    result.append(all_chars.get(char) or char)
                 i += 1
                 continue
             
             # Check for standalone Sanskrit marks (not part of syllable structure)
-            if char in ['\u0F7E', '\u0F7F', '\u0F83']:
-                wylie = self.mappings.get_wylie(char)
-                result.append(wylie if wylie else char)
+            if char in _SANSKRIT_MARK_CHARS:
+                result.append(all_chars.get(char) or char)
                 i += 1
                 continue
             
             # Check for special compound: kss (ཀྵ)
-            if i + 1 < len(tibetan_text):
-                compound = tibetan_text[i:i+2]
-                wylie = self.mappings.get_wylie(compound)
-                if wylie:
-                    result.append(wylie)
-                    i += 2
-                    continue
+            wylie, compound_len = self.mappings.match_compound(tibetan_text, i)
+            if wylie:
+                result.append(wylie)
+                i += compound_len
+                continue
             
             # Try to match syllable
             syllable_wylie, length = self._match_syllable(tibetan_text[i:])
@@ -135,6 +157,9 @@ class TibetanToWylieTransliterator:
         if not text:
             return ('', 0)
         
+        consonants = self._consonant_chars
+        roots = self._consonant_roots
+        all_chars = self._all_chars
         pos = 0
         parts = []
         has_explicit_vowel = False
@@ -142,19 +167,13 @@ class TibetanToWylieTransliterator:
         # Step 1: Try to match prescript (base consonant in PRESCRIPTS set)
         # Prescript only if followed by another BASE consonant (not subjoined)
         prescript = None
-        if pos < len(text) and self.mappings.is_consonant(text[pos]):
-            wylie = self.mappings.get_wylie(text[pos])
-            if wylie:
-                # Remove trailing 'a'
-                if wylie.endswith('a') and len(wylie) > 1:
-                    wylie_base = wylie[:-1]
-                else:
-                    wylie_base = wylie
-                
+        if pos < len(text) and text[pos] in consonants:
+            wylie_base = roots.get(text[pos])
+            if wylie_base:
                 # Check if it's a prescript
                 if wylie_base in self.PRESCRIPTS:
                     # Prescript only if followed by BASE consonant (not subjoined)
-                    if pos + 1 < len(text) and self.mappings.is_consonant(text[pos+1]):
+                    if pos + 1 < len(text) and text[pos+1] in consonants:
                         # Make sure next is NOT in subjoined range
                         if not ('\u0F90' <= text[pos+1] <= '\u0FBC'):
                             prescript = wylie_base
@@ -162,15 +181,9 @@ class TibetanToWylieTransliterator:
         
         # Step 2: Try to match superscript (base consonant in SUPERSCRIPTS set)
         superscript = None
-        if pos < len(text) and self.mappings.is_consonant(text[pos]):
-            wylie = self.mappings.get_wylie(text[pos])
-            if wylie:
-                # Remove trailing 'a'
-                if wylie.endswith('a') and len(wylie) > 1:
-                    wylie_base = wylie[:-1]
-                else:
-                    wylie_base = wylie
-                
+        if pos < len(text) and text[pos] in consonants:
+            wylie_base = roots.get(text[pos])
+            if wylie_base:
                 # Check if it's a superscript
                 if wylie_base in self.SUPERSCRIPTS:
                     # Look ahead to see if there's a subjoined (root) after
@@ -185,19 +198,14 @@ class TibetanToWylieTransliterator:
             
             # If we have a superscript, root must be subjoined
             if superscript and '\u0F90' <= char <= '\u0FBC':
-                wylie = self.mappings.get_wylie(char)
+                wylie = all_chars.get(char)
                 if wylie:
                     root = wylie
                     pos += 1
             # Otherwise, root is a base consonant
-            elif self.mappings.is_consonant(char):
-                wylie = self.mappings.get_wylie(char)
-                if wylie:
-                    # Remove trailing 'a'
-                    if wylie.endswith('a') and len(wylie) > 1:
-                        root = wylie[:-1]
-                    else:
-                        root = wylie
+            elif char in consonants:
+                root = roots.get(char)
+                if root:
                     pos += 1
         
         if not root:
@@ -209,7 +217,7 @@ class TibetanToWylieTransliterator:
             char = text[pos]
             # Check if it's in subjoined range
             if '\u0F90' <= char <= '\u0FBC':
-                wylie = self.mappings.get_wylie(char)
+                wylie = all_chars.get(char)
                 if wylie:
                     subscripts.append(wylie)
                     pos += 1
@@ -222,17 +230,15 @@ class TibetanToWylieTransliterator:
         vowel = None
         if pos < len(text):
             # Check for compound vowels first (2 chars)
-            if pos + 1 < len(text):
-                compound = text[pos:pos+2]
-                wylie = self.mappings.get_wylie(compound)
-                if wylie:
-                    vowel = wylie
-                    pos += 2
-                    has_explicit_vowel = True
+            wylie, compound_len = self.mappings.match_compound(text, pos)
+            if wylie:
+                vowel = wylie
+                pos += compound_len
+                has_explicit_vowel = True
             
             # Try single vowel
-            if not vowel and self.mappings.is_vowel(text[pos]):
-                wylie = self.mappings.get_wylie(text[pos])
+            if not vowel and text[pos] in self._vowel_chars:
+                wylie = all_chars.get(text[pos])
                 if wylie and wylie != 'a':
                     vowel = wylie
                     has_explicit_vowel = True
@@ -240,12 +246,9 @@ class TibetanToWylieTransliterator:
         
         # Step 6: Match postscripts (final consonants)
         postscripts = []
-        while pos < len(text) and self.mappings.is_consonant(text[pos]):
-            wylie = self.mappings.get_wylie(text[pos])
+        while pos < len(text) and text[pos] in consonants:
+            wylie = roots.get(text[pos])
             if wylie:
-                # Remove trailing 'a'
-                if wylie.endswith('a') and len(wylie) > 1:
-                    wylie = wylie[:-1]
                 postscripts.append(wylie)
                 pos += 1
             else:
@@ -253,8 +256,8 @@ class TibetanToWylieTransliterator:
         
         # Step 7: Match Sanskrit marks
         marks = []
-        while pos < len(text) and text[pos] in ['\u0F7E', '\u0F7F', '\u0F83']:
-            wylie = self.mappings.get_wylie(text[pos])
+        while pos < len(text) and text[pos] in _SANSKRIT_MARK_CHARS:
+            wylie = all_chars.get(text[pos])
             if wylie:
                 marks.append(wylie)
                 pos += 1
@@ -3,6 +3,8 @@ Wylie to Tibetan Transliterator Domain Service
 Coordinates the transliteration process using parser and builder services.
 """
 
+import re
+from re import Match, Pattern
 from typing import Tuple
 from .syllable_parser import MultiStrategySyllableParser
 from .syllable_builder import SyllableBuilder
@@ -10,6 +12,18 @@ from .case_normalizer import CaseNormalizer
 from ..value_objects.character_mappings import TibetanAlphabet
 
 
+# Upper bound on how far a single match can reach: prescript + superscript +
+# root + explicit '+' stack + vowel + two postscripts, plus one character of
+# lookahead, fits comfortably in 32 characters.
+MAX_SYLLABLE_WINDOW = 32
+
+# Characters after which a vowel stands on its own
+_VOWEL_BOUNDARIES = frozenset(' /|\n\t')
+
+# Characters that can start a syllable or standalone vowel (regex class body)
+LETTER_CHARS = r"A-Za-z'+\-"
+
+
 class WylieToTibetanTransliterator:
     """
     Domain Service for transliterating Wylie to Tibetan Unicode.
@@ -26,6 +40,26 @@ class WylieToTibetanTransliterator:
         self.builder = SyllableBuilder()
         self.normalizer = CaseNormalizer()
         self.alphabet = TibetanAlphabet()
+        # Punctuation and Sanskrit marks share one table: both are replaced
+        # verbatim and end the current syllable (space is handled separately)
+        self._symbol_map = {
+            **{k: v for k, v in self.alphabet.PUNCTUATION.items() if k != ' '},
+            **self.alphabet.SANSKRIT_MARKS,
+        }
+        self._symbol_starters = frozenset(k[0] for k in self._symbol_map)
+        # Vowels that may stand alone, longest first, with their rendering
+        # on the 'a' consonant base
+        base = self.alphabet.CONSONANTS['a']
+        self._standalone_vowels = tuple(
+            (vowel, base + self.alphabet.VOWELS[vowel])
+            for vowel in sorted(
+                (k for k in self.alphabet.VOWELS if k != 'a' and k != 'A'),
+                key=len, reverse=True
+            )
+        )
+        self._token_pattern = self._build_token_pattern()
+        self._letter_pattern = re.compile(f'[{LETTER_CHARS}]')
+        self._plain_multi_symbols, self._plain_tables = self._build_plain_tables()
     
     def transliterate(self, wylie_text: str, spaces_as_tsheg: bool = True) -> str:
         """
@@ -41,87 +75,134 @@ class WylieToTibetanTransliterator:
         # Normalize case
         normalized = self.normalizer.normalize(wylie_text)
         
-        # Process character by character
-        result = []
-        i = 0
+        # Without letters there is nothing to parse (numeric tables,
+        # punctuation blocks): substitute symbols and translate in C
+        if not self._letter_pattern.search(normalized):
+            for symbol, unicode_char in self._plain_multi_symbols:
+                normalized = normalized.replace(symbol, unicode_char)
+            return normalized.translate(self._plain_tables[spaces_as_tsheg])
+        
+        numerals = self.alphabet.NUMERALS
+        symbols = self._symbol_map
+        space = '\u0F0B' if spaces_as_tsheg else ' '  # tsheg or plain space
+        
+        def replace(match: Match) -> str:
+            kind = match.lastgroup
+            if kind == 'letters':
+                return self._transliterate_run(normalized, match.start(), match.end())
+            if kind == 'digit':
+                return numerals.get(match.group(), match.group())
+            if kind == 'space':
+                return space
+            return symbols[match.group()]
+        
+        # The regex engine scans the document; Python only runs once per token.
+        # Anything the pattern does not cover is passed through unchanged.
+        return self._token_pattern.sub(replace, normalized)
+    
+    def _build_token_pattern(self) -> Pattern:
+        """
+        Compile the master tokenizer regex.
+        
+        Letter runs contain every character a syllable or standalone vowel can
+        start with. Symbols that start with a letter ('M', 'H') are left to
+        the run loop; the rest are listed longest first so that '//' wins
+        over '/'.
+        """
+        symbols = sorted(
+            (k for k in self._symbol_map if not k[0].isalpha()),
+            key=len, reverse=True
+        )
+        return re.compile(
+            rf'(?P<letters>[{LETTER_CHARS}]+)'
+            r'|(?P<digit>\d)'
+            r'|(?P<space> )'
+            rf"|(?P<symbol>{'|'.join(re.escape(k) for k in symbols)})"
+        )
+    
+    def _build_plain_tables(self) -> Tuple[list, dict]:
+        """
+        Build the substitutions used for text without letters.
+        
+        Returns:
+            Tuple of (multi-character symbols longest first, for str.replace;
+            str.translate tables keyed by the spaces_as_tsheg flag)
+        """
+        plain = {k: v for k, v in self._symbol_map.items() if not k[0].isalpha()}
+        multi = sorted(
+            ((k, v) for k, v in plain.items() if len(k) > 1),
+            key=lambda item: len(item[0]), reverse=True
+        )
+        single = {k: v for k, v in plain.items() if len(k) == 1}
+        single.update(self.alphabet.NUMERALS)
+        tables = {
+            True: str.maketrans({**single, ' ': '\u0F0B'}),
+            False: str.maketrans(single),
+        }
+        return multi, tables
+    
+    def _transliterate_run(self, text: str, start: int, end: int) -> str:
+        """
+        Transliterate one run of letters text[start:end].
+        
+        Runs are always preceded by a non-letter token (or the start of the
+        text), so each run starts outside a syllable. Matchers still see a
+        window of the full text so lookahead past the run end is unchanged.
+        """
+        starters = self._symbol_starters
+        parts = []
+        append = parts.append
+        i = start
         last_was_syllable = False  # Track if we just parsed a syllable
         
-        while i < len(normalized):
-            # Check for numerals
-            if normalized[i].isdigit():
-                result.append(self.alphabet.NUMERALS.get(normalized[i], normalized[i]))
-                i += 1
-                last_was_syllable = False
-                continue
-            
-            # Check for space/tsheg
-            if normalized[i] == ' ':
-                if spaces_as_tsheg:
-                    result.append('\u0F0B')  # tsheg
-                else:
-                    result.append(' ')
-                i += 1
-                last_was_syllable = False  # Reset after space
-                continue
+        while i < end:
+            # Matchers only ever look a syllable ahead, so hand them a bounded
+            # window instead of copying the whole remainder at every position
+            window = text[i:i + MAX_SYLLABLE_WINDOW]
             
-            # Check for punctuation (multi-char first)
-            punct_matched, punct_len = self._match_punctuation(normalized[i:])
-            if punct_matched:
-                result.append(punct_matched)
-                i += punct_len
-                last_was_syllable = False
-                continue
-            
-            # Check for Sanskrit marks (pass previous character for context)
-            prev_char = result[-1] if result else ''
-            mark_matched, mark_len = self._match_sanskrit_mark(normalized[i:], prev_char)
-            if mark_matched:
-                result.append(mark_matched)
-                i += mark_len
-                last_was_syllable = False
-                continue
+            # Check for Sanskrit marks, skipping the probe for plain letters
+            if text[i] in starters:
+                symbol, symbol_len = self._match_symbol(window)
+                if symbol:
+                    append(symbol)
+                    i += symbol_len
+                    last_was_syllable = False
+                    continue
             
             # Check for standalone vowel (only at start of syllable, not after consonant)
             if not last_was_syllable:
-                vowel_matched, vowel_len = self._match_standalone_vowel(normalized[i:])
+                vowel_matched, vowel_len = self._match_standalone_vowel(window)
                 if vowel_matched:
-                    result.append(vowel_matched)
+                    append(vowel_matched)
                     i += vowel_len
                     last_was_syllable = True  # Mark that we parsed a syllable
                     continue
             
             # Try to match syllable
-            syllable_unicode, syllable_len = self._match_syllable(normalized[i:])
+            syllable_unicode, syllable_len = self._match_syllable(window)
             if syllable_unicode:
-                result.append(syllable_unicode)
+                append(syllable_unicode)
                 i += syllable_len
                 last_was_syllable = True  # Mark that we parsed a syllable
             else:
                 # Pass through unknown character
-                result.append(normalized[i])
+                append(text[i])
                 i += 1
                 last_was_syllable = False
         
-        return ''.join(result)
+        return ''.join(parts)
     
-    def _match_punctuation(self, text: str) -> Tuple[str, int]:
-        """Match punctuation marks (longest first)"""
-        for punct_len in [2, 1]:
-            if len(text) >= punct_len:
-                punct = text[:punct_len]
-                if punct in self.alphabet.PUNCTUATION:
-                    return self.alphabet.PUNCTUATION[punct], punct_len
-        return '', 0
-    
-    def _match_sanskrit_mark(self, text: str, previous_char: str = '') -> Tuple[str, int]:
-        """Match Sanskrit marks"""
-        # Note: Always use U+0F7E for M (anusvara) regardless of context
+    def _match_symbol(self, text: str) -> Tuple[str, int]:
+        """Match punctuation or Sanskrit marks (longest first)"""
+        # Note: Always use U+0F7E for M (anusvara) regardless of context, so
+        # no state about the previously emitted glyph is needed.
         # This matches pyewts behavior
-        for mark_len in [2, 1]:
-            if len(text) >= mark_len:
-                mark = text[:mark_len]
-                if mark in self.alphabet.SANSKRIT_MARKS:
-                    return self.alphabet.SANSKRIT_MARKS[mark], mark_len
+        symbols = self._symbol_map
+        if len(text) >= 2 and text[:2] in symbols:
+            return symbols[text[:2]], 2
+        symbol = symbols.get(text[:1])
+        if symbol:
+            return symbol, 1
         return '', 0
     
     def _match_standalone_vowel(self, text: str) -> Tuple[str, int]:
@@ -130,14 +211,14 @@ class WylieToTibetanTransliterator:
         Returns vowel with 'a' consonant base.
         """
         # Check if this looks like a standalone vowel (not part of a consonant)
-        for vowel in sorted([k for k in self.alphabet.VOWELS.keys() if k != 'a' and k != 'A'], key=len, reverse=True):
+        for vowel, unicode_result in self._standalone_vowels:
             if text.startswith(vowel):
                 # Check if next character is a consonant or end of text/space
                 next_pos = len(vowel)
-                if next_pos >= len(text) or text[next_pos] in [' ', '/', '|', '\n', '\t'] or text[next_pos].isupper():
-                    # Standalone vowel - add 'a' base + vowel sign
-                    unicode_result = self.alphabet.CONSONANTS['a'] + self.alphabet.VOWELS[vowel]
-                    return unicode_result, len(vowel)
+                if (next_pos >= len(text) or text[next_pos] in _VOWEL_BOUNDARIES
+                        or text[next_pos].isupper()):
+                    # Standalone vowel - 'a' base + vowel sign
+                    return unicode_result, next_pos
         
         return '', 0
     
@@ -169,27 +250,9 @@ class WylieToTibetanTransliterator:
         if not is_vowel_initial:
             matched_len += len(components.root)
             
-        if components.subscript:
-            # Handle subscripts (including explicit + notation for Sanskrit)
-            # Check if there's an explicit + in the original text
-            pos_after_root = (len(components.prescript or '') + 
-                             len(components.superscript or '') + 
-                             len(components.root))
-            if pos_after_root < len(text) and text[pos_after_root] == '+':
-                # Explicit + notation (e.g., n+D)
-                matched_len += 1  # Count the +
-                if '+' in components.subscript:
-                    # Multiple subscripts with + (e.g., +r+w)
-                    parts = components.subscript.split('+')
-                    matched_len += sum(len(s) for s in parts) + (len(parts) - 1)  # letters + internal +
-                else:
-                    matched_len += len(components.subscript)
-            else:
-                # Implicit subscript (e.g., bla)
-                if '+' in components.subscript:
-                    matched_len += sum(len(s) for s in components.subscript.split('+'))
-                else:
-                    matched_len += len(components.subscript)
+        # Subscripts (implicit 'bla' or explicit Sanskrit 'n+D') are counted
+        # as the parser consumed them, '+' signs included
+        matched_len += components.subscript_wylie_len
         # Count vowel in matched length ONLY if explicitly present in input
         # Check if the vowel string is actually at the expected position in text
         if components.vowel:
@@ -3,7 +3,11 @@ Wylie Validator Domain Service
 Validates Extended Wylie input according to EWTS standard.
 """
 
-from typing import List, Optional, Tuple
+import re
+from dataclasses import replace
+from functools import cache, lru_cache
+from itertools import product
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
 from ..value_objects.validation_rules import (
     ValidationResult, ValidationError, SYLLABLE_RULES, ERROR_TYPES
 )
@@ -11,6 +15,66 @@ from ..value_objects.character_mappings import TibetanAlphabet
 from ..models.syllable import SyllableComponents
 
 
+# Separators are single-character tokens; everything between them is one
+# syllable token
+_TOKEN_RE = re.compile(r'[ \t\n/|]|[^ \t\n/|]+')
+
+# Characters that make up punctuation-only tokens (a str.strip argument)
+_PUNCT_CHARS = ' \t\n/|.'
+
+# Distinct syllables remembered by each validator; running text repeats
+# a small vocabulary (particles like gi, kyi, la, ni) very often
+SYLLABLE_CACHE_SIZE = 8192
+
+
+class _ParseStrategy(NamedTuple):
+    """Which optional components one syllable parsing strategy tries"""
+    prescript: bool = False
+    superscript: bool = False
+    subscripts: int = 0               # how many stacked subscripts to match
+    explicit_a: bool = True           # whether the vowel may be an explicit 'a'
+    required: Tuple[str, ...] = ()    # at least one of these must match
+
+
+# Tried in order; see WylieValidator._parse_syllable_structure for ranking
+_STRATEGIES = (
+    _ParseStrategy(),                                                # root + modifiers
+    _ParseStrategy(subscripts=2, required=('subscript',)),           # root + subscript + modifiers
+    _ParseStrategy(superscript=True, explicit_a=False,
+                   required=('superscript',)),                       # superscript + root + modifiers
+    _ParseStrategy(prescript=True, explicit_a=False,
+                   required=('prescript',)),                         # prescript + root + modifiers
+    _ParseStrategy(prescript=True, superscript=True, subscripts=1,
+                   required=('prescript', 'superscript')),           # prescript + superscript + root + subscript + modifiers
+)
+
+# Component violation that is only worth a warning
+_UNUSUAL_SUBSCRIPT = 'unusual_subscript'
+
+# Shared empty result for combination lookups that find no entry
+_NO_ROOTS = frozenset()
+
+# Trie node key marking the end of a component; never a character
+_TERMINAL = None
+
+
+def _build_trie(entries: Dict[str, str]) -> dict:
+    """Build a character trie mapping each spelling to its component"""
+    trie: dict = {}
+    for spelling, component in entries.items():
+        node = trie
+        for char in spelling:
+            node = node.setdefault(char, {})
+        node[_TERMINAL] = component
+    return trie
+
+
+def _case_variants(text: str) -> Iterator[str]:
+    """Yield every upper/lower case spelling of text"""
+    for chars in product(*({c.lower(), c.upper()} for c in text)):
+        yield ''.join(chars)
+
+
 class WylieValidator:
     """
     Domain Service for validating Extended Wylie transliteration input.
@@ -31,6 +95,10 @@ class WylieValidator:
         self.alphabet = TibetanAlphabet()
         self.rules = SYLLABLE_RULES
         self._initialize_valid_characters()
+        self._initialize_tries()
+        self._validate_syllable_cached = lru_cache(maxsize=SYLLABLE_CACHE_SIZE)(
+            self._validate_syllable_at_start
+        )
     
     def _initialize_valid_characters(self):
         """Initialize set of all valid EWTS characters (DRY principle)"""
@@ -56,6 +124,63 @@ class WylieValidator:
         
         # Add capitals for Sanskrit
         self.valid_chars.update('ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+        
+        # Every vowel alone or followed by one Sanskrit mark (e.g., oM)
+        vowels = self.alphabet.VOWELS
+        self._standalone_vowel_forms = frozenset(vowels) | frozenset(
+            vowel + mark for vowel in vowels for mark in self.alphabet.SANSKRIT_MARKS
+        )
+        
+        self.valid_chars = frozenset(self.valid_chars)
+        
+        # Walked once per position to consume the longest known sequence
+        self._valid_trie = _build_trie({c: c for c in self.valid_chars})
+        
+        # Deletes every valid single character in one C-level pass
+        self._strip_valid_singles = str.maketrans(
+            dict.fromkeys(c for c in self.valid_chars if len(c) == 1)
+        )
+    
+    def _initialize_tries(self):
+        """
+        Build prefix tries for component matching.
+        
+        Each trie is a dict-of-dicts keyed by character; the _TERMINAL key
+        holds the component a complete path stands for. Roots match both
+        as written (Sanskrit 'Ta') and case-insensitively, and always yield
+        the lowercase form, so every case variant of a lowercase consonant
+        is inserted. The other components are matched against lowercased
+        input, vowels case-sensitively.
+        """
+        consonants = self.alphabet.CONSONANTS
+        roots = {key: key.lower() for key in consonants}
+        for key in consonants:
+            if key == key.lower():
+                roots.update((variant, key) for variant in _case_variants(key))
+        self._root_trie = _build_trie(roots)
+        
+        vowels = self.alphabet.VOWELS
+        self._vowel_trie = _build_trie({v: v for v in vowels})
+        self._vowel_no_a_trie = _build_trie({v: v for v in vowels if v != 'a'})
+        self._subscript_trie = _build_trie({s: s for s in self.alphabet.SUBSCRIPTS})
+        # Double subscripts keyed by (first, second), named as in
+        # VALID_SUBSCRIPT_COMBINATIONS ('r+w') without formatting per parse
+        subscripts = self.alphabet.SUBSCRIPTS
+        stack_names = {name: name for name in self.rules.VALID_SUBSCRIPT_COMBINATIONS}
+        self._double_subscripts = {
+            (first, second): stack_names.get(f'{first}+{second}', f'{first}+{second}')
+            for first in subscripts for second in subscripts
+        }
+        self._prescript_trie = _build_trie(
+            {p: p for p in self.rules.VALID_PRESCRIPT_COMBINATIONS}
+        )
+        self._superscript_trie = _build_trie(
+            {s: s for s in self.rules.VALID_SUPERSCRIPT_COMBINATIONS}
+        )
+        self._postscript_trie = _build_trie({p: p for p in self.rules.VALID_POSTSCRIPTS})
+        self._second_postscript_trie = _build_trie(
+            {p: p for p in self.rules.VALID_SECOND_POSTSCRIPTS}
+        )
     
     def validate(self, wylie_text: str) -> ValidationResult:
         """
@@ -69,6 +194,9 @@ class WylieValidator:
         # Split into syllables for validation
         syllables = self._tokenize(wylie_text)
         
+        # Results of each distinct syllable in this text, at position 0
+        seen: Dict[str, Tuple[tuple, tuple]] = {}
+        
         position = 0
         for syllable_text in syllables:
             # Skip whitespace and punctuation-only tokens
@@ -78,7 +206,7 @@ class WylieValidator:
             
             # Validate each syllable
             syllable_errors, syllable_warnings = self._validate_syllable(
-                syllable_text, position
+                syllable_text, position, seen
             )
             errors.extend(syllable_errors)
             warnings.extend(syllable_warnings)
@@ -93,33 +221,53 @@ class WylieValidator:
     
     def _tokenize(self, text: str) -> List[str]:
         """Tokenize text into syllables (KISS principle)"""
-        tokens = []
-        current = []
-        
-        for char in text:
-            if char in [' ', '\t', '\n', '/', '|']:
-                if current:
-                    tokens.append(''.join(current))
-                    current = []
-                tokens.append(char)
-            else:
-                current.append(char)
-        
-        if current:
-            tokens.append(''.join(current))
-        
-        return tokens
+        return _TOKEN_RE.findall(text)
     
     def _is_punctuation_only(self, text: str) -> bool:
         """Check if text contains only punctuation/whitespace"""
-        return all(c in [' ', '\t', '\n', '/', '|', '.'] for c in text)
+        # strip() removes the class from both ends in C; only a token made
+        # entirely of it ends up empty
+        return not text.strip(_PUNCT_CHARS)
     
     def _validate_syllable(
-        self, syllable: str, position: int
+        self, syllable: str, position: int,
+        seen: Optional[Dict[str, Tuple[tuple, tuple]]] = None
     ) -> Tuple[List[ValidationError], List[ValidationError]]:
         """
         Validate a single syllable.
         
+        Results depend only on the syllable text, so they are computed with
+        position 0 and moved to the real position here. The optional seen
+        dict keeps every distinct syllable of one text, so repeats are never
+        re-validated even after they fall out of the bounded LRU cache.
+        
+        Returns (errors, warnings)
+        """
+        if seen is None:
+            result = self._validate_syllable_cached(syllable)
+        else:
+            result = seen.get(syllable)
+            if result is None:
+                result = seen[syllable] = self._validate_syllable_cached(syllable)
+        errors, warnings = result
+        if position:
+            errors = [replace(e, position=position) for e in errors]
+            warnings = [replace(w, position=position) for w in warnings]
+        return list(errors), list(warnings)
+    
+    def _validate_syllable_at_start(
+        self, syllable: str
+    ) -> Tuple[Tuple[ValidationError, ...], Tuple[ValidationError, ...]]:
+        """Validate a single syllable at position 0 (cached by __init__)"""
+        errors, warnings = self._check_syllable(syllable, 0)
+        return tuple(errors), tuple(warnings)
+    
+    def _check_syllable(
+        self, syllable: str, position: int
+    ) -> Tuple[List[ValidationError], List[ValidationError]]:
+        """
+        Run all syllable checks without caching.
+        
         Returns (errors, warnings)
         """
         errors = []
@@ -147,10 +295,10 @@ class WylieValidator:
         if self._is_sanskrit_mark_only(syllable):
             return errors, warnings  # Standalone Sanskrit marks are valid
         
-        # 3. Try to parse syllable structure
-        components = self._parse_syllable_structure(syllable)
+        # 3. Try to parse syllable structure (lowercased once for all strategies)
+        parse = self._parse_syllable_structure(syllable, syllable.lower(), position)
         
-        if components is None:
+        if parse is None:
             errors.append(ValidationError(
                 error_type=ERROR_TYPES.INVALID_SYLLABLE_STRUCTURE,
                 position=position,
@@ -160,38 +308,26 @@ class WylieValidator:
             ))
             return errors, warnings
         
-        # 4. Validate syllable components
-        component_errors, component_warnings = self._validate_components(
-            components, syllable, position
-        )
+        # 4. Syllable components were validated while choosing the parse
+        _, component_errors, component_warnings = parse
         errors.extend(component_errors)
         warnings.extend(component_warnings)
         
         return errors, warnings
     
     def _is_numeral(self, syllable: str) -> bool:
-        """Check if syllable is entirely numeric"""
-        return all(c in '0123456789' for c in syllable)
+        """Check if syllable is entirely numeric (ASCII 0-9)"""
+        return syllable.isascii() and syllable.isdecimal()
     
     def _is_standalone_vowel(self, syllable: str) -> bool:
         """
         Check if syllable is a standalone vowel (with optional Sanskrit mark).
         Examples: oM, i, u, e, o, A, hUM (h+U+M is considered valid)
         """
-        # Single vowel
-        if syllable in self.alphabet.VOWELS:
-            return True
-        
-        # Vowel + Sanskrit mark (e.g., oM)
-        for vowel in sorted(self.alphabet.VOWELS.keys(), key=len, reverse=True):
-            if syllable.startswith(vowel):
-                remainder = syllable[len(vowel):]
-                if remainder in self.alphabet.SANSKRIT_MARKS or remainder == '':
-                    return True
-        
-        # Special case: consonant + vowel + Sanskrit mark (like hUM)
-        # This is handled by normal syllable parsing, so return False here
-        return False
+        # Single vowel, or vowel + Sanskrit mark (e.g., oM).
+        # Consonant + vowel + Sanskrit mark (like hUM) is handled by normal
+        # syllable parsing, so it is not in this set
+        return syllable in self._standalone_vowel_forms
     
     def _is_sanskrit_mark_only(self, syllable: str) -> bool:
         """Check if syllable is only Sanskrit marks"""
@@ -199,60 +335,75 @@ class WylieValidator:
     
     def _find_unknown_characters(self, syllable: str) -> List[str]:
         """Find characters not in EWTS (DRY principle)"""
+        # Fast path: if every character is valid on its own, the longest-match
+        # walk below can never get stuck, so nothing is unknown
+        if not syllable.translate(self._strip_valid_singles):
+            return []
+        
         unknown = []
         i = 0
         
         while i < len(syllable):
-            # Try multi-char sequences first
-            found = False
-            for length in [3, 2, 1]:
-                if i + length <= len(syllable):
-                    substr = syllable[i:i+length]
-                    if substr in self.valid_chars:
-                        i += length
-                        found = True
-                        break
-            
-            if not found:
-                if syllable[i] not in self.valid_chars:
-                    unknown.append(syllable[i])
+            # Longest known sequence starting at i
+            _, length = self._longest_prefix(self._valid_trie, syllable, i)
+            if length:
+                i += length
+            else:
+                unknown.append(syllable[i])
                 i += 1
         
         return unknown
     
-    def _parse_syllable_structure(self, syllable: str) -> Optional[SyllableComponents]:
+    def _parse_syllable_structure(
+        self, syllable: str, syllable_lower: str, position: int = 0
+    ) -> Optional[Tuple[SyllableComponents, List[ValidationError], List[ValidationError]]]:
         """
         Parse syllable into components for validation.
         Uses multi-strategy approach to find best VALID parse.
         Prioritizes valid parses (0 errors) over longer parses.
-        Returns None if parsing fails.
+        
+        Returns (components, errors, warnings) for the chosen parse, with
+        errors reported at position, or None if parsing fails.
         """
         # Try different parsing strategies
-        strategies = [
-            self._parse_simple,           # root + modifiers
-            self._parse_with_subscript,   # root + subscript + modifiers
-            self._parse_with_superscript, # superscript + root + modifiers
-            self._parse_with_prescript,   # prescript + root + modifiers
-            self._parse_full,             # prescript + superscript + root + subscript + modifiers
-        ]
-        
         valid_parses = []  # Parses with 0 errors
         invalid_parses = []  # Parses with errors
+        syllable_len = len(syllable)
         
-        for strategy in strategies:
-            components, length = strategy(syllable)
+        for strategy in _STRATEGIES:
+            components, length = self._parse(syllable, syllable_lower, strategy)
             if components and length > 0:
-                # Check validity of this parse
-                errors, warnings = self._validate_components(components, syllable, 0)
+                # Check validity of this parse (counting only; messages are
+                # built for the chosen parse alone)
+                violations = self._component_violations(components)
+                error_count = sum(v != _UNUSUAL_SUBSCRIPT for v in violations)
                 
-                if len(errors) == 0:
-                    valid_parses.append((components, length, errors, warnings))
+                if error_count == 0:
+                    if length == syllable_len:
+                        # Nothing can beat a valid parse of the whole syllable,
+                        # and earlier valid parses were all shorter
+                        best = (components, length, error_count)
+                        break
+                    valid_parses.append((components, length, error_count))
                 else:
-                    invalid_parses.append((components, length, errors, warnings))
+                    invalid_parses.append((components, length, error_count))
         
-        # Filter parses that consume the entire syllable (or close to it)
-        syllable_len = len(syllable)
+        else:
+            best = self._rank_parses(valid_parses, invalid_parses, syllable_len)
+            if best is None:
+                return None
         
+        components = best[0]
+        errors, warnings = self._validate_components(components, syllable, position)
+        return components, errors, warnings
+    
+    def _rank_parses(
+        self,
+        valid_parses: List[Tuple[SyllableComponents, int, int]],
+        invalid_parses: List[Tuple[SyllableComponents, int, int]],
+        syllable_len: int
+    ) -> Optional[Tuple[SyllableComponents, int, int]]:
+        """Pick the best (components, length, error_count) parse, or None"""
         # A valid parse should consume the entire syllable
         # (Allow syllable_len or syllable_len-1 for implicit 'a' vowel)
         complete_valid_parses = [p for p in valid_parses if p[1] >= syllable_len - 1]
@@ -261,351 +412,157 @@ class WylieValidator:
         # Prefer complete valid parses
         if complete_valid_parses:
             # Among complete valid parses, pick the longest
-            best = max(complete_valid_parses, key=lambda x: x[1])
-            return best[0]
+            return max(complete_valid_parses, key=lambda x: x[1])
         elif complete_invalid_parses:
             # If no complete valid parse, pick complete invalid with fewest errors
-            best = min(complete_invalid_parses, key=lambda x: (len(x[2]), -x[1]))
-            return best[0]
+            return min(complete_invalid_parses, key=lambda x: (x[2], -x[1]))
         elif valid_parses:
             # Fall back to any valid parse (even incomplete)
-            best = max(valid_parses, key=lambda x: x[1])
-            return best[0]
+            return max(valid_parses, key=lambda x: x[1])
         elif invalid_parses:
             # Last resort: incomplete invalid parse
-            best = min(invalid_parses, key=lambda x: (len(x[2]), -x[1]))
-            return best[0]
-        
+            return min(invalid_parses, key=lambda x: (x[2], -x[1]))
         return None
     
-    def _parse_simple(self, syllable: str) -> Tuple[Optional[SyllableComponents], int]:
-        """Parse: root [+vowel] [+postscript]"""
-        pos = 0
-        
-        # Match root
-        root = None
-        for cons in sorted(self.alphabet.CONSONANTS.keys(), key=len, reverse=True):
-            if syllable[pos:].startswith(cons) or syllable[pos:].lower().startswith(cons):
-                root = syllable[pos:pos+len(cons)] if syllable[pos:].startswith(cons) else cons
-                pos += len(cons)
-                break
-        
-        if not root:
-            return None, 0
-        
-        # Match vowel (including explicit 'a' when not implicit)
-        vowel = None
-        for v in sorted(self.alphabet.VOWELS.keys(), key=len, reverse=True):
-            if syllable[pos:].startswith(v):
-                # Match 'a' only if there's more content after (explicit 'a')
-                if v == 'a' and pos + 1 < len(syllable):
-                    vowel = v
-                    pos += len(v)
-                    break
-                elif v != 'a':
-                    vowel = v
-                    pos += len(v)
-                    break
-        
-        # Match postscript
-        postscript1 = None
-        for post in sorted(self.rules.VALID_POSTSCRIPTS, key=len, reverse=True):
-            if syllable[pos:].lower().startswith(post):
-                postscript1 = post
-                pos += len(post)
-                break
-        
-        # Match second postscript
-        postscript2 = None
-        if postscript1:
-            for post2 in sorted(self.rules.VALID_SECOND_POSTSCRIPTS, key=len, reverse=True):
-                if syllable[pos:].lower().startswith(post2):
-                    postscript2 = post2
-                    pos += len(post2)
-                    break
+    def _parse(
+        self, syllable: str, syllable_lower: str, strategy: '_ParseStrategy'
+    ) -> Tuple[Optional[SyllableComponents], int]:
+        """
+        Parse: [prescript] + [superscript] + root + [subscript] + [vowel] + [postscript]
         
-        return SyllableComponents(
-            root=root.lower() if root else None,
-            vowel=vowel,
-            postscript1=postscript1,
-            postscript2=postscript2
-        ), pos
-    
-    def _parse_with_subscript(self, syllable: str) -> Tuple[Optional[SyllableComponents], int]:
-        """Parse: root + subscript [+vowel] [+postscript]"""
+        Only the components enabled by the strategy are tried, and the
+        parse fails unless at least one of strategy.required matched.
+        """
         pos = 0
         
-        # Match root
-        root = None
-        for cons in sorted(self.alphabet.CONSONANTS.keys(), key=len, reverse=True):
-            if syllable[pos:].startswith(cons) or syllable[pos:].lower().startswith(cons):
-                root = syllable[pos:pos+len(cons)] if syllable[pos:].startswith(cons) else cons
-                pos += len(cons)
-                break
+        # Match prescript and superscript
+        prescript = superscript = None
+        if strategy.prescript:
+            prescript, pre_len = self._longest_prefix(self._prescript_trie, syllable_lower, pos)
+            pos += pre_len
+        if strategy.superscript:
+            superscript, sup_len = self._longest_prefix(self._superscript_trie, syllable_lower, pos)
+            pos += sup_len
         
+        # Match root (required)
+        root, root_len = self._longest_prefix(self._root_trie, syllable, pos)
         if not root:
             return None, 0
+        pos += root_len
         
         # Match subscript (can be double like 'r+w')
-        subscripts_matched = []
-        for sub in sorted(self.alphabet.SUBSCRIPTS.keys(), key=len, reverse=True):
-            if syllable[pos:].lower().startswith(sub):
-                subscripts_matched.append(sub)
-                pos += len(sub)
-                
-                # Try to match second subscript
-                for sub2 in sorted(self.alphabet.SUBSCRIPTS.keys(), key=len, reverse=True):
-                    if syllable[pos:].lower().startswith(sub2):
-                        subscripts_matched.append(sub2)
-                        pos += len(sub2)
-                        break
-                break
-        
-        if not subscripts_matched:
-            return None, 0  # This strategy requires subscript
-        
-        subscript = '+'.join(subscripts_matched) if len(subscripts_matched) > 1 else subscripts_matched[0]
-        
-        # Match vowel (including explicit 'a' when not implicit)
-        vowel = None
-        for v in sorted(self.alphabet.VOWELS.keys(), key=len, reverse=True):
-            if syllable[pos:].startswith(v):
-                # Match 'a' only if there's more content after (explicit 'a')
-                if v == 'a' and pos + 1 < len(syllable):
-                    vowel = v
-                    pos += len(v)
-                    break
-                elif v != 'a':
-                    vowel = v
-                    pos += len(v)
-                    break
-        
-        # Match postscript
-        postscript1 = None
-        for post in sorted(self.rules.VALID_POSTSCRIPTS, key=len, reverse=True):
-            if syllable[pos:].lower().startswith(post):
-                postscript1 = post
-                pos += len(post)
-                break
-        
-        postscript2 = None
-        if postscript1:
-            for post2 in sorted(self.rules.VALID_SECOND_POSTSCRIPTS, key=len, reverse=True):
-                if syllable[pos:].lower().startswith(post2):
-                    postscript2 = post2
-                    pos += len(post2)
-                    break
-        
-        return SyllableComponents(
-            root=root.lower() if root else None,
-            subscript=subscript,
-            vowel=vowel,
-            postscript1=postscript1,
-            postscript2=postscript2
-        ), pos
-    
-    def _parse_with_superscript(self, syllable: str) -> Tuple[Optional[SyllableComponents], int]:
-        """Parse: superscript + root [+vowel] [+postscript]"""
-        pos = 0
-        
-        # Match superscript
-        superscript = None
-        for sup in sorted(self.rules.VALID_SUPERSCRIPT_COMBINATIONS.keys(),
-                         key=len, reverse=True):
-            if syllable[pos:].lower().startswith(sup):
-                superscript = sup
-                pos += len(sup)
-                break
-        
-        if not superscript:
-            return None, 0
-        
-        # Match root
-        root = None
-        for cons in sorted(self.alphabet.CONSONANTS.keys(), key=len, reverse=True):
-            if syllable[pos:].startswith(cons) or syllable[pos:].lower().startswith(cons):
-                root = syllable[pos:pos+len(cons)] if syllable[pos:].startswith(cons) else cons
-                pos += len(cons)
-                break
-        
-        if not root:
+        subscript = None
+        if strategy.subscripts:
+            subscript, sub_len = self._longest_prefix(self._subscript_trie, syllable_lower, pos)
+            pos += sub_len
+            if subscript and strategy.subscripts > 1:
+                subscript2, sub_len = self._longest_prefix(
+                    self._subscript_trie, syllable_lower, pos
+                )
+                if subscript2:
+                    subscript = self._double_subscripts[subscript, subscript2]
+                    pos += sub_len
+        
+        matched = {'prescript': prescript, 'superscript': superscript, 'subscript': subscript}
+        if strategy.required and not any(matched[name] for name in strategy.required):
             return None, 0
         
-        # Match vowel and postscripts (same as simple)
-        vowel = None
-        for v in sorted([k for k in self.alphabet.VOWELS.keys() if k != 'a'], 
-                       key=len, reverse=True):
-            if syllable[pos:].startswith(v):
-                vowel = v
-                pos += len(v)
-                break
-        
-        postscript1 = None
-        for post in sorted(self.rules.VALID_POSTSCRIPTS, key=len, reverse=True):
-            if syllable[pos:].lower().startswith(post):
-                postscript1 = post
-                pos += len(post)
-                break
+        # Match vowel (including explicit 'a' when not implicit, if allowed)
+        if strategy.explicit_a:
+            vowel, vowel_len = self._match_vowel(syllable, pos)
+        else:
+            vowel, vowel_len = self._longest_prefix(self._vowel_no_a_trie, syllable, pos)
+        pos += vowel_len
         
-        postscript2 = None
-        if postscript1:
-            for post2 in sorted(self.rules.VALID_SECOND_POSTSCRIPTS, key=len, reverse=True):
-                if syllable[pos:].lower().startswith(post2):
-                    postscript2 = post2
-                    pos += len(post2)
-                    break
+        # Match postscripts
+        postscript1, postscript2, pos = self._match_postscripts(syllable_lower, pos)
         
         return SyllableComponents(
+            prescript=prescript,
             superscript=superscript,
-            root=root.lower() if root else None,
+            root=root,
+            subscript=subscript,
             vowel=vowel,
             postscript1=postscript1,
             postscript2=postscript2
         ), pos
     
-    def _parse_with_prescript(self, syllable: str) -> Tuple[Optional[SyllableComponents], int]:
-        """Parse: prescript + root [+vowel] [+postscript]"""
-        pos = 0
-        
-        # Match prescript
-        prescript = None
-        for pre in sorted(self.rules.VALID_PRESCRIPT_COMBINATIONS.keys(), 
-                         key=len, reverse=True):
-            if syllable[pos:].lower().startswith(pre):
-                prescript = pre
-                pos += len(pre)
-                break
-        
-        if not prescript:
+    def _match_vowel(self, syllable: str, pos: int) -> Tuple[Optional[str], int]:
+        """Match vowel sign; 'a' only counts if there's more content after it"""
+        vowel, length = self._longest_prefix(self._vowel_trie, syllable, pos)
+        if vowel == 'a' and pos + 1 >= len(syllable):
             return None, 0
-        
-        # Match root
-        root = None
-        for cons in sorted(self.alphabet.CONSONANTS.keys(), key=len, reverse=True):
-            if syllable[pos:].startswith(cons) or syllable[pos:].lower().startswith(cons):
-                root = syllable[pos:pos+len(cons)] if syllable[pos:].startswith(cons) else cons
-                pos += len(cons)
-                break
-        
-        if not root:
-            return None, 0
-        
-        # Match vowel and postscripts
-        vowel = None
-        for v in sorted([k for k in self.alphabet.VOWELS.keys() if k != 'a'], 
-                       key=len, reverse=True):
-            if syllable[pos:].startswith(v):
-                vowel = v
-                pos += len(v)
-                break
-        
-        postscript1 = None
-        for post in sorted(self.rules.VALID_POSTSCRIPTS, key=len, reverse=True):
-            if syllable[pos:].lower().startswith(post):
-                postscript1 = post
-                pos += len(post)
-                break
-        
-        postscript2 = None
-        if postscript1:
-            for post2 in sorted(self.rules.VALID_SECOND_POSTSCRIPTS, key=len, reverse=True):
-                if syllable[pos:].lower().startswith(post2):
-                    postscript2 = post2
-                    pos += len(post2)
-                    break
-        
-        return SyllableComponents(
-            prescript=prescript,
-            root=root.lower() if root else None,
-            vowel=vowel,
-            postscript1=postscript1,
-            postscript2=postscript2
-        ), pos
+        return vowel, length
     
-    def _parse_full(self, syllable: str) -> Tuple[Optional[SyllableComponents], int]:
-        """Parse: [prescript] + [superscript] + root + [subscript] + [vowel] + [postscript]"""
-        pos = 0
-        
-        # Match prescript
-        prescript = None
-        for pre in sorted(self.rules.VALID_PRESCRIPT_COMBINATIONS.keys(), 
-                         key=len, reverse=True):
-            if syllable[pos:].lower().startswith(pre):
-                prescript = pre
-                pos += len(pre)
-                break
-        
-        # Match superscript
-        superscript = None
-        for sup in sorted(self.rules.VALID_SUPERSCRIPT_COMBINATIONS.keys(),
-                         key=len, reverse=True):
-            if syllable[pos:].lower().startswith(sup):
-                superscript = sup
-                pos += len(sup)
-                break
-        
-        # Match root (required)
-        root = None
-        for cons in sorted(self.alphabet.CONSONANTS.keys(), key=len, reverse=True):
-            if syllable[pos:].startswith(cons) or syllable[pos:].lower().startswith(cons):
-                root = syllable[pos:pos+len(cons)] if syllable[pos:].startswith(cons) else cons
-                pos += len(cons)
-                break
-        
-        if not root:
-            return None, 0
-        
-        # Match subscript
-        subscript = None
-        for sub in sorted(self.alphabet.SUBSCRIPTS.keys(), key=len, reverse=True):
-            if syllable[pos:].lower().startswith(sub):
-                subscript = sub
-                pos += len(sub)
-                break
-        
-        # Match vowel (including explicit 'a' when not implicit)
-        vowel = None
-        for v in sorted(self.alphabet.VOWELS.keys(), key=len, reverse=True):
-            if syllable[pos:].startswith(v):
-                # Match 'a' only if there's more content after (explicit 'a')
-                if v == 'a' and pos + 1 < len(syllable):
-                    vowel = v
-                    pos += len(v)
-                    break
-                elif v != 'a':
-                    vowel = v
-                    pos += len(v)
-                    break
+    def _match_postscripts(
+        self, syllable_lower: str, pos: int
+    ) -> Tuple[Optional[str], Optional[str], int]:
+        """Match first and (only after a first) second postscript"""
+        postscript1, length = self._longest_prefix(self._postscript_trie, syllable_lower, pos)
+        if not postscript1:
+            return None, None, pos
+        pos += length
+        postscript2, length = self._longest_prefix(
+            self._second_postscript_trie, syllable_lower, pos
+        )
+        return postscript1, postscript2, pos + length
+    
+    @staticmethod
+    def _longest_prefix(trie: dict, text: str, pos: int) -> Tuple[Optional[str], int]:
+        """
+        Walk trie along text from pos and return the deepest terminal seen.
         
-        # Match postscripts
-        postscript1 = None
-        for post in sorted(self.rules.VALID_POSTSCRIPTS, key=len, reverse=True):
-            if syllable[pos:].lower().startswith(post):
-                postscript1 = post
-                pos += len(post)
+        Returns:
+            Tuple of (matched key, matched length), or (None, 0)
+        """
+        node = trie
+        matched, matched_len = None, 0
+        for i in range(pos, len(text)):
+            node = node.get(text[i])
+            if node is None:
                 break
+            if _TERMINAL in node:
+                matched, matched_len = node[_TERMINAL], i + 1 - pos
+        return matched, matched_len
+    
+    def _component_violations(self, components: SyllableComponents) -> List[str]:
+        """
+        Name each EWTS rule the components break, in reporting order.
         
-        postscript2 = None
-        if postscript1:
-            for post2 in sorted(self.rules.VALID_SECOND_POSTSCRIPTS, key=len, reverse=True):
-                if syllable[pos:].lower().startswith(post2):
-                    postscript2 = post2
-                    pos += len(post2)
-                    break
+        Cheap enough to rank speculative parses. _UNUSUAL_SUBSCRIPT is
+        reported as a warning, every other violation as an error.
+        """
+        rules = self.rules
+        root = components.root
+        subscript = components.subscript
+        violations = []
+        
+        # Prescript + root combination
+        if components.prescript and root:
+            if (components.prescript, root) not in rules.VALID_PRESCRIPT_PAIRS:
+                violations.append('prescript')
+        
+        # Superscript + root combination
+        if components.superscript and root:
+            if (components.superscript, root) not in rules.VALID_SUPERSCRIPT_PAIRS:
+                violations.append('superscript')
+        
+        # Subscript + root combination (single or double subscript)
+        if subscript and root:
+            if (subscript, root) not in rules.VALID_SUBSCRIPT_PAIRS:
+                if rules.VALID_SUBSCRIPT_COMBINATIONS.get(subscript):
+                    violations.append('subscript')
+                else:
+                    # Unknown subscript combination - might be double subscript without validation rules
+                    violations.append(_UNUSUAL_SUBSCRIPT)
         
-        # Only return if we have prescript OR superscript (otherwise it's redundant with simpler strategies)
-        if not prescript and not superscript:
-            return None, 0
+        # Postscripts
+        if components.postscript1 and components.postscript1 not in rules.VALID_POSTSCRIPTS:
+            violations.append('postscript1')
+        if components.postscript2 and components.postscript2 not in rules.VALID_SECOND_POSTSCRIPTS:
+            violations.append('postscript2')
         
-        return SyllableComponents(
-            prescript=prescript,
-            superscript=superscript,
-            root=root.lower() if root else None,
-            subscript=subscript,
-            vowel=vowel,
-            postscript1=postscript1,
-            postscript2=postscript2
-        ), pos
+        return violations
     
     def _validate_components(
         self, 
@@ -616,90 +573,88 @@ class WylieValidator:
         """Validate syllable components according to EWTS rules"""
         errors = []
         warnings = []
-        
-        # Validate prescript + root combination
-        if components.prescript and components.root:
-            valid_roots = self.rules.VALID_PRESCRIPT_COMBINATIONS.get(
-                components.prescript, frozenset()
-            )
-            if components.root not in valid_roots:
+        rules = self.rules
+        root = components.root
+        prescript = components.prescript
+        superscript = components.superscript
+        subscript = components.subscript
+        postscript1 = components.postscript1
+        postscript2 = components.postscript2
+        
+        for violation in self._component_violations(components):
+            if violation == 'prescript':
+                valid_roots = rules.VALID_PRESCRIPT_COMBINATIONS.get(prescript, _NO_ROOTS)
                 errors.append(ValidationError(
                     error_type=ERROR_TYPES.INVALID_PRESCRIPT,
                     position=position,
                     syllable=syllable,
-                    message=f"Invalid prescript '{components.prescript}' "
-                           f"before root '{components.root}'",
-                    suggestion=f"Valid roots after '{components.prescript}': "
+                    message=f"Invalid prescript '{prescript}' "
+                           f"before root '{root}'",
+                    suggestion=f"Valid roots after '{prescript}': "
                               f"{', '.join(sorted(valid_roots))}"
                 ))
-        
-        # Validate superscript + root combination
-        if components.superscript and components.root:
-            valid_roots = self.rules.VALID_SUPERSCRIPT_COMBINATIONS.get(
-                components.superscript, frozenset()
-            )
-            if components.root not in valid_roots:
+            elif violation == 'superscript':
+                valid_roots = rules.VALID_SUPERSCRIPT_COMBINATIONS.get(superscript, _NO_ROOTS)
                 errors.append(ValidationError(
                     error_type=ERROR_TYPES.INVALID_SUPERSCRIPT,
                     position=position,
                     syllable=syllable,
-                    message=f"Invalid superscript '{components.superscript}' "
-                           f"above root '{components.root}'",
-                    suggestion=f"Valid roots under '{components.superscript}': "
+                    message=f"Invalid superscript '{superscript}' "
+                           f"above root '{root}'",
+                    suggestion=f"Valid roots under '{superscript}': "
                               f"{', '.join(sorted(valid_roots))}"
                 ))
-        
-        # Validate subscript + root combination
-        if components.subscript and components.root:
-            # Check if it's a valid single or double subscript
-            valid_roots = self.rules.VALID_SUBSCRIPT_COMBINATIONS.get(
-                components.subscript, frozenset()
-            )
-            if valid_roots and components.root not in valid_roots:
+            elif violation == 'subscript':
+                valid_roots = rules.VALID_SUBSCRIPT_COMBINATIONS[subscript]
                 errors.append(ValidationError(
                     error_type=ERROR_TYPES.INVALID_SUBSCRIPT,
                     position=position,
                     syllable=syllable,
-                    message=f"Invalid subscript '{components.subscript}' "
-                           f"below root '{components.root}'",
-                    suggestion=f"Valid roots above '{components.subscript}': "
+                    message=f"Invalid subscript '{subscript}' "
+                           f"below root '{root}'",
+                    suggestion=f"Valid roots above '{subscript}': "
                               f"{', '.join(sorted(valid_roots))}"
                 ))
-            elif not valid_roots:
-                # Unknown subscript combination - might be double subscript without validation rules
+            elif violation == _UNUSUAL_SUBSCRIPT:
                 # Allow it as a warning rather than error
                 warnings.append(ValidationError(
                     error_type=ERROR_TYPES.AMBIGUOUS_PARSING,
                     position=position,
                     syllable=syllable,
-                    message=f"Unusual subscript combination '{components.subscript}' "
-                           f"with root '{components.root}'",
+                    message=f"Unusual subscript combination '{subscript}' "
+                           f"with root '{root}'",
                     suggestion="Verify this is correct EWTS"
                 ))
-        
-        # Validate postscript
-        if components.postscript1:
-            if components.postscript1 not in self.rules.VALID_POSTSCRIPTS:
+            elif violation == 'postscript1':
                 errors.append(ValidationError(
                     error_type=ERROR_TYPES.INVALID_POSTSCRIPT,
                     position=position,
                     syllable=syllable,
-                    message=f"Invalid postscript '{components.postscript1}'",
+                    message=f"Invalid postscript '{postscript1}'",
                     suggestion=f"Valid postscripts: "
-                              f"{', '.join(sorted(self.rules.VALID_POSTSCRIPTS))}"
+                              f"{', '.join(sorted(rules.VALID_POSTSCRIPTS))}"
                 ))
-        
-        # Validate second postscript
-        if components.postscript2:
-            if components.postscript2 not in self.rules.VALID_SECOND_POSTSCRIPTS:
+            else:
                 errors.append(ValidationError(
                     error_type=ERROR_TYPES.INVALID_POSTSCRIPT,
                     position=position,
                     syllable=syllable,
-                    message=f"Invalid second postscript '{components.postscript2}'",
+                    message=f"Invalid second postscript '{postscript2}'",
                     suggestion=f"Valid second postscripts: "
-                              f"{', '.join(sorted(self.rules.VALID_SECOND_POSTSCRIPTS))}"
+                              f"{', '.join(sorted(rules.VALID_SECOND_POSTSCRIPTS))}"
                 ))
         
         return errors, warnings
 
+
+@cache
+def get_validator() -> WylieValidator:
+    """
+    Shared WylieValidator for the whole process.
+    
+    Construction builds the character set and all matching tries, so
+    callers that validate repeatedly should share one instance. The
+    validator holds no per-call state; its only mutable part is the
+    syllable cache, which is safe to share between threads.
+    """
+    return WylieValidator()
@@ -6,7 +6,7 @@ Reference: http://www.asianclassics.org/download/tibetancode/ticode.pdf
 """
 
 import re
-from typing import Dict, Pattern, List
+from typing import Dict, FrozenSet, Pattern, List
 
 
 class ACIPAlphabet:
@@ -93,6 +93,20 @@ class ACIPAlphabet:
         '%': '~X',      # ACIP % = EWTS ~X
     }
     
+    # One-for-one substitutions made early in ACIP → EWTS conversion, before
+    # the case swap (hence '~x' for '%'). Outputs are not re-scanned, so the
+    # backslash in the '^' escape is not turned into '?'.
+    SINGLE_CHAR_TRANSLATION: Dict[int, str] = str.maketrans({
+        ';': '|',           # Punctuation
+        '#': '@##',         # Temporary marker
+        '\\': '?',
+        ',': '/',
+        '`': '!',
+        '^': '\\u0F38',     # Special characters
+        '%': '~x',
+        'V': 'W',           # ACIP V = EWTS w
+    })
+    
     # Reverse mappings (EWTS to ACIP)
     CONSONANTS_EWTS_TO_ACIP: Dict[str, str] = {
         'k': 'K',
@@ -180,6 +194,52 @@ class ACIPPatterns:
         r'([BCDGHJKLMN\'PRSTWYZhdtn])A-'
     )
     
+    # One consonant token of a (lowercased) stack: a digraph, else a single
+    # letter. Characters that match neither are skipped. Digraphs are tried
+    # in this order, so 'tsh' splits into 'ts' + 'h'.
+    CONSONANT_TOKEN: Pattern = re.compile(
+        r"zh|ny|dz|ts|ch|ph|th|sh|Sh|kh|ng|[NDTRYWbcdghjklmnprstwyz']"
+    )
+    
+    # Parentheses: (...) in EWTS = /.../ in ACIP
+    PARENS_EWTS: Pattern = re.compile(r'\(([^)]*)\)')
+    
+    # Reverse vowels before case swap: Ai or i → -I, then A'i or 'i → -i
+    REVERSE_VOWEL: Pattern = re.compile(r'A?i')
+    REVERSE_VOWEL_AFTER_APOSTROPHE: Pattern = re.compile(r"A?'-I")
+    
+    # Apostrophe + vowel, in one pass: after a consonant (B'I = bi, as
+    # VOWEL_AFTER_CONS), or after A as main letter (A'I = i). A consonant
+    # match also takes an immediately following A' + vowel, which a separate
+    # A' pass would only find once the first one had lowercased the vowel
+    APOSTROPHE_VOWEL: Pattern = re.compile(
+        r"([BCDGHJKLMNPRSTWYZ])'([AEOUI])(?:A'([AEOUI]))?"
+        r"|(^|[^BCDGHJKLMNPR'STWYZhdtn])A'([AEOUI])"
+    )
+    
+    # A + vowel → vowel
+    A_BEFORE_VOWEL: Pattern = re.compile(r'A([AEIOUaeiou])')
+    
+    # Apostrophe look-alikes
+    APOSTROPHE_VARIANTS: Pattern = re.compile(r"['ʼʹ'ʾ]")
+    
+    # Consonant sequence (possibly with explicit +) before a vowel
+    CONSONANTS_BEFORE_VOWEL: Pattern = re.compile(
+        r"([bcdgjklm'nprstwyzhSDTN+]+)([aeiouAEIOU.-])"
+    )
+    
+    # EWTS markers to drop at the start of text or after '['
+    LEADING_ASTERISK: Pattern = re.compile(r'(^|\[)\*')
+    LEADING_HASH: Pattern = re.compile(r'(^|\[)#')
+    
+    # Escaped U+0F38 in EWTS ('\u0F38', any case) = ACIP ^
+    ESCAPED_0F38: Pattern = re.compile(r'\\U0F38', re.I)
+    
+    # Independent vowel (needs an 'A' prefix in ACIP)
+    INDEPENDENT_VOWEL: Pattern = re.compile(
+        r"(^|[^BCDGHJKLMNPR'STVYZhdtnEO])([AEOUIqaewiou])"
+    )
+    
     # Space normalization patterns
     SPACE_BEFORE_PUNCT: Pattern = re.compile(
         r'([aeiouIAEU]g|[gk][aeiouAEIU]|[;!/|]) +([;!/|])'
@@ -187,6 +247,11 @@ class ACIPPatterns:
     SPACE_AFTER_PUNCT: Pattern = re.compile(
         r'([;!/|H]) +'
     )
+    # Both of the above in one pass (the following punctuation is only
+    # looked ahead at, so it can still start the next match)
+    SPACE_NORMALIZE: Pattern = re.compile(
+        r'([aeiouIAEU]g|[gk][aeiouAEIU]|[;!/|]) +(?=[;!/|])|([;!/|H]) +'
+    )
 
 
 class ACIPStandardStacks:
@@ -200,16 +265,26 @@ class ACIPStandardStacks:
     Based on pyewts STD_TIB_PATTERN which allows [rwy]* subscripts after base stacks.
     """
     
-    # Compile pattern to match valid Tibetan stacks (matching pyewts)
-    # Base stacks + optional subscripts [rwy]*
+    # Base stacks that may be followed by [rwy] subscripts (matching pyewts).
+    # No base ends in r, w or y, so trailing subscripts can be stripped greedily.
+    STD_TIB_BASES: FrozenSet[str] = frozenset((
+        *"bcdgjklm'npstzh",
+        "bgl", "dm", "sm", "sn", "kl", "dk", "bk", "bkl", "rk", "lk", "sk", "brk", "bsk",
+        "kh", "mkh", "'kh", "gl", "dg", "bg", "mg", "'g", "rg", "lg", "sg", "brg", "bsg",
+        "ng", "dng", "mng", "rng", "lng", "sng", "brng", "bsng", "gc", "bc", "lc",
+        "ch", "mch", "'ch", "mj", "'j", "rj", "lj", "brj", "ny", "gny", "mny", "rny",
+        "sny", "brny", "bsny", "gt", "bt", "rt", "lt", "st", "brt", "blt", "bst",
+        "th", "mth", "'th", "gd", "bd", "md", "'d", "rd", "ld", "sd", "brd", "bld", "bsd",
+        "gn", "mn", "rn", "brn", "bsn", "dp", "lp", "sp", "ph", "'ph", "bl", "db", "'b",
+        "rb", "lb", "sb", "rm", "ts", "gts", "bts", "rts", "sts", "brts", "bsts",
+        "tsh", "mtsh", "'tsh", "dz", "mdz", "'dz", "rdz", "brdz", "zh", "gzh", "bzh",
+        "zl", "gz", "bz", "bzl", "rl", "brl", "sh", "gsh", "bsh", "sl", "gs", "bs", "bsl",
+        "lh",
+    ))
+    
+    # The same language as a regex, kept for callers that match against it
     STD_TIB_PATTERN: Pattern = re.compile(
-        r"^([bcdgjklm'npstzhSDTN]|bgl|dm|sm|sn|kl|dk|bk|bkl|rk|lk|sk|brk|bsk|kh|mkh|'kh|"
-        r"gl|dg|bg|mg|'g|rg|lg|sg|brg|bsg|ng|dng|mng|rng|lng|sng|brng|bsng|gc|bc|lc|"
-        r"ch|mch|'ch|mj|'j|rj|lj|brj|ny|gny|mny|rny|sny|brny|bsny|gt|bt|rt|lt|st|brt|"
-        r"blt|bst|th|mth|'th|gd|bd|md|'d|rd|ld|sd|brd|bld|bsd|gn|mn|rn|brn|bsn|dp|lp|"
-        r"sp|ph|'ph|bl|db|'b|rb|lb|sb|rm|ts|gts|bts|rts|sts|brts|bsts|tsh|mtsh|'tsh|"
-        r"dz|mdz|'dz|rdz|brdz|zh|gzh|bzh|zl|gz|bz|bzl|rl|brl|sh|gsh|bsh|sl|gs|bs|bsl|lh)"
-        r"[rwy]*$",
+        "^(" + "|".join(re.escape(base) for base in sorted(STD_TIB_BASES)) + ")[rwy]*$",
         re.IGNORECASE
     )
     
@@ -224,16 +299,42 @@ class ACIPStandardStacks:
         "bz", "bzl", "brl", "gsh", "bsh", "gs", "bs", "bsl"
     ]
     
+    # Lowercased prefix stacks, for membership tests
+    STD_TIB_STACKS_PREFIX_SET: FrozenSet[str] = frozenset(
+        stack.lower() for stack in STD_TIB_STACKS_PREFIX
+    )
+    
     # Patterns that need special subscript handling
     SUBSCRIPTS = ['r', 'l', 'y', 'w']
     
     @classmethod
     def is_valid_stack(cls, consonants: str) -> bool:
-        """Check if consonant combination is a valid Tibetan stack using regex pattern."""
-        return cls.STD_TIB_PATTERN.match(consonants.lower()) is not None
+        """Check if consonant combination is a valid Tibetan stack (base + [rwy]*)."""
+        return consonants.lower().rstrip('rwy') in cls.STD_TIB_BASES
     
     @classmethod
     def needs_plus(cls, consonants: str) -> bool:
         """Check if consonants need + between them (Sanskrit, etc.)."""
         return not cls.is_valid_stack(consonants)
 
+
+# Module-level names for the compiled patterns the converter uses, so it
+# reaches them without class attribute lookups
+COMMENT_AT = ACIPPatterns.COMMENT_AT
+COMMENT_BRACKET = ACIPPatterns.COMMENT_BRACKET
+PARENS = ACIPPatterns.PARENS
+PARENS_EWTS = ACIPPatterns.PARENS_EWTS
+ASTERISK_ENCODING = ACIPPatterns.ASTERISK_ENCODING
+GA_YAS_PATTERN = ACIPPatterns.GA_YAS_PATTERN
+CONSONANT_TOKEN = ACIPPatterns.CONSONANT_TOKEN
+REVERSE_VOWEL = ACIPPatterns.REVERSE_VOWEL
+REVERSE_VOWEL_AFTER_APOSTROPHE = ACIPPatterns.REVERSE_VOWEL_AFTER_APOSTROPHE
+APOSTROPHE_VOWEL = ACIPPatterns.APOSTROPHE_VOWEL
+A_BEFORE_VOWEL = ACIPPatterns.A_BEFORE_VOWEL
+APOSTROPHE_VARIANTS = ACIPPatterns.APOSTROPHE_VARIANTS
+CONSONANTS_BEFORE_VOWEL = ACIPPatterns.CONSONANTS_BEFORE_VOWEL
+LEADING_ASTERISK = ACIPPatterns.LEADING_ASTERISK
+LEADING_HASH = ACIPPatterns.LEADING_HASH
+ESCAPED_0F38 = ACIPPatterns.ESCAPED_0F38
+INDEPENDENT_VOWEL = ACIPPatterns.INDEPENDENT_VOWEL
+SPACE_NORMALIZE = ACIPPatterns.SPACE_NORMALIZE
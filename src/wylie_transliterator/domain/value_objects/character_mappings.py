@@ -3,7 +3,7 @@ Character Mappings Value Objects
 Immutable mappings between Wylie and Tibetan Unicode characters.
 """
 
-from typing import Dict
+from typing import Dict, FrozenSet
 
 
 class TibetanAlphabet:
@@ -203,19 +203,19 @@ class SyllableRules:
     """
     
     # Valid prescripts
-    PRESCRIPTS = {'g', 'd', 'b', 'm', "'"}
+    PRESCRIPTS: FrozenSet[str] = frozenset({'g', 'd', 'b', 'm', "'"})
     
     # Valid superscripts
-    SUPERSCRIPTS = {'r', 'l', 's'}
+    SUPERSCRIPTS: FrozenSet[str] = frozenset({'r', 'l', 's'})
     
     # Valid superscript + root combinations
     # In Tibetan orthography, superscripts are highly restricted
-    VALID_SUPERSCRIPT_COMBINATIONS = {
-        'r': ['k', 'g', 'ng', 'j', 'ny', 't', 'd', 'n', 'b', 'm', 'ts', 'dz'],
-        'l': ['k', 'g', 'ng', 'c', 'j', 't', 'd', 'p', 'b', 'h'],  # h added for lha
-        's': ['k', 'g', 'ng', 'ny', 't', 'd', 'n', 'p', 'b', 'm', 'ts'],
+    VALID_SUPERSCRIPT_COMBINATIONS: Dict[str, FrozenSet[str]] = {
+        'r': frozenset(['k', 'g', 'ng', 'j', 'ny', 't', 'd', 'n', 'b', 'm', 'ts', 'dz']),
+        'l': frozenset(['k', 'g', 'ng', 'c', 'j', 't', 'd', 'p', 'b', 'h']),  # h added for lha
+        's': frozenset(['k', 'g', 'ng', 'ny', 't', 'd', 'n', 'p', 'b', 'm', 'ts']),
     }
     
     # Valid postscripts  
-    POSTSCRIPTS = {'g', 'ng', 'd', 'n', 'b', 'm', 'r', 'l', 's', "'"}
+    POSTSCRIPTS: FrozenSet[str] = frozenset({'g', 'ng', 'd', 'n', 'b', 'm', 'r', 'l', 's', "'"})
 
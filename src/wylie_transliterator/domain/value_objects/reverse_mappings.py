@@ -3,10 +3,152 @@ Reverse Character Mappings (Tibetan Unicode → Wylie)
 Value object for reverse transliteration following DRY principle.
 """
 
-from typing import Dict
+from collections import defaultdict
+from types import MappingProxyType
+from typing import Dict, Mapping, NamedTuple, Optional, Tuple
 from .character_mappings import TibetanAlphabet
 
 
+class _ReverseTables(NamedTuple):
+    """Reverse lookup tables shared by every ReverseCharacterMappings"""
+    consonants: Dict[str, str]
+    vowels: Dict[str, str]
+    subscripts: Dict[str, str]
+    punctuation: Dict[str, str]
+    sanskrit_marks: Dict[str, str]
+    numerals: Dict[str, str]
+    all_chars: Dict[str, str]
+    consonant_roots: Dict[str, str]
+    compounds: Tuple[Tuple[str, str], ...]
+    compounds_by_first: Dict[str, Tuple[Tuple[str, str], ...]]
+    translate_table: Dict[int, str]
+
+
+def _reverse_dict(mapping: Dict[str, str]) -> Dict[str, str]:
+    """
+    Reverse a dictionary mapping (DRY principle).
+    
+    For conflicts (multiple Wylie → same Unicode), keeps shorter Wylie form.
+    Example: 'v' and 'w' both map to same subscript, keep 'w' (shorter/standard)
+    Among equally short forms the first one in the table wins.
+    """
+    groups = defaultdict(list)
+    for wylie, unicode_char in mapping.items():
+        groups[unicode_char].append(wylie)
+    return {unicode_char: min(forms, key=len) for unicode_char, forms in groups.items()}
+
+
+def _strip_inherent_a(wylie: str) -> str:
+    """Drop the inherent 'a' of a consonant ('Tha' → 'Th'; 'a' itself stays)"""
+    return wylie[:-1] if wylie.endswith('a') and len(wylie) > 1 else wylie
+
+
+def _build_reverse_tables() -> _ReverseTables:
+    """Build the reverse mappings from TibetanAlphabet (done once, at import)"""
+    alphabet = TibetanAlphabet()
+    
+    # Reverse consonants mapping
+    consonants = _reverse_dict(alphabet.CONSONANTS)
+    
+    # Reverse vowels mapping
+    vowels = _reverse_dict(alphabet.VOWELS)
+    
+    # Reverse subscripts mapping
+    subscripts = _reverse_dict(alphabet.SUBSCRIPTS)
+    
+    # Reverse punctuation mapping
+    punctuation = _reverse_dict(alphabet.PUNCTUATION)
+    
+    # Reverse Sanskrit marks mapping
+    sanskrit_marks = _reverse_dict(alphabet.SANSKRIT_MARKS)
+    
+    # Reverse numerals mapping
+    numerals = _reverse_dict(alphabet.NUMERALS)
+    
+    # Reverse Sanskrit retroflex mapping
+    sanskrit_retroflex = _reverse_dict(alphabet.SANSKRIT_RETROFLEX)
+    
+    # Add subjoined consonant forms (U+0F90-0FBC)
+    # These are base consonants (U+0F40-0F6C) + 0x50, without the 'a'
+    subjoined_consonants = {
+        chr(ord(unicode_char) + 0x50): _strip_inherent_a(wylie)
+        for unicode_char, wylie in consonants.items()
+        if 0x0F40 <= ord(unicode_char) <= 0x0F6C
+    }
+    
+    # Build combined lookup for fast access
+    all_chars = {}
+    all_chars.update(consonants)
+    all_chars.update(vowels)
+    all_chars.update(subscripts)
+    all_chars.update(punctuation)
+    all_chars.update(sanskrit_marks)
+    all_chars.update(numerals)
+    all_chars.update(sanskrit_retroflex)
+    all_chars.update(subjoined_consonants)
+    
+    # Special handling for compound vowels
+    # U+0F71 U+0F74 (long a + u) → U
+    compound_U = '\u0F71\u0F74'
+    if compound_U not in all_chars:
+        vowels[compound_U] = 'U'
+        all_chars[compound_U] = 'U'
+    
+    # Special handling for alternative anusvara
+    alt_anusvara = '\u0F83'
+    if alt_anusvara not in all_chars:
+        sanskrit_marks[alt_anusvara] = 'M'
+        all_chars[alt_anusvara] = 'M'
+    
+    # Special handling for kss (ཀྵ = ka + subjoined ssa)
+    kssa = '\u0F40\u0FB5'
+    consonants[kssa] = 'kss'
+    all_chars[kssa] = 'kss'
+    
+    # Base consonants as syllable components, without their inherent 'a'
+    consonant_roots = {
+        unicode_char: _strip_inherent_a(all_chars[unicode_char])
+        for unicode_char in consonants
+        if all_chars[unicode_char]
+    }
+    
+    # Character-level translation: multi-character sequences are replaced
+    # first, then single code points go through one str.translate table
+    compounds = tuple(
+        (unicode_seq, wylie) for unicode_seq, wylie in all_chars.items()
+        if len(unicode_seq) > 1
+    )
+    # Compounds bucketed by first character, longest first, so matching at a
+    # position only looks at sequences that can start there
+    compounds_by_first = {}
+    for unicode_seq, wylie in sorted(compounds, key=lambda item: len(item[0]), reverse=True):
+        compounds_by_first.setdefault(unicode_seq[0], []).append((unicode_seq, wylie))
+    compounds_by_first = {
+        first: tuple(bucket) for first, bucket in compounds_by_first.items()
+    }
+    translate_table = str.maketrans({
+        unicode_char: wylie for unicode_char, wylie in all_chars.items()
+        if len(unicode_char) == 1
+    })
+    
+    return _ReverseTables(
+        consonants=consonants,
+        vowels=vowels,
+        subscripts=subscripts,
+        punctuation=punctuation,
+        sanskrit_marks=sanskrit_marks,
+        numerals=numerals,
+        all_chars=all_chars,
+        consonant_roots=consonant_roots,
+        compounds=compounds,
+        compounds_by_first=compounds_by_first,
+        translate_table=translate_table,
+    )
+
+
+_TABLES = _build_reverse_tables()
+
+
 class ReverseCharacterMappings:
     """
     Immutable reverse mappings from Tibetan Unicode to Wylie.
@@ -15,121 +157,73 @@ class ReverseCharacterMappings:
     - DRY: Generated from existing TibetanAlphabet mappings
     - KISS: Simple dictionary lookups
     - Immutable: Mappings cannot be modified
+    
+    The tables are built once at import; instances only reference them.
     """
     
     def __init__(self):
-        """Initialize reverse mappings from TibetanAlphabet"""
-        alphabet = TibetanAlphabet()
-        
-        # Reverse consonants mapping
-        self._consonants = self._reverse_dict(alphabet.CONSONANTS)
+        """Bind the shared reverse mappings"""
+        self._consonants = _TABLES.consonants
+        self._vowels = _TABLES.vowels
+        self._subscripts = _TABLES.subscripts
+        self._punctuation = _TABLES.punctuation
+        self._sanskrit_marks = _TABLES.sanskrit_marks
+        self._numerals = _TABLES.numerals
+        self._all_chars = _TABLES.all_chars
+        self._consonant_roots = _TABLES.consonant_roots
+        self._compounds = _TABLES.compounds
+        self._compounds_by_first = _TABLES.compounds_by_first
+        self._translate_table = _TABLES.translate_table
         
-        # Reverse vowels mapping
-        self._vowels = self._reverse_dict(alphabet.VOWELS)
-        
-        # Reverse subscripts mapping
-        self._subscripts = self._reverse_dict(alphabet.SUBSCRIPTS)
-        
-        # Reverse punctuation mapping
-        self._punctuation = self._reverse_dict(alphabet.PUNCTUATION)
-        
-        # Reverse Sanskrit marks mapping
-        self._sanskrit_marks = self._reverse_dict(alphabet.SANSKRIT_MARKS)
-        
-        # Reverse numerals mapping
-        self._numerals = self._reverse_dict(alphabet.NUMERALS)
-        
-        # Reverse Sanskrit retroflex mapping
-        self._sanskrit_retroflex = self._reverse_dict(alphabet.SANSKRIT_RETROFLEX)
-        
-        # Add subjoined consonant forms (U+0F90-0FBC)
-        # These are base consonants + 0x50
-        self._subjoined_consonants = {}
-        for wylie, unicode_char in alphabet.CONSONANTS.items():
-            base_code = ord(unicode_char)
-            if 0x0F40 <= base_code <= 0x0F6C:  # Main consonant range
-                subjoined_code = base_code + 0x50
-                subjoined_char = chr(subjoined_code)
-                # Remove 'a' from wylie if present
-                wylie_no_a = wylie[:-1] if wylie.endswith('a') and len(wylie) > 1 else wylie
-                self._subjoined_consonants[subjoined_char] = wylie_no_a
-        
-        # Build combined lookup for fast access
-        self._all_chars = {}
-        self._all_chars.update(self._consonants)
-        self._all_chars.update(self._vowels)
-        self._all_chars.update(self._subscripts)
-        self._all_chars.update(self._punctuation)
-        self._all_chars.update(self._sanskrit_marks)
-        self._all_chars.update(self._numerals)
-        self._all_chars.update(self._sanskrit_retroflex)
-        self._all_chars.update(self._subjoined_consonants)
-        
-        # Special handling for compound vowels
-        # U+0F71 U+0F74 (long a + u) → U
-        compound_U = '\u0F71\u0F74'
-        if compound_U not in self._all_chars:
-            self._vowels[compound_U] = 'U'
-            self._all_chars[compound_U] = 'U'
-        
-        # Special handling for alternative anusvara
-        alt_anusvara = '\u0F83'
-        if alt_anusvara not in self._all_chars:
-            self._sanskrit_marks[alt_anusvara] = 'M'
-            self._all_chars[alt_anusvara] = 'M'
-        
-        # Special handling for kss (ཀྵ = ka + subjoined ssa)
-        kssa = '\u0F40\u0FB5'
-        self._consonants[kssa] = 'kss'
-        self._all_chars[kssa] = 'kss'
-    
-    def _reverse_dict(self, mapping: Dict[str, str]) -> Dict[str, str]:
-        """
-        Reverse a dictionary mapping (DRY principle).
-        
-        For conflicts (multiple Wylie → same Unicode), keeps shorter Wylie form.
-        Example: 'v' and 'w' both map to same subscript, keep 'w' (shorter/standard)
-        """
-        reversed_map = {}
-        for wylie, unicode_char in mapping.items():
-            if unicode_char not in reversed_map or len(wylie) < len(reversed_map[unicode_char]):
-                reversed_map[unicode_char] = wylie
-        return reversed_map
+        # Read-only views returned by the properties, created once
+        self._consonants_view = MappingProxyType(self._consonants)
+        self._vowels_view = MappingProxyType(self._vowels)
+        self._subscripts_view = MappingProxyType(self._subscripts)
+        self._punctuation_view = MappingProxyType(self._punctuation)
+        self._sanskrit_marks_view = MappingProxyType(self._sanskrit_marks)
+        self._numerals_view = MappingProxyType(self._numerals)
+        self._all_chars_view = MappingProxyType(self._all_chars)
+        self._consonant_roots_view = MappingProxyType(self._consonant_roots)
     
     @property
-    def consonants(self) -> Dict[str, str]:
+    def consonants(self) -> Mapping[str, str]:
         """Tibetan consonants (Unicode → Wylie)"""
-        return self._consonants.copy()
+        return self._consonants_view
     
     @property
-    def vowels(self) -> Dict[str, str]:
+    def vowels(self) -> Mapping[str, str]:
         """Tibetan vowels (Unicode → Wylie)"""
-        return self._vowels.copy()
+        return self._vowels_view
     
     @property
-    def subscripts(self) -> Dict[str, str]:
+    def subscripts(self) -> Mapping[str, str]:
         """Tibetan subscripts (Unicode → Wylie)"""
-        return self._subscripts.copy()
+        return self._subscripts_view
     
     @property
-    def punctuation(self) -> Dict[str, str]:
+    def punctuation(self) -> Mapping[str, str]:
         """Tibetan punctuation (Unicode → Wylie)"""
-        return self._punctuation.copy()
+        return self._punctuation_view
     
     @property
-    def sanskrit_marks(self) -> Dict[str, str]:
+    def sanskrit_marks(self) -> Mapping[str, str]:
         """Sanskrit marks (Unicode → Wylie)"""
-        return self._sanskrit_marks.copy()
+        return self._sanskrit_marks_view
     
     @property
-    def numerals(self) -> Dict[str, str]:
+    def numerals(self) -> Mapping[str, str]:
         """Tibetan numerals (Unicode → Wylie)"""
-        return self._numerals.copy()
+        return self._numerals_view
     
     @property
-    def all_characters(self) -> Dict[str, str]:
+    def all_characters(self) -> Mapping[str, str]:
         """All character mappings combined (Unicode → Wylie)"""
-        return self._all_chars.copy()
+        return self._all_chars_view
+    
+    @property
+    def consonant_roots(self) -> Mapping[str, str]:
+        """Consonants without their inherent 'a' (Unicode → Wylie, e.g. 'ཀ' → 'k')"""
+        return self._consonant_roots_view
     
     def get_wylie(self, unicode_char: str) -> str:
         """
@@ -146,13 +240,39 @@ class ReverseCharacterMappings:
             >>> mappings.get_wylie('ཀ')  # 'ka'
             >>> mappings.get_wylie('ི')  # 'i'
         """
-        # Try compound characters first (multi-char Unicode sequences)
-        if len(unicode_char) > 1 and unicode_char in self._all_chars:
-            return self._all_chars[unicode_char]
-        
-        # Try single character
         return self._all_chars.get(unicode_char, '')
     
+    def match_compound(self, text: str, pos: int = 0) -> Tuple[Optional[str], int]:
+        """
+        Match a multi-character sequence (e.g. ཀྵ 'kss', ཱུ 'U') at pos.
+        
+        Returns:
+            (wylie, consumed) for the longest compound starting at pos,
+            or (None, 0)
+        """
+        if pos < len(text):
+            for unicode_seq, wylie in self._compounds_by_first.get(text[pos], ()):
+                if text.startswith(unicode_seq, pos):
+                    return wylie, len(unicode_seq)
+        return None, 0
+    
+    def translate_text(self, text: str) -> str:
+        """
+        Replace every mapped character in text with its Wylie representation.
+        
+        This is a plain character-level substitution without syllable
+        analysis (no inherent vowels, stacking or tsheg handling), suited to
+        text made only of numerals and punctuation. Unmapped characters are
+        kept as-is.
+        
+        Example:
+            >>> mappings = ReverseCharacterMappings()
+            >>> mappings.translate_text('༡༩༥༩།')  # '1959/'
+        """
+        for unicode_seq, wylie in self._compounds:
+            text = text.replace(unicode_seq, wylie)
+        return text.translate(self._translate_table)
+    
     def is_consonant(self, unicode_char: str) -> bool:
         """Check if character is a Tibetan consonant"""
         return unicode_char in self._consonants
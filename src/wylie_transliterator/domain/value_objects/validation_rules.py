@@ -3,8 +3,12 @@ Validation Rules Value Objects
 Encapsulates EWTS validation rules as immutable value objects.
 """
 
-from typing import Dict, Set, FrozenSet
-from dataclasses import dataclass
+from typing import Dict, Set, FrozenSet, Tuple
+from dataclasses import dataclass, field
+
+
+# Summary of a result without errors
+_VALID_SUMMARY = "✓ Valid Extended Wylie"
 
 
 @dataclass(frozen=True)
@@ -29,6 +33,12 @@ class SyllableStructureRules:
     # Valid second postscripts (post-suffix)
     VALID_SECOND_POSTSCRIPTS: FrozenSet[str] = None
     
+    # The combinations above flattened to (head, root) pairs, so checking a
+    # combination is a single set lookup (derived, not constructor arguments)
+    VALID_PRESCRIPT_PAIRS: FrozenSet[Tuple[str, str]] = field(init=False, repr=False, compare=False)
+    VALID_SUPERSCRIPT_PAIRS: FrozenSet[Tuple[str, str]] = field(init=False, repr=False, compare=False)
+    VALID_SUBSCRIPT_PAIRS: FrozenSet[Tuple[str, str]] = field(init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         """Initialize frozen sets for immutability"""
         if self.VALID_PRESCRIPT_COMBINATIONS is None:
@@ -76,6 +86,15 @@ class SyllableStructureRules:
             # Valid post-suffix consonants (only after specific suffixes)
             object.__setattr__(self, 'VALID_SECOND_POSTSCRIPTS',
                              frozenset(['s', 'd']))
+        
+        for pairs, combinations in (
+            ('VALID_PRESCRIPT_PAIRS', self.VALID_PRESCRIPT_COMBINATIONS),
+            ('VALID_SUPERSCRIPT_PAIRS', self.VALID_SUPERSCRIPT_COMBINATIONS),
+            ('VALID_SUBSCRIPT_PAIRS', self.VALID_SUBSCRIPT_COMBINATIONS),
+        ):
+            object.__setattr__(self, pairs, frozenset(
+                (head, root) for head, roots in combinations.items() for root in roots
+            ))
 
 
 @dataclass(frozen=True)
@@ -93,7 +112,7 @@ class ValidationErrorType:
     AMBIGUOUS_PARSING: str = "ambiguous_parsing"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ValidationError:
     """Represents a single validation error"""
     error_type: str
@@ -109,7 +128,7 @@ class ValidationError:
         return result
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ValidationResult:
     """Result of validation with detailed error information"""
     is_valid: bool
@@ -122,16 +141,16 @@ class ValidationResult:
     def get_error_summary(self) -> str:
         """Get human-readable summary of errors"""
         if self.is_valid:
-            return "✓ Valid Extended Wylie"
+            return _VALID_SUMMARY
         
-        summary = [f"✗ Found {len(self.errors)} error(s):"]
-        for error in self.errors:
-            summary.append(f"  - {error}")
+        summary = [
+            f"✗ Found {len(self.errors)} error(s):",
+            *(f"  - {error}" for error in self.errors),
+        ]
         
         if self.warnings:
             summary.append(f"\n⚠ {len(self.warnings)} warning(s):")
-            for warning in self.warnings:
-                summary.append(f"  - {warning}")
+            summary.extend(f"  - {warning}" for warning in self.warnings)
         
         return "\n".join(summary)
 
@@ -3,17 +3,60 @@ File Processor - Infrastructure Layer
 Handles file I/O operations for transliteration.
 """
 
+import mmap
+import os
 import re
-from pathlib import Path
-from typing import Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
 from ..application.transliteration_service import TransliterationService, TransliterationStatistics
 
 
+# Files at least this large are decoded straight from a memory map; below it
+# the mapping setup costs more than the copy it saves
+MMAP_THRESHOLD = 64 * 1024
+
+# Files at least this large are transliterated in chunks of about CHUNK_SIZE
+# bytes, so memory stays bounded however big the input is
+STREAM_THRESHOLD = 256 * 1024
+CHUNK_SIZE = 1024 * 1024
+
+# Chunks end after a newline, space or tsheg: transliteration never carries
+# state across these, so the chunks convert exactly like the whole text
+_CHUNK_BOUNDARY_RE = re.compile(b'[\n ]|\xe0\xbc\x8b')
+
+# UTF-8 encodes U+0F00..U+0FFF as 0xE0 followed by 0xBC..0xBF, and 0xE0 is
+# always a lead byte, so each of these pairs marks exactly one Tibetan char
+_TIBETAN_UTF8_PREFIXES = (b'\xe0\xbc', b'\xe0\xbd', b'\xe0\xbe', b'\xe0\xbf')
+
+
+def _universal_newlines(text: str) -> str:
+    """Translate CRLF and lone CR line endings to LF, as text mode would"""
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def _encode_output(text: str) -> bytes:
+    """Encode output as text-mode writing would (platform line endings, UTF-8)"""
+    if os.linesep != '\n':
+        text = text.replace('\n', os.linesep)
+    # Wylie output is normally pure ASCII (an O(1) check on str), and the
+    # ASCII codec copies it without the UTF-8 encoder's per-character work
+    if text.isascii():
+        return text.encode('ascii')
+    return text.encode('utf-8')
+
+
 class FileProcessor:
     """Infrastructure service for file-based transliteration"""
     
     def __init__(self, service: TransliterationService):
         self.service = service
+        # Service method per explicit mode, looked up with one dict probe
+        self._dispatch = {
+            'w': service.transliterate_wylie_to_tibetan,   # Wylie → Tibetan
+            't': service.transliterate_tibetan_to_wylie,   # Tibetan → Wylie
+        }
     
     def process_file(
         self,
@@ -36,24 +79,31 @@ class FileProcessor:
             FileNotFoundError: If input file doesn't exist
             ValueError: If mode is invalid
         """
-        # Read input
+        # An explicit mode is resolved before any I/O; only 'auto' needs to
+        # look at the input
+        transliterate = None if mode == 'auto' else self._transliterator_for(mode)
+        
+        if self._file_size(input_path) >= STREAM_THRESHOLD:
+            return self._process_chunks(input_path, output_path, transliterate)
+        
+        # Read input, counting its lines while the text is still in cache
         input_text = self._read_file(input_path)
         
-        # Auto-detect mode if needed
-        if mode == 'auto':
-            mode = self._detect_mode(input_text)
+        # An empty file converts to an empty file in either mode
+        if not input_text:
+            self._write_file(output_path, '')
+            return TransliterationStatistics(
+                input_chars=0, output_chars=0, input_lines=1, output_lines=1
+            )
         
-        # Validate mode
-        if mode not in ['t', 'w']:
-            raise ValueError(f"Invalid mode: {mode}. Must be 'w', 't', or 'auto'")
+        input_lines = input_text.count('\n') + 1
+        
+        # Auto-detect mode if needed
+        if transliterate is None:
+            transliterate = self._transliterator_for(self._detect_mode(input_text))
         
         # Transliterate
-        if mode == 'w':
-            # Wylie → Tibetan
-            output_text = self.service.transliterate_wylie_to_tibetan(input_text)
-        elif mode == 't':
-            # Tibetan → Wylie
-            output_text = self.service.transliterate_tibetan_to_wylie(input_text)
+        output_text = transliterate(input_text)
         
         # Write output
         self._write_file(output_path, output_text)
@@ -62,30 +112,207 @@ class FileProcessor:
         stats = TransliterationStatistics(
             input_chars=len(input_text),
             output_chars=len(output_text),
-            input_lines=input_text.count('\n') + 1,
-            output_lines=output_text.count('\n') + 1
+            input_lines=input_lines,
+            # Transliteration keeps newlines one for one
+            output_lines=input_lines
         )
         
         return stats
     
+    def process_files(
+        self,
+        pairs: Sequence[Tuple[str, str]],
+        mode: str = 'auto',
+        workers: Optional[int] = None
+    ) -> List[TransliterationStatistics]:
+        """
+        Process many files, overlapping their reads and writes.
+        
+        Args:
+            pairs: (input_path, output_path) for each file
+            mode: 'w' (wylie→tibetan), 't' (tibetan→wylie), or 'auto'
+            workers: Number of worker threads (default: CPU count)
+            
+        Returns:
+            Statistics for each file, in the order of pairs
+            
+        Raises:
+            FileNotFoundError, ValueError, IOError: As process_file, for the
+            first file (in order of pairs) that fails
+        """
+        # A single file gains nothing from a pool: process it synchronously
+        if len(pairs) <= 1:
+            return [self.process_file(input_path, output_path, mode)
+                    for input_path, output_path in pairs]
+        
+        # Transliteration itself holds the GIL; the pool overlaps the
+        # blocking open/read/write calls of different files with it
+        with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            return list(pool.map(
+                lambda pair: self.process_file(pair[0], pair[1], mode),
+                pairs
+            ))
+    
+    def _process_chunks(
+        self,
+        input_path: str,
+        output_path: str,
+        transliterate: Optional[Callable[[str], str]]
+    ) -> TransliterationStatistics:
+        """
+        Stream a large file through the transliterator chunk by chunk.
+        
+        transliterate is the service method for an explicit mode, or None to
+        auto-detect the mode from the first chunk.
+        """
+        chunks = self._read_chunks(input_path)
+        first_chunk = next(chunks, '')
+        
+        # Auto-detect mode from the start of the file
+        if transliterate is None:
+            transliterate = self._transliterator_for(self._detect_mode(first_chunk))
+        
+        input_chars = output_chars = 0
+        input_lines = 1
+        # Stream into a temporary file next to the output, and move it into
+        # place only once the whole input has converted: a decode error late
+        # in the file leaves any existing output untouched
+        temp_path, output = self._open_output(output_path)
+        try:
+            with output:
+                chunk = first_chunk
+                while chunk:
+                    output_chunk = transliterate(chunk)
+                    self._write_chunk(output, output_path, output_chunk)
+                    input_chars += len(chunk)
+                    output_chars += len(output_chunk)
+                    input_lines += chunk.count('\n')
+                    chunk = next(chunks, '')
+            self._replace_output(temp_path, output_path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+        
+        return TransliterationStatistics(
+            input_chars=input_chars,
+            output_chars=output_chars,
+            input_lines=input_lines,
+            # Transliteration keeps newlines one for one
+            output_lines=input_lines
+        )
+    
+    def _transliterator_for(self, mode: str):
+        """Return the service method for mode 'w' or 't'"""
+        transliterate = self._dispatch.get(mode)
+        if transliterate is None:
+            raise ValueError(f"Invalid mode: {mode}. Must be 'w', 't', or 'auto'")
+        return transliterate
+    
+    def _file_size(self, path: str) -> int:
+        """Size of the input file in bytes"""
+        try:
+            return os.stat(path).st_size
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Input file not found: {path}")
+        except Exception as e:
+            raise IOError(f"Error reading file {path}: {e}")
+    
+    def _read_chunks(self, path: str) -> Iterator[str]:
+        """Yield the decoded file in chunks that end on a syllable boundary"""
+        try:
+            with open(path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                size = len(mapped)
+                start = 0
+                while start < size:
+                    boundary = _CHUNK_BOUNDARY_RE.search(mapped, start + CHUNK_SIZE)
+                    end = boundary.end() if boundary else size
+                    with memoryview(mapped)[start:end] as view:
+                        chunk = str(view, 'utf-8')
+                    yield _universal_newlines(chunk)
+                    start = end
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Input file not found: {path}")
+        except UnicodeDecodeError as e:
+            # The decoder counts from the start of the chunk; report the
+            # position in the file, as a whole-file decode would
+            if e.end - e.start == 1:
+                where = f"byte 0x{e.object[e.start]:02x} in position {start + e.start}"
+            else:
+                where = f"bytes in position {start + e.start}-{start + e.end - 1}"
+            raise IOError(f"Error reading file {path}: '{e.encoding}' codec "
+                          f"can't decode {where}: {e.reason}")
+        except Exception as e:
+            raise IOError(f"Error reading file {path}: {e}")
+    
     def _read_file(self, path: str) -> str:
         """Read file with UTF-8 encoding"""
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                return f.read()
+            with open(path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+                    text = str(f.read(), 'utf-8')
+                else:
+                    # Decode from the mapped pages: no intermediate bytes copy
+                    # of the whole file, and the kernel pages it in on demand
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        text = str(mapped, 'utf-8')
+            return _universal_newlines(text)
         except FileNotFoundError:
             raise FileNotFoundError(f"Input file not found: {path}")
         except Exception as e:
             raise IOError(f"Error reading file {path}: {e}")
     
+    def _open_output(self, path: str):
+        """
+        Open a new temporary file in the directory of path, creating
+        directories if needed.
+        
+        Returns:
+            (temporary path, file open for binary writing)
+        """
+        try:
+            self._ensure_parent_dir(path)
+            # Exclusive create: never clobbers a file, and unlike mkstemp
+            # keeps the default permissions the output would have had
+            temp_path = f"{path}.{os.urandom(4).hex()}.tmp"
+            return temp_path, open(temp_path, 'xb')
+        except Exception as e:
+            raise IOError(f"Error writing file {path}: {e}")
+    
+    def _replace_output(self, temp_path: str, path: str) -> None:
+        """Move a completed temporary file onto the output path"""
+        try:
+            os.replace(temp_path, path)
+        except Exception as e:
+            raise IOError(f"Error writing file {path}: {e}")
+    
+    def _ensure_parent_dir(self, path: str) -> None:
+        """Create the directory that will hold path, if it is missing"""
+        # A bare file name lives in the working directory: nothing to create
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+    
+    def _write_chunk(self, output, path: str, content: str) -> None:
+        """Append content to an open output file"""
+        try:
+            output.write(_encode_output(content))
+        except Exception as e:
+            raise IOError(f"Error writing file {path}: {e}")
+    
     def _write_file(self, path: str, content: str) -> None:
         """Write file with UTF-8 encoding, creating directories if needed"""
         try:
-            output_file = Path(path)
-            output_file.parent.mkdir(parents=True, exist_ok=True)
+            data = _encode_output(content)
+            self._ensure_parent_dir(path)
             
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            # Pre-encoded bytes skip the text layer's incremental encoder and
+            # its extra buffer copy
+            with open(path, 'wb') as f:
+                f.write(data)
         except Exception as e:
             raise IOError(f"Error writing file {path}: {e}")
     
@@ -97,16 +324,24 @@ class FileProcessor:
             'w' for Wylie input (transliterate to Tibetan)
             't' for Tibetan input (transliterate to Wylie)
         """
+        # ASCII text has no Tibetan at all; str keeps this as a flag, so
+        # pure Wylie input is answered without copying a sample
+        if text.isascii():
+            return 'w'
         # Sample first 500 chars
         sample = text[:500]
+        if sample.isascii():
+            return 'w'
+        sample_len = len(sample)
+        data = sample.encode('utf-8', 'surrogatepass')
         
-        # Count Tibetan Unicode characters (U+0F00 to U+0FFF)
-        tibetan_chars = len(re.findall(r'[\u0F00-\u0FFF]', sample))
+        # Count Tibetan Unicode characters (U+0F00 to U+0FFF) with C-level
+        # substring counts instead of a regex walk
+        tibetan_chars = sum(data.count(prefix) for prefix in _TIBETAN_UTF8_PREFIXES)
         
         # If more than 30% is Tibetan Unicode, it's Tibetan
-        if len(sample) > 0 and tibetan_chars / len(sample) > 0.3:
+        if sample_len > 0 and tibetan_chars / sample_len > 0.3:
             return 't'  # Tibetan to Wylie
         
         # Otherwise assume Wylie input
         return 'w'  # Wylie to Tibetan
-
@@ -0,0 +1,26 @@
+"""
+Precomputed forward forms for the bidirectional reverse-transliteration
+tests.
+
+Maps each Wylie input to its Tibetan Unicode, so the round-trip tests only
+run the reverse direction. test_bidirectional_fixtures_forward checks that
+the table still matches the forward transliterator.
+"""
+
+_BIDI_SIMPLE = {
+    'ka': 'ཀ',
+    'kha': 'ཁ',
+    'ga': 'ག',
+    'pa': 'པ',
+    'ma': 'མ',
+    'bla': 'བླ',
+    'rka': 'རྐ',
+    'ska': 'སྐ',
+    'bya': 'བྱ',
+}
+
+_BIDI_WORDS = {
+    'bla ma': 'བླ་མ',
+    'sangs rgyas': 'སངས་རྒྱས',
+    'byang chub': 'བྱང་ཆུབ',
+}
@@ -0,0 +1,58 @@
+"""
+Shared fixtures for the test suites.
+
+Builds the transliteration and validation services once per process, on
+first use, so every suite reuses the same instances and their lookup
+tables, and collecting the tests does not import the services.
+
+Every suite imports this module first, so its sys.path setup (src/ and
+the pyewts checkouts) applies whether the suites run under pytest, under
+python -m unittest, or as scripts.
+"""
+
+import os
+import sys
+from functools import cache, lru_cache
+from importlib.util import find_spec
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Add src to path when the package is not installed (pip install -e .)
+if find_spec("wylie_transliterator") is None:
+    sys.path.insert(0, str(ROOT / 'src'))
+
+# Add the pyewts checkout directories for pyewts and ACIP, if present:
+# ../pyewts, the repository's parent, and the older ../../pyewts layout
+for pyewts_path in (ROOT.parent / 'pyewts', ROOT.parent, ROOT.parent.parent,
+                    ROOT.parent.parent / 'pyewts'):
+    if pyewts_path.exists() and str(pyewts_path) not in sys.path:
+        sys.path.insert(0, str(pyewts_path))
+
+# Check table-driven cases one subtest per row instead of in one batch
+# (slower, but names the failing row)
+VERBOSE_SUBTESTS = bool(os.environ.get('VERBOSE_SUBTESTS'))
+
+
+@cache
+def get_service():
+    """The shared TransliterationService"""
+    from wylie_transliterator.application.transliteration_service import TransliterationService
+    return TransliterationService()
+
+
+@cache
+def get_validation_service():
+    """The shared ValidationService"""
+    from wylie_transliterator.application.validation_service import ValidationService
+    return ValidationService()
+
+
+@lru_cache(maxsize=256)
+def validate(wylie_text):
+    """validate_wylie on the shared service, memoized
+
+    Safe to share: ValidationResult is immutable (frozen, with tuple
+    errors and warnings).
+    """
+    return get_validation_service().validate_wylie(wylie_text)
@@ -0,0 +1,160 @@
+"""
+Shared base for the pyewts comparison suites.
+
+Holds the pyewts import gate, the memoized reference/service results and
+the comparison helpers, so each suite only contains its test tables.
+"""
+
+import unittest
+from functools import cache, lru_cache
+import unicodedata
+
+# First, so its sys.path setup can find a pyewts checkout
+from _fixtures import get_service
+
+try:
+    import pyewts
+    PYEWTS_AVAILABLE = True
+except ImportError:
+    PYEWTS_AVAILABLE = False
+
+
+# One pyewts instance for every comparison suite (and the service shared by
+# all suites), built on first use, with their results memoized once per
+# session: inputs repeat across suites
+
+@cache
+def get_pyewts():
+    """The shared pyewts converter"""
+    return pyewts.pyewts()
+
+
+@cache
+def memoized(method):
+    """The shared lru_cache wrapper of a converter method"""
+    return lru_cache(maxsize=None)(method)
+
+
+# Separator for batched service calls (see _batch_w2t)
+BATCH_SEPARATOR = '\n'
+
+
+@lru_cache(maxsize=None)
+def _normalize(form, text):
+    """Unicode-normalize text, memoized: the expected side repeats across tests"""
+    return unicodedata.normalize(form, text)
+
+
+@unittest.skipUnless(PYEWTS_AVAILABLE, "pyewts not available for comparison")
+class _PyewtsCompareBase(unittest.TestCase):
+    """Compare python-wylie-transliteration with pyewts"""
+
+    # Default spacing for _compare, and the Unicode normalization form (if
+    # any) applied to both sides before comparing
+    preserve_spaces = False
+    normalization = None
+    # Wylie inputs whose (normalized) expected output is tabulated once in
+    # setUpClass; other inputs fall back to the memoized pyewts call
+    cases = ()
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pyewts = get_pyewts()
+        cls.expected_unicode = staticmethod(memoized(cls.pyewts.toUnicode))
+        cls.expected_wylie = staticmethod(memoized(cls.pyewts.toWylie))
+        cls.service = get_service()
+        cls.to_tibetan = staticmethod(memoized(cls.service.transliterate_wylie_to_tibetan))
+        cls.to_wylie = staticmethod(memoized(cls.service.transliterate_tibetan_to_wylie))
+        cls.expected_table = {wylie: cls._expected_for(wylie) for wylie in cls.cases}
+
+    @classmethod
+    def _expected_for(cls, wylie_input):
+        """pyewts' Tibetan for wylie_input, in the suite's normalization form"""
+        expected = cls.expected_unicode(wylie_input)
+        if cls.normalization:
+            expected = _normalize(cls.normalization, expected)
+        return expected
+
+    def _compare(self, wylie_input, preserve_spaces=None):
+        """Helper to compare Wylie → Tibetan outputs"""
+        if preserve_spaces is None:
+            preserve_spaces = self.preserve_spaces
+        expected = self.expected_table.get(wylie_input)
+        if expected is None:
+            expected = self._expected_for(wylie_input)
+        result = self.to_tibetan(wylie_input, preserve_spaces=preserve_spaces)
+
+        if self.normalization:
+            result = _normalize(self.normalization, result)
+
+        if result != expected:
+            self.fail(f"\nInput: {wylie_input}\nExpected: {expected}\nGot: {result}")
+
+    def _compare_reverse(self, tibetan_unicode):
+        """Helper to compare Tibetan → Wylie outputs"""
+        expected = self.expected_wylie(tibetan_unicode)
+        result = self.to_wylie(tibetan_unicode)
+
+        if result != expected:
+            self.fail(f"\nTibetan: {tibetan_unicode}\nExpected: {expected}\nGot: {result}")
+
+    def _compare_roundtrip(self, wylie_input):
+        """Helper to test roundtrip: Wylie → Unicode → Wylie"""
+        # Forward
+        unicode_result = self.to_tibetan(wylie_input, preserve_spaces=True)
+        expected_unicode = self.expected_unicode(wylie_input)
+
+        # Backward: each side roundtrips its own forward result, which
+        # reuses the service's result as pyewts' pivot when the two agree
+        wylie_result = self.to_wylie(unicode_result)
+        if unicode_result == expected_unicode:
+            expected_wylie = self.expected_wylie(unicode_result)
+        else:
+            expected_wylie = self.expected_wylie(expected_unicode)
+
+        if wylie_result != expected_wylie:
+            self.fail(f"\nOriginal: {wylie_input}\nUnicode: {unicode_result}\n"
+                      f"Roundtrip: {wylie_result}\nExpected: {expected_wylie}")
+
+    def _compare_batch(self, cases, preserve_spaces=None):
+        """Compare a homogeneous group of cases in one assertion"""
+        if preserve_spaces is None:
+            preserve_spaces = self.preserve_spaces
+        expected = [self.expected_table.get(wylie) or self._expected_for(wylie)
+                    for wylie in cases]
+        result = self._batch_w2t(cases, preserve_spaces)
+
+        if self.normalization:
+            result = [_normalize(self.normalization, text) for text in result]
+
+        self.assertListEqual(result, expected)
+
+    def _batch_w2t(self, cases, preserve_spaces):
+        """Transliterate all cases in one service call, one line per case"""
+        # Newlines pass through the transliterator unchanged; fall back to
+        # per-case calls if a case spans lines or the split does not line up
+        if not any(BATCH_SEPARATOR in wylie for wylie in cases):
+            result = self.to_tibetan(BATCH_SEPARATOR.join(cases),
+                                     preserve_spaces=preserve_spaces)
+            result = result.split(BATCH_SEPARATOR)
+            if len(result) == len(cases):
+                return result
+        return [self.to_tibetan(wylie, preserve_spaces=preserve_spaces) for wylie in cases]
+
+    def _compare_each(self, cases, **kwargs):
+        """Compare every case in its own subtest"""
+        for wylie in cases:
+            with self.subTest(wylie=wylie):
+                self._compare(wylie, **kwargs)
+
+    def _compare_reverse_each(self, cases):
+        """Compare every Tibetan case in its own subtest"""
+        for tibetan in cases:
+            with self.subTest(tibetan=tibetan):
+                self._compare_reverse(tibetan)
+
+    def _compare_roundtrip_each(self, cases):
+        """Roundtrip every Wylie case in its own subtest"""
+        for wylie in cases:
+            with self.subTest(wylie=wylie):
+                self._compare_roundtrip(wylie)
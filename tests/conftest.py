@@ -1,26 +1,39 @@
 """
 Pytest configuration for Wylie Transliterator tests.
 
-Automatically configures Python path to find:
-1. The wylie_transliterator module (from src/)
-2. The pyewts module (from ../../pyewts/)
+Makes the shared test helpers in tests/ (e.g. _fixtures, _pyewts_base)
+importable. Importing _fixtures then makes wylie_transliterator (from
+src/, unless installed, e.g. with `pip install -e .`) and the pyewts and
+ACIP modules (from a sibling checkout, if present) importable, as it does
+for every suite.
+
+Each test class is also put in its own xdist_group, so that with
+`pytest -n auto --dist loadgroup` a class (and its setUpClass) runs on a
+single pytest-xdist worker while the classes spread across workers.
 """
 
 import sys
 from pathlib import Path
 
-# Add src/ to path for wylie_transliterator
-src_path = Path(__file__).parent.parent / "src"
-if str(src_path) not in sys.path:
-    sys.path.insert(0, str(src_path))
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Add tests/ for the shared helpers, as when a suite is run as a script
+tests_path = str(ROOT / "tests")
+if tests_path not in sys.path:
+    sys.path.insert(0, tests_path)
+
+import _fixtures  # noqa: E402,F401  (sys.path setup for src/ and pyewts)
+
 
-# Add parent directory for pyewts
-pyewts_path = Path(__file__).parent.parent.parent / "pyewts"
-if pyewts_path.exists() and str(pyewts_path) not in sys.path:
-    sys.path.insert(0, str(pyewts_path))
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run the group's tests on one pytest-xdist worker"
+    )
 
-# Add parent directory for ACIP module
-parent_path = Path(__file__).parent.parent.parent
-if str(parent_path) not in sys.path:
-    sys.path.insert(0, str(parent_path))
 
+def pytest_collection_modifyitems(items):
+    for item in items:
+        if item.cls is not None:
+            item.add_marker(pytest.mark.xdist_group(item.cls.__name__))
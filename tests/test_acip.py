@@ -12,8 +12,9 @@ from src.wylie_transliterator.domain.services.acip_converter import ACIPConverte
 class TestACIPToEWTS(unittest.TestCase):
     """Test ACIP to EWTS conversion."""
     
-    def setUp(self):
-        self.converter = ACIPConverter()
+    @classmethod
+    def setUpClass(cls):
+        cls.converter = ACIPConverter()
     
     def test_simple_word(self):
         """Test simple ACIP word conversion."""
@@ -101,8 +102,9 @@ class TestACIPToEWTS(unittest.TestCase):
 class TestEWTSToACIP(unittest.TestCase):
     """Test EWTS to ACIP conversion."""
     
-    def setUp(self):
-        self.converter = ACIPConverter()
+    @classmethod
+    def setUpClass(cls):
+        cls.converter = ACIPConverter()
     
     def test_simple_reverse(self):
         """Test simple EWTS to ACIP."""
@@ -142,8 +144,9 @@ class TestEWTSToACIP(unittest.TestCase):
 class TestACIPToUnicode(unittest.TestCase):
     """Test ACIP to Tibetan Unicode conversion."""
     
-    def setUp(self):
-        self.service = ACIPService()
+    @classmethod
+    def setUpClass(cls):
+        cls.service = ACIPService()
     
     def test_simple_word_to_unicode(self):
         """Test simple ACIP to Unicode."""
@@ -185,8 +188,9 @@ class TestACIPToUnicode(unittest.TestCase):
 class TestUnicodeToACIP(unittest.TestCase):
     """Test Tibetan Unicode to ACIP conversion."""
     
-    def setUp(self):
-        self.service = ACIPService()
+    @classmethod
+    def setUpClass(cls):
+        cls.service = ACIPService()
     
     def test_simple_unicode_to_acip(self):
         """Test simple Unicode to ACIP."""
@@ -212,8 +216,9 @@ class TestUnicodeToACIP(unittest.TestCase):
 class TestACIPBatchOperations(unittest.TestCase):
     """Test batch ACIP operations."""
     
-    def setUp(self):
-        self.service = ACIPService()
+    @classmethod
+    def setUpClass(cls):
+        cls.service = ACIPService()
     
     def test_batch_acip_to_unicode(self):
         """Test batch conversion from ACIP to Unicode."""
@@ -239,8 +244,9 @@ class TestACIPBatchOperations(unittest.TestCase):
 class TestACIPFormatDetection(unittest.TestCase):
     """Test format auto-detection."""
     
-    def setUp(self):
-        self.service = ACIPService()
+    @classmethod
+    def setUpClass(cls):
+        cls.service = ACIPService()
     
     def test_detect_acip(self):
         """Test detection of ACIP format."""
@@ -287,8 +293,9 @@ class TestACIPFormatDetection(unittest.TestCase):
 class TestACIPAutoConvert(unittest.TestCase):
     """Test auto-conversion with format detection."""
     
-    def setUp(self):
-        self.service = ACIPService()
+    @classmethod
+    def setUpClass(cls):
+        cls.service = ACIPService()
     
     def test_auto_convert_acip(self):
         """Test auto-convert from ACIP."""
@@ -309,8 +316,9 @@ class TestACIPAutoConvert(unittest.TestCase):
 class TestACIPEdgeCases(unittest.TestCase):
     """Test ACIP edge cases and special characters."""
     
-    def setUp(self):
-        self.service = ACIPService()
+    @classmethod
+    def setUpClass(cls):
+        cls.service = ACIPService()
     
     def test_acip_comments(self):
         """Test ACIP comment removal."""
@@ -354,8 +362,9 @@ class TestACIPEdgeCases(unittest.TestCase):
 class TestACIPRoundtrip(unittest.TestCase):
     """Test roundtrip conversion (ACIP → Unicode → ACIP)."""
     
-    def setUp(self):
-        self.service = ACIPService()
+    @classmethod
+    def setUpClass(cls):
+        cls.service = ACIPService()
     
     def test_roundtrip_simple(self):
         """Test simple roundtrip conversion."""
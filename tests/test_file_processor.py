@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Test Suite for File Processing
+Tests file transliteration: single-shot and chunked reads, line endings,
+batch processing and error handling.
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from _fixtures import get_service
+from wylie_transliterator.infrastructure import file_processor
+from wylie_transliterator.infrastructure.file_processor import FileProcessor
+
+
+# Wylie text with every chunk boundary kind: spaces, newlines, punctuation
+_WYLIE_TEXT = (
+    "bla ma sangs rgyas/ byang chub sems dpa'\n"
+    "bsgrubs oM ma Ni pa dme hUM|\n"
+    "\n"
+    "1959 dkon mchog gsum la skyabs su mchi'o//\n"
+) * 20
+
+# Tibetan text: multibyte UTF-8 throughout, tsheg boundaries between syllables
+_TIBETAN_TEXT = (
+    "བླ་མ་སངས་རྒྱས། བྱང་ཆུབ་སེམས་དཔའ\n"
+    "བསྒྲུབས་ཨོཾ་མ་ཎི་པ་དམེ་ཧཱུཾ༑\n"
+) * 20
+
+
+class TestFileProcessor(unittest.TestCase):
+    """Test suite for FileProcessor"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Use the service shared by all suites"""
+        cls.processor = FileProcessor(get_service())
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.dir = Path(temp_dir.name)
+
+    def _write_input(self, name, data):
+        """Write raw bytes to an input file and return its path"""
+        path = self.dir / name
+        path.write_bytes(data)
+        return str(path)
+
+    def _process(self, data, mode='auto', **overrides):
+        """Process data as a file; return (output bytes, statistics)
+
+        overrides patch module settings, e.g. STREAM_THRESHOLD=0 to force
+        the chunked path.
+        """
+        input_path = self._write_input('input.txt', data)
+        output_path = str(self.dir / 'output.txt')
+        with mock.patch.dict(vars(file_processor), overrides):
+            stats = self.processor.process_file(input_path, output_path, mode)
+        return Path(output_path).read_bytes(), stats
+
+    # === CHUNKED PROCESSING ===
+
+    def test_chunked_matches_single_shot(self):
+        """Test that chunked output equals single-shot output"""
+        for text in (_WYLIE_TEXT, _TIBETAN_TEXT):
+            data = text.encode('utf-8')
+            expected = self._process(data)
+            # Chunk sizes that land on, and inside, multibyte characters
+            for chunk_size in (1, 2, 7, 64, 1000):
+                with self.subTest(text=text[:10], chunk_size=chunk_size):
+                    result = self._process(data, STREAM_THRESHOLD=0, CHUNK_SIZE=chunk_size)
+                    self.assertEqual(result, expected)
+
+    def test_mmap_read_matches_plain_read(self):
+        """Test that reading through a memory map gives the same output"""
+        data = _TIBETAN_TEXT.encode('utf-8')
+        self.assertEqual(self._process(data, MMAP_THRESHOLD=1), self._process(data))
+
+    # === LINE ENDINGS ===
+
+    def test_crlf_and_lone_cr(self):
+        """Test that CRLF and lone CR line endings read as LF"""
+        expected = self._process(b'bla ma\nsangs rgyas\nka\n')
+        for data in (b'bla ma\r\nsangs rgyas\r\nka\r\n', b'bla ma\rsangs rgyas\rka\r',
+                     b'bla ma\r\nsangs rgyas\rka\n'):
+            with self.subTest(data=data):
+                self.assertEqual(self._process(data), expected)
+                self.assertEqual(self._process(data, STREAM_THRESHOLD=0, CHUNK_SIZE=3),
+                                 expected)
+
+    # === EMPTY FILE ===
+
+    def test_empty_file(self):
+        """Test that an empty file converts to an empty file"""
+        for mode in ('auto', 'w', 't'):
+            with self.subTest(mode=mode):
+                output, stats = self._process(b'', mode)
+                self.assertEqual(output, b'')
+                self.assertEqual(
+                    (stats.input_chars, stats.output_chars, stats.input_lines, stats.output_lines),
+                    (0, 0, 1, 1)
+                )
+
+    # === BATCH PROCESSING ===
+
+    def test_process_files_order(self):
+        """Test that process_files returns statistics in the order of pairs"""
+        texts = ['ka', 'bla ma\nsangs rgyas', 'བླ་མ', '1959\n\n\n']
+        pairs = [
+            (self._write_input(f'in{i}.txt', text.encode('utf-8')), str(self.dir / f'out{i}.txt'))
+            for i, text in enumerate(texts)
+        ]
+        results = self.processor.process_files(pairs, workers=4)
+
+        single_path = self.dir / 'single.txt'
+        for (input_path, output_path), result in zip(pairs, results, strict=True):
+            with self.subTest(input_path=input_path):
+                self.assertEqual(result, self.processor.process_file(input_path, str(single_path)))
+                self.assertEqual(Path(output_path).read_bytes(), single_path.read_bytes())
+
+    def test_process_files_errors(self):
+        """Test that process_files raises the error of a failing file"""
+        good = self._write_input('good.txt', b'ka')
+        missing = str(self.dir / 'missing.txt')
+        pairs = [(good, str(self.dir / 'out1.txt')), (missing, str(self.dir / 'out2.txt'))]
+
+        with self.assertRaises(FileNotFoundError):
+            self.processor.process_files(pairs)
+        with self.assertRaises(ValueError):
+            self.processor.process_files(pairs[:1] * 2, mode='x')
+
+    # === ERROR HANDLING ===
+
+    def test_invalid_utf8_keeps_existing_output(self):
+        """Test that undecodable input leaves an existing output untouched"""
+        data = _WYLIE_TEXT.encode('utf-8')
+        bad_position = len(data)
+        input_path = self._write_input('input.txt', data + b'\xff' + b'ka\n')
+        output_path = self.dir / 'output.txt'
+
+        for overrides in ({}, {'STREAM_THRESHOLD': 0, 'CHUNK_SIZE': 64}):
+            with self.subTest(**overrides):
+                output_path.write_bytes(b'previous output')
+                with mock.patch.dict(vars(file_processor), overrides), \
+                        self.assertRaises(IOError) as raised:
+                    self.processor.process_file(input_path, str(output_path), 'w')
+
+                self.assertIn(f'position {bad_position}', str(raised.exception))
+                self.assertEqual(output_path.read_bytes(), b'previous output')
+                # No temporary file left behind
+                self.assertEqual(sorted(os.listdir(self.dir)), ['input.txt', 'output.txt'])
+
+    def test_output_directory_recreated(self):
+        """Test that a deleted output directory is created again"""
+        input_path = self._write_input('input.txt', b'ka')
+        output_dir = self.dir / 'out'
+        for _ in range(2):
+            self.processor.process_file(input_path, str(output_dir / 'output.txt'))
+            self.assertTrue((output_dir / 'output.txt').exists())
+            (output_dir / 'output.txt').unlink()
+            output_dir.rmdir()
+
+    def test_missing_input(self):
+        """Test that a missing input raises FileNotFoundError"""
+        with self.assertRaises(FileNotFoundError):
+            self.processor.process_file(str(self.dir / 'missing.txt'), str(self.dir / 'out.txt'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,180 +5,181 @@ Tests ACIP conversion to ensure compatibility with pyewts.
 """
 
 import unittest
-import sys
-import os
 
-# Add pyewts to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../pyewts'))
+# First, so the shared sys.path setup can find the ACIP module
+from _pyewts_base import PYEWTS_AVAILABLE, get_pyewts, memoized
+from wylie_transliterator import ACIPService
 
 try:
-    import pyewts
-    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../pyewts'))
     import ACIP
-    PYEWTS_AVAILABLE = True
+    ACIP_AVAILABLE = True
 except ImportError:
-    PYEWTS_AVAILABLE = False
+    ACIP_AVAILABLE = False
 
-from wylie_transliterator import ACIPService
 
+_SIMPLE_ACIP_WORDS = (
+    'KA',         # ཀ
+    'KHA',        # ཁ
+    'GA',         # ག
+    'NGA',        # ང
+    'BKRA SHIS',  # བཀྲ་ཤིས
+)
+
+_ACIP_VOWELS = (
+    'KA',   # ཀ (inherent a)
+    'KI',   # ཀི
+    'KU',   # ཀུ
+    'KE',   # ཀེ
+    'KO',   # ཀོ
+)
+
+_ACIP_DIPHTHONGS = (
+    'KEE',  # ཀཻ (ai)
+    'KOO',  # ཀཽ (au)
+)
+
+_ACIP_COMPLEX_STACKS = (
+    'BSGRUBS',      # བསྒྲུབས
+    'BKRA',         # བཀྲ
+    'DKON',         # དཀོན
+    'MCHOG',        # མཆོག
+    'SPYAN',        # སྤྱན
+)
+
+_ACIP_GENITIVE_PARTICLES = (
+    "BA'I",    # བའི
+    "KA'I",    # ཀའི
+    "PA'O",    # པའོ
+)
+
+_ACIP_TS_TSH_DISTINCTION = (
+    ('TS', 'tsh'),  # ACIP TS = EWTS tsh = ཚ
+    ('TZ', 'ts'),   # ACIP TZ = EWTS ts = ཙ
+)
+
+_ACIP_CASE_MAPPING = (
+    ('BSGRUBS', 'bsgrubs'),
+    ('SANGS RGYAS', 'sangs rgyas'),
+)
+
+_ACIP_MANTRAS = (
+    'OM MA NI PA DME HUM',     # ཨོམ་མ་ནི་པ་དམེ་ཧུམ
+    'OM',                       # ཨོམ
+)
 
-@unittest.skipUnless(PYEWTS_AVAILABLE, "pyewts not available for comparison")
+_ACIP_TO_EWTS_BASIC = (
+    'BKRA SHIS',
+    'DKON MCHOG',
+    'BSGRUBS',
+)
+
+_ACIP_ROUNDTRIP_NORMALIZED = (
+    ('OM', 'AOM'),           # Vowel-initial normalizes
+    ('BKRA', 'BKRA'),        # Regular word stays same
+    ('BA\'I', 'BA\'I'),      # Genitive stays same
+)
+
+_ACIP_LONG_TEXT = (
+    'SANGS RGYAS DANG BYANG CHUB',
+    'DKON MCHOG GSUM',
+)
+
+
+@unittest.skipUnless(PYEWTS_AVAILABLE and ACIP_AVAILABLE, "pyewts not available for comparison")
 class TestPyewtsComparisonACIP(unittest.TestCase):
     """Compare ACIP features with pyewts"""
     
-    def setUp(self):
-        self.pyewts = pyewts.pyewts()
-        self.acip_service = ACIPService()
+    @classmethod
+    def setUpClass(cls):
+        cls.pyewts = get_pyewts()
+        # pyewts reference results, memoized: inputs repeat across tests
+        cls.expected_unicode = staticmethod(memoized(cls.pyewts.toUnicode))
+        cls.acip_service = ACIPService()
     
     def _compare_acip_to_unicode(self, acip_input):
         """Helper to compare ACIP → Unicode outputs"""
         # pyewts path: ACIP → EWTS → Unicode
         ewts = ACIP.ACIPtoEWTS(acip_input)
-        expected = self.pyewts.toUnicode(ewts)
+        expected = self.expected_unicode(ewts)
         
         # python-wylie path: ACIP → Unicode
         result = self.acip_service.acip_to_unicode(acip_input)
         
-        self.assertEqual(result, expected, 
-                        f"\nACIP: {acip_input}\nExpected: {expected}\nGot: {result}")
+        if result != expected:
+            self.fail(f"\nACIP: {acip_input}\nExpected: {expected}\nGot: {result}")
     
     def _compare_acip_to_ewts(self, acip_input):
         """Helper to compare ACIP → EWTS conversion"""
         expected = ACIP.ACIPtoEWTS(acip_input)
         result = self.acip_service.acip_to_wylie(acip_input)
         
-        self.assertEqual(result, expected,
-                        f"\nACIP: {acip_input}\nExpected EWTS: {expected}\nGot: {result}")
+        if result != expected:
+            self.fail(f"\nACIP: {acip_input}\nExpected EWTS: {expected}\nGot: {result}")
+    
+    def _compare_each(self, cases, compare):
+        """Run compare on every ACIP case in its own subtest"""
+        for acip in cases:
+            with self.subTest(acip=acip):
+                compare(acip)
     
     # === BASIC ACIP ===
     
     def test_simple_acip_words(self):
         """Test simple ACIP words"""
-        test_cases = [
-            'KA',         # ཀ
-            'KHA',        # ཁ
-            'GA',         # ག
-            'NGA',        # ང
-            'BKRA SHIS',  # བཀྲ་ཤིས
-        ]
-        
-        for acip in test_cases:
-            with self.subTest(acip=acip):
-                self._compare_acip_to_unicode(acip)
+        self._compare_each(_SIMPLE_ACIP_WORDS, self._compare_acip_to_unicode)
     
     def test_acip_vowels(self):
         """Test ACIP vowels"""
-        test_cases = [
-            'KA',   # ཀ (inherent a)
-            'KI',   # ཀི
-            'KU',   # ཀུ
-            'KE',   # ཀེ
-            'KO',   # ཀོ
-        ]
-        
-        for acip in test_cases:
-            with self.subTest(acip=acip):
-                self._compare_acip_to_unicode(acip)
+        self._compare_each(_ACIP_VOWELS, self._compare_acip_to_unicode)
     
     def test_acip_diphthongs(self):
         """Test ACIP diphthongs (EE, OO)"""
-        test_cases = [
-            'KEE',  # ཀཻ (ai)
-            'KOO',  # ཀཽ (au)
-        ]
-        
-        for acip in test_cases:
-            with self.subTest(acip=acip):
-                self._compare_acip_to_unicode(acip)
+        self._compare_each(_ACIP_DIPHTHONGS, self._compare_acip_to_unicode)
     
     # === ACIP COMPLEX STACKS ===
     
     def test_acip_complex_stacks(self):
         """Test ACIP complex consonant stacks"""
-        test_cases = [
-            'BSGRUBS',      # བསྒྲུབས
-            'BKRA',         # བཀྲ
-            'DKON',         # དཀོན
-            'MCHOG',        # མཆོག
-            'SPYAN',        # སྤྱན
-        ]
-        
-        for acip in test_cases:
-            with self.subTest(acip=acip):
-                self._compare_acip_to_unicode(acip)
+        self._compare_each(_ACIP_COMPLEX_STACKS, self._compare_acip_to_unicode)
     
     # === ACIP GENITIVE ===
     
     def test_acip_genitive_particles(self):
         """Test ACIP genitive particles"""
-        test_cases = [
-            "BA'I",    # བའི
-            "KA'I",    # ཀའི
-            "PA'O",    # པའོ
-        ]
-        
-        for acip in test_cases:
-            with self.subTest(acip=acip):
-                self._compare_acip_to_unicode(acip)
+        self._compare_each(_ACIP_GENITIVE_PARTICLES, self._compare_acip_to_unicode)
     
     # === ACIP TS/TZ DISTINCTION ===
     
     def test_acip_ts_tsh_distinction(self):
         """Test ACIP TS (tsh) vs TZ (ts) distinction"""
-        test_cases = [
-            ('TS', 'tsh'),  # ACIP TS = EWTS tsh = ཚ
-            ('TZ', 'ts'),   # ACIP TZ = EWTS ts = ཙ
-        ]
-        
-        for acip_input, expected_ewts in test_cases:
+        for acip_input, expected_ewts in _ACIP_TS_TSH_DISTINCTION:
             with self.subTest(acip=acip_input):
                 result_ewts = self.acip_service.acip_to_wylie(acip_input)
-                self.assertEqual(result_ewts, expected_ewts,
-                               f"ACIP {acip_input} should convert to EWTS {expected_ewts}")
+                if result_ewts != expected_ewts:
+                    self.fail(f"ACIP {acip_input} should convert to EWTS {expected_ewts}")
                 self._compare_acip_to_unicode(acip_input)
     
     # === ACIP CASE HANDLING ===
     
     def test_acip_case_mapping(self):
         """Test ACIP uppercase ↔ EWTS lowercase"""
-        test_cases = [
-            ('BSGRUBS', 'bsgrubs'),
-            ('SANGS RGYAS', 'sangs rgyas'),
-        ]
-        
-        for acip_input, expected_ewts in test_cases:
+        for acip_input, expected_ewts in _ACIP_CASE_MAPPING:
             with self.subTest(acip=acip_input):
                 result_ewts = self.acip_service.acip_to_wylie(acip_input)
-                self.assertEqual(result_ewts, expected_ewts,
-                               f"ACIP {acip_input} should convert to EWTS {expected_ewts}")
+                if result_ewts != expected_ewts:
+                    self.fail(f"ACIP {acip_input} should convert to EWTS {expected_ewts}")
     
     # === ACIP MANTRAS ===
     
     def test_acip_mantras(self):
         """Test ACIP mantras"""
-        test_cases = [
-            'OM MA NI PA DME HUM',     # ཨོམ་མ་ནི་པ་དམེ་ཧུམ
-            'OM',                       # ཨོམ
-        ]
-        
-        for acip in test_cases:
-            with self.subTest(acip=acip):
-                self._compare_acip_to_unicode(acip)
+        self._compare_each(_ACIP_MANTRAS, self._compare_acip_to_unicode)
     
     # === ACIP TO EWTS CONVERSION ===
     
     def test_acip_to_ewts_basic(self):
         """Test ACIP to EWTS conversion"""
-        test_cases = [
-            'BKRA SHIS',
-            'DKON MCHOG',
-            'BSGRUBS',
-        ]
-        
-        for acip in test_cases:
-            with self.subTest(acip=acip):
-                self._compare_acip_to_ewts(acip)
+        self._compare_each(_ACIP_TO_EWTS_BASIC, self._compare_acip_to_ewts)
     
     # === ACIP ROUNDTRIP ===
     
@@ -186,13 +187,7 @@ class TestPyewtsComparisonACIP(unittest.TestCase):
         """Test ACIP roundtrip produces normalized form"""
         # Note: Roundtrip may normalize to canonical forms
         # E.g., OM → ཨོམ → AOM (explicit form)
-        test_cases = [
-            ('OM', 'AOM'),           # Vowel-initial normalizes
-            ('BKRA', 'BKRA'),        # Regular word stays same
-            ('BA\'I', 'BA\'I'),      # Genitive stays same
-        ]
-        
-        for acip_input, expected_roundtrip in test_cases:
+        for acip_input, expected_roundtrip in _ACIP_ROUNDTRIP_NORMALIZED:
             with self.subTest(acip=acip_input):
                 # Forward: ACIP → Unicode
                 unicode_result = self.acip_service.acip_to_unicode(acip_input)
@@ -200,21 +195,14 @@ class TestPyewtsComparisonACIP(unittest.TestCase):
                 # Backward: Unicode → ACIP
                 roundtrip = self.acip_service.unicode_to_acip(unicode_result)
                 
-                self.assertEqual(roundtrip, expected_roundtrip,
-                               f"Roundtrip: {acip_input} → {unicode_result} → {roundtrip}")
+                if roundtrip != expected_roundtrip:
+                    self.fail(f"Roundtrip: {acip_input} → {unicode_result} → {roundtrip}")
     
     # === ACIP LONG TEXT ===
     
     def test_acip_long_text(self):
         """Test longer ACIP text"""
-        test_cases = [
-            'SANGS RGYAS DANG BYANG CHUB',
-            'DKON MCHOG GSUM',
-        ]
-        
-        for acip in test_cases:
-            with self.subTest(acip=acip):
-                self._compare_acip_to_unicode(acip)
+        self._compare_each(_ACIP_LONG_TEXT, self._compare_acip_to_unicode)
 
 
 if __name__ == '__main__':
@@ -5,164 +5,122 @@ Tests Unicode → Wylie conversion to ensure compatibility with pyewts.
 """
 
 import unittest
-import sys
-import os
 
-# Add pyewts to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../pyewts'))
+from _pyewts_base import _PyewtsCompareBase
 
-try:
-    import pyewts
-    PYEWTS_AVAILABLE = True
-except ImportError:
-    PYEWTS_AVAILABLE = False
 
-from wylie_transliterator import TransliterationService
+_REVERSE_BASIC_CONSONANTS = (
+    'ཀ',  # ka
+    'ཁ',  # kha
+    'ག',  # ga
+    'ང',  # nga
+    'པ',  # pa
+    'བ',  # ba
+    'མ',  # ma
+)
 
+_REVERSE_WITH_VOWELS = (
+    'ཀི',  # ki
+    'ཀུ',  # ku
+    'ཀེ',  # ke
+    'ཀོ',  # ko
+)
 
-@unittest.skipUnless(PYEWTS_AVAILABLE, "pyewts not available for comparison")
-class TestPyewtsComparisonReverse(unittest.TestCase):
+_REVERSE_COMPLEX_STACKS = (
+    'བསྒྲུབས',  # bsgrubs
+    'བཀྲ',      # bkra
+    'དཀོན',     # dkon
+    'སྤྱན',     # spyan
+)
+
+_REVERSE_VOWEL_INITIAL = (
+    'ཨ',     # a
+    'ཨི',    # i
+    'ཨུ',    # u
+    'ཨེ',    # e
+    'ཨོ',    # o
+    'ཨོམ',   # om
+)
+
+_REVERSE_PUNCTUATION = (
+    '།',    # /
+    '༎',    # //
+    '༑',    # |
+    '་',    # (tsheg)
+)
+
+_REVERSE_NUMERALS = (
+    '༠',  # 0
+    '༡',  # 1
+    '༢',  # 2
+    '༩',  # 9
+)
+
+_ROUNDTRIP_BASIC = (
+    'ka', 'ki', 'ku',
+    'bkra', 'shis',
+)
+
+_ROUNDTRIP_COMPLEX = (
+    'bsgrubs',
+    'dkon mchog',
+    'sangs rgyas',
+)
+
+_REVERSE_MULTI_SYLLABLE = (
+    'བཀྲ་ཤིས',      # bkra shis
+    'སངས་རྒྱས',     # sangs rgyas
+    'བྱང་ཆུབ',      # byang chub
+)
+
+_REVERSE_SANSKRIT = (
+    'ཎ',     # N (retroflex)
+    'ཊ',     # T (retroflex)
+    'ཨོཾ',   # oM (with anusvara)
+    'ཀཿ',    # kaH (with visarga)
+)
+
+
+class TestPyewtsComparisonReverse(_PyewtsCompareBase):
     """Compare reverse transliteration (Unicode → Wylie) with pyewts"""
     
-    def setUp(self):
-        self.pyewts = pyewts.pyewts()
-        self.service = TransliterationService()
-    
-    def _compare_reverse(self, tibetan_unicode):
-        """Helper to compare Tibetan → Wylie outputs"""
-        expected = self.pyewts.toWylie(tibetan_unicode)
-        result = self.service.transliterate_tibetan_to_wylie(tibetan_unicode)
-        
-        self.assertEqual(result, expected, 
-                        f"\nTibetan: {tibetan_unicode}\nExpected: {expected}\nGot: {result}")
-    
-    def _compare_roundtrip(self, wylie_input):
-        """Helper to test roundtrip: Wylie → Unicode → Wylie"""
-        # Forward
-        unicode_result = self.service.transliterate_wylie_to_tibetan(wylie_input, preserve_spaces=True)
-        
-        # Backward
-        wylie_result = self.service.transliterate_tibetan_to_wylie(unicode_result)
-        
-        # Compare with pyewts roundtrip
-        expected_unicode = self.pyewts.toUnicode(wylie_input)
-        expected_wylie = self.pyewts.toWylie(expected_unicode)
-        
-        self.assertEqual(wylie_result, expected_wylie,
-                        f"\nOriginal: {wylie_input}\nUnicode: {unicode_result}\n"
-                        f"Roundtrip: {wylie_result}\nExpected: {expected_wylie}")
-    
     # === BASIC REVERSE TRANSLITERATION ===
     
     def test_reverse_basic_consonants(self):
         """Test reverse transliteration of basic consonants"""
-        test_cases = [
-            'ཀ',  # ka
-            'ཁ',  # kha
-            'ག',  # ga
-            'ང',  # nga
-            'པ',  # pa
-            'བ',  # ba
-            'མ',  # ma
-        ]
-        
-        for tibetan in test_cases:
-            with self.subTest(tibetan=tibetan):
-                self._compare_reverse(tibetan)
+        self._compare_reverse_each(_REVERSE_BASIC_CONSONANTS)
     
     def test_reverse_with_vowels(self):
         """Test reverse transliteration with vowels"""
-        test_cases = [
-            'ཀི',  # ki
-            'ཀུ',  # ku
-            'ཀེ',  # ke
-            'ཀོ',  # ko
-        ]
-        
-        for tibetan in test_cases:
-            with self.subTest(tibetan=tibetan):
-                self._compare_reverse(tibetan)
+        self._compare_reverse_each(_REVERSE_WITH_VOWELS)
     
     def test_reverse_complex_stacks(self):
         """Test reverse transliteration of complex stacks"""
-        test_cases = [
-            'བསྒྲུབས',  # bsgrubs
-            'བཀྲ',      # bkra
-            'དཀོན',     # dkon
-            'སྤྱན',     # spyan
-        ]
-        
-        for tibetan in test_cases:
-            with self.subTest(tibetan=tibetan):
-                self._compare_reverse(tibetan)
+        self._compare_reverse_each(_REVERSE_COMPLEX_STACKS)
     
     def test_reverse_vowel_initial(self):
         """Test reverse transliteration of vowel-initial syllables"""
-        test_cases = [
-            'ཨ',     # a
-            'ཨི',    # i
-            'ཨུ',    # u
-            'ཨེ',    # e
-            'ཨོ',    # o
-            'ཨོམ',   # om
-        ]
-        
-        for tibetan in test_cases:
-            with self.subTest(tibetan=tibetan):
-                self._compare_reverse(tibetan)
+        self._compare_reverse_each(_REVERSE_VOWEL_INITIAL)
     
     def test_reverse_punctuation(self):
         """Test reverse transliteration of punctuation"""
-        test_cases = [
-            '།',    # /
-            '༎',    # //
-            '༑',    # |
-            '་',    # (tsheg)
-        ]
-        
-        for tibetan in test_cases:
-            with self.subTest(tibetan=tibetan):
-                self._compare_reverse(tibetan)
+        self._compare_reverse_each(_REVERSE_PUNCTUATION)
     
     def test_reverse_numerals(self):
         """Test reverse transliteration of numerals"""
-        test_cases = [
-            '༠',  # 0
-            '༡',  # 1
-            '༢',  # 2
-            '༩',  # 9
-        ]
-        
-        for tibetan in test_cases:
-            with self.subTest(tibetan=tibetan):
-                self._compare_reverse(tibetan)
+        self._compare_reverse_each(_REVERSE_NUMERALS)
     
     # === ROUNDTRIP TESTS ===
     
     def test_roundtrip_basic(self):
         """Test roundtrip for basic words"""
-        test_cases = [
-            'ka', 'ki', 'ku',
-            'bkra', 'shis',
-        ]
-        
-        for wylie in test_cases:
-            with self.subTest(wylie=wylie):
-                self._compare_roundtrip(wylie)
+        self._compare_roundtrip_each(_ROUNDTRIP_BASIC)
     
     def test_roundtrip_complex(self):
         """Test roundtrip for complex words"""
-        test_cases = [
-            'bsgrubs',
-            'dkon mchog',
-            'sangs rgyas',
-        ]
-        
-        for wylie in test_cases:
-            with self.subTest(wylie=wylie):
-                self._compare_roundtrip(wylie)
+        self._compare_roundtrip_each(_ROUNDTRIP_COMPLEX)
     
+    @unittest.skip("edge case: roundtrip normalizes the vowel; see docstring")
     def test_roundtrip_genitive(self):
         """Test roundtrip for genitive particles
         
@@ -170,44 +128,21 @@ class TestPyewtsComparisonReverse(unittest.TestCase):
         E.g., ba'i → བའི → b'i (inherent 'a' not explicitly written in reverse)
         This is a minor normalization difference, not a functional issue.
         """
-        test_cases = [
-            # "ba'i",  # Roundtrip normalizes to b'i (inherent a)
-            # "ka'o",  # Roundtrip has vowel encoding issues
-            # These edge cases don't affect forward transliteration
-        ]
-        
-        for wylie in test_cases:
-            with self.subTest(wylie=wylie):
-                self._compare_roundtrip(wylie)
+        # "ba'i",  # Roundtrip normalizes to b'i (inherent a)
+        # "ka'o",  # Roundtrip has vowel encoding issues
+        # These edge cases don't affect forward transliteration
     
     # === WORDS WITH TSHEG ===
     
     def test_reverse_multi_syllable(self):
         """Test reverse transliteration of multi-syllable words"""
-        test_cases = [
-            'བཀྲ་ཤིས',      # bkra shis
-            'སངས་རྒྱས',     # sangs rgyas
-            'བྱང་ཆུབ',      # byang chub
-        ]
-        
-        for tibetan in test_cases:
-            with self.subTest(tibetan=tibetan):
-                self._compare_reverse(tibetan)
+        self._compare_reverse_each(_REVERSE_MULTI_SYLLABLE)
     
     # === SANSKRIT FEATURES ===
     
     def test_reverse_sanskrit(self):
         """Test reverse transliteration of Sanskrit features"""
-        test_cases = [
-            'ཎ',     # N (retroflex)
-            'ཊ',     # T (retroflex)
-            'ཨོཾ',   # oM (with anusvara)
-            'ཀཿ',    # kaH (with visarga)
-        ]
-        
-        for tibetan in test_cases:
-            with self.subTest(tibetan=tibetan):
-                self._compare_reverse(tibetan)
+        self._compare_reverse_each(_REVERSE_SANSKRIT)
 
 
 if __name__ == '__main__':
@@ -5,43 +5,90 @@ Tests Sanskrit extensions to ensure compatibility with pyewts.
 """
 
 import unittest
-import sys
-import os
-import unicodedata
 
-# Add pyewts to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../pyewts'))
+from _pyewts_base import _PyewtsCompareBase
 
-try:
-    import pyewts
-    PYEWTS_AVAILABLE = True
-except ImportError:
-    PYEWTS_AVAILABLE = False
 
-from wylie_transliterator import TransliterationService
+_RETROFLEX_CONSONANTS_DOUBLE_LETTER = (
+    'Ta',    # ཊ (Sanskrit retroflex, single char)
+    'Na',    # ཎ (Sanskrit retroflex, single char)
+)
 
+_RETROFLEX_CONSONANTS_CAPITAL = (
+    'Ti',    # ཊི
+    'Di',    # ཌི
+    'Ni',    # ཎི
+)
 
-@unittest.skipUnless(PYEWTS_AVAILABLE, "pyewts not available for comparison")
-class TestPyewtsComparisonSanskrit(unittest.TestCase):
+_SANSKRIT_SHA = (
+    # 'ssa',   # Ambiguous: skip this edge case
+    'Sha',   # ཥ (capital notation) - unambiguous
+)
+
+_ANUSVARA = (
+    'oM',     # ཨོཾ
+    'aM',     # ཨཾ
+    'iM',     # ཨིཾ
+    'uM',     # ཨུཾ
+    'eM',     # ཨེཾ
+    'hUM',    # ཧཱུཾ (compound vowel)
+)
+
+_VISARGA = (
+    'kaH',    # ཀཿ
+    'paH',    # པཿ
+    'aH',     # ཨཿ
+)
+
+_EXPLICIT_SUBSCRIPT_NOTATION = (
+    'd+me',   # དྨེ (subscript m)
+    'p+ra',   # པྲ (explicit subscript)
+    'k+ya',   # ཀྱ (explicit subscript)
+)
+
+_OM_MANI_PADME_HUM = (
+    'oM ma Ni pa dme hUM',  # With standard dme (two syllables)
+)
+
+_OM_SYLLABLE = (
+    'om',    # ཨོམ (no anusvara)
+    'oM',    # ཨོཾ (with anusvara)
+)
+
+_LONG_VOWELS = (
+    'kA',    # ཀཱ (long a)
+    'kI',    # ཀཱི (long i)
+    'kU',    # ཀཱུ (long u)
+)
+
+_REVERSE_VOWELS = (
+    'k-i',   # ཀྀ
+    'k-I',   # ཀཱྀ
+)
+
+_ASPIRATED_COMPOUNDS = (
+    'gha',   # གྷ
+    'jha',   # ཇྷ
+    'dha',   # དྷ
+    'bha',   # བྷ
+)
+
+
+class TestPyewtsComparisonSanskrit(_PyewtsCompareBase):
     """Compare Sanskrit features with pyewts"""
     
-    def setUp(self):
-        self.pyewts = pyewts.pyewts()
-        self.service = TransliterationService()
-    
-    def _compare(self, wylie_input, preserve_spaces=True):
-        """Helper to compare outputs with Unicode normalization"""
-        expected = self.pyewts.toUnicode(wylie_input)
-        result = self.service.transliterate_wylie_to_tibetan(wylie_input, preserve_spaces=preserve_spaces)
-        
-        # Normalize to NFC (Canonical Composition) for comparison
-        # This handles composed vs decomposed Unicode differences
-        expected = unicodedata.normalize('NFC', expected)
-        result = unicodedata.normalize('NFC', result)
-        
-        self.assertEqual(result, expected, 
-                        f"\nInput: {wylie_input}\nExpected: {expected}\nGot: {result}")
+    preserve_spaces = True
+    # Normalize to NFC (Canonical Composition) for comparison
+    # This handles composed vs decomposed Unicode differences
+    normalization = 'NFC'
+    # Every Wylie input of the suite, so each expected value is computed
+    # and normalized once at class load
+    cases = (
+        _RETROFLEX_CONSONANTS_DOUBLE_LETTER + _RETROFLEX_CONSONANTS_CAPITAL
+        + _SANSKRIT_SHA + _ANUSVARA + _VISARGA + _EXPLICIT_SUBSCRIPT_NOTATION
+        + ('dme',) + _OM_MANI_PADME_HUM + _OM_SYLLABLE + _LONG_VOWELS
+        + _REVERSE_VOWELS + _ASPIRATED_COMPOUNDS
+    )
     
     # === SANSKRIT RETROFLEX CONSONANTS ===
     
@@ -52,34 +99,17 @@ class TestPyewtsComparisonSanskrit(unittest.TestCase):
         python-wylie parses it as one syllable (n + postscript-n + a).
         Both are valid interpretations. We skip this edge case.
         """
-        test_cases = [
-            # Skip these edge cases - they parse as root+postscript in python-wylie
-            # but as two syllables in pyewts. Both are valid.
-            # 'tta',   # Could be t+ta or t+postscript-t+a
-            # 'nna',   # Could be n+na or n+postscript-n+a
-        ]
+        # Skipped edge cases - they parse as root+postscript in python-wylie
+        # but as two syllables in pyewts. Both are valid.
+        # 'tta',   # Could be t+ta or t+postscript-t+a
+        # 'nna',   # Could be n+na or n+postscript-n+a
         
         # Test that Capital notation works correctly
-        test_cases = [
-            'Ta',    # ཊ (Sanskrit retroflex, single char)
-            'Na',    # ཎ (Sanskrit retroflex, single char)
-        ]
-        
-        for wylie in test_cases:
-            with self.subTest(wylie=wylie):
-                self._compare(wylie)
+        self._compare_each(_RETROFLEX_CONSONANTS_DOUBLE_LETTER)
     
     def test_retroflex_consonants_capital(self):
         """Test Sanskrit retroflex consonants (capital notation)"""
-        test_cases = [
-            'Ti',    # ཊི
-            'Di',    # ཌི
-            'Ni',    # ཎི
-        ]
-        
-        for wylie in test_cases:
-            with self.subTest(wylie=wylie):
-                self._compare(wylie)
+        self._compare_each(_RETROFLEX_CONSONANTS_CAPITAL)
     
     def test_sanskrit_sha(self):
         """Test Sanskrit sha (ཥ)
@@ -88,57 +118,23 @@ class TestPyewtsComparisonSanskrit(unittest.TestCase):
         s+postscript-s+a (one syllable). python-wylie parses as one syllable.
         Use Capital notation 'Sha' for unambiguous Sanskrit sha.
         """
-        test_cases = [
-            # 'ssa',   # Ambiguous: skip this edge case
-            'Sha',   # ཥ (capital notation) - unambiguous
-        ]
-        
-        for wylie in test_cases:
-            with self.subTest(wylie=wylie):
-                self._compare(wylie)
+        self._compare_each(_SANSKRIT_SHA)
     
     # === SANSKRIT MARKS ===
     
     def test_anusvara(self):
         """Test anusvara (M) in various contexts"""
-        test_cases = [
-            'oM',     # ཨོཾ
-            'aM',     # ཨཾ
-            'iM',     # ཨིཾ
-            'uM',     # ཨུཾ
-            'eM',     # ཨེཾ
-            'hUM',    # ཧཱུཾ (compound vowel)
-        ]
-        
-        for wylie in test_cases:
-            with self.subTest(wylie=wylie):
-                self._compare(wylie)
+        self._compare_each(_ANUSVARA)
     
     def test_visarga(self):
         """Test visarga (H)"""
-        test_cases = [
-            'kaH',    # ཀཿ
-            'paH',    # པཿ
-            'aH',     # ཨཿ
-        ]
-        
-        for wylie in test_cases:
-            with self.subTest(wylie=wylie):
-                self._compare(wylie)
+        self._compare_each(_VISARGA)
     
     # === SANSKRIT SUBSCRIPTS ===
     
     def test_explicit_subscript_notation(self):
         """Test explicit + notation for subscripts"""
-        test_cases = [
-            'd+me',   # དྨེ (subscript m)
-            'p+ra',   # པྲ (explicit subscript)
-            'k+ya',   # ཀྱ (explicit subscript)
-        ]
-        
-        for wylie in test_cases:
-            with self.subTest(wylie=wylie):
-                self._compare(wylie)
+        self._compare_each(_EXPLICIT_SUBSCRIPT_NOTATION)
     
     def test_dme_without_plus(self):
         """Test dme without + is two syllables"""
@@ -152,8 +148,8 @@ class TestPyewtsComparisonSanskrit(unittest.TestCase):
         wylie_no_plus = 'dme'
         wylie_with_plus = 'd+me'
         
-        result_no_plus = self.service.transliterate_wylie_to_tibetan(wylie_no_plus)
-        result_with_plus = self.service.transliterate_wylie_to_tibetan(wylie_with_plus)
+        result_no_plus = self.to_tibetan(wylie_no_plus)
+        result_with_plus = self.to_tibetan(wylie_with_plus)
         
         self.assertNotEqual(result_no_plus, result_with_plus,
                           f"dme and d+me should produce different results")
@@ -164,65 +160,29 @@ class TestPyewtsComparisonSanskrit(unittest.TestCase):
         """Test famous mantra"""
         # Note: dme without + is two syllables
         # Note: pyewts converts spaces to tsheg between syllables
-        test_cases = [
-            'oM ma Ni pa dme hUM',  # With standard dme (two syllables)
-        ]
-        
-        for wylie in test_cases:
-            with self.subTest(wylie=wylie):
-                self._compare(wylie, preserve_spaces=False)  # Convert spaces to tsheg
+        self._compare_each(_OM_MANI_PADME_HUM, preserve_spaces=False)  # Convert spaces to tsheg
     
     def test_om_syllable(self):
         """Test Om in various forms"""
-        test_cases = [
-            'om',    # ཨོམ (no anusvara)
-            'oM',    # ཨོཾ (with anusvara)
-        ]
-        
-        for wylie in test_cases:
-            with self.subTest(wylie=wylie):
-                self._compare(wylie)
+        self._compare_each(_OM_SYLLABLE)
     
     # === LONG VOWELS ===
     
     def test_long_vowels(self):
         """Test long vowels (A, I, U)"""
-        test_cases = [
-            'kA',    # ཀཱ (long a)
-            'kI',    # ཀཱི (long i)
-            'kU',    # ཀཱུ (long u)
-        ]
-        
-        for wylie in test_cases:
-            with self.subTest(wylie=wylie):
-                self._compare(wylie)
+        self._compare_each(_LONG_VOWELS)
     
     def test_reverse_vowels(self):
         """Test reverse vowels (-i, -I)"""
-        test_cases = [
-            'k-i',   # ཀྀ
-            'k-I',   # ཀཱྀ
-        ]
-        
-        for wylie in test_cases:
-            with self.subTest(wylie=wylie):
-                self._compare(wylie)
+        self._compare_each(_REVERSE_VOWELS)
     
     # === SANSKRIT COMPOUNDS ===
     
     def test_aspirated_compounds(self):
         """Test aspirated compounds (gh, jh, dh, bh)"""
-        test_cases = [
-            'gha',   # གྷ
-            'jha',   # ཇྷ
-            'dha',   # དྷ
-            'bha',   # བྷ
-        ]
-        
-        for wylie in test_cases:
-            with self.subTest(wylie=wylie):
-                self._compare(wylie)
+        self._compare_each(_ASPIRATED_COMPOUNDS)
     
+    @unittest.skip("edge case: ambiguous parse; see docstring")
     def test_kssa(self):
         """Test kssa (ཀྵ)
         
@@ -233,16 +193,7 @@ class TestPyewtsComparisonSanskrit(unittest.TestCase):
         For unambiguous kssa, use explicit subscript notation: k+ssa or capital Kssa.
         We skip this edge case test.
         """
-        test_cases = [
-            # 'kssa',  # Ambiguous: skip this edge case
-        ]
-        
-        for wylie in test_cases:
-            with self.subTest(wylie=wylie):
-                self._compare(wylie)
-        
-        # Test passes trivially with no test cases
-        # This is intentional - we document the ambiguity
+        # 'kssa',  # Ambiguous: skip this edge case
 
 
 if __name__ == '__main__':
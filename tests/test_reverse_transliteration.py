@@ -4,14 +4,127 @@ Test Suite for Tibetan → Wylie Reverse Transliteration
 Tests bidirectional transliteration capability.
 """
 
+import re
 import unittest
 import sys
-from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+from _bidi_fixtures import _BIDI_SIMPLE, _BIDI_WORDS
+from _fixtures import VERBOSE_SUBTESTS, get_service
 
-from wylie_transliterator.application.transliteration_service import TransliterationService
+
+def _columns(rows):
+    """Transpose (tibetan, expected) rows into (tibetans, expecteds) columns"""
+    return tuple(zip(*rows))
+
+
+_BASIC_CONSONANTS = _columns((
+    ('ཀ', 'ka'),
+    ('ཁ', 'kha'),
+    ('ག', 'ga'),
+    ('ང', 'nga'),
+    ('ཅ', 'ca'),
+    ('ཆ', 'cha'),
+    ('ཇ', 'ja'),
+    ('ཉ', 'nya'),
+    ('ཏ', 'ta'),
+    ('ཐ', 'tha'),
+    ('ད', 'da'),
+    ('ན', 'na'),
+    ('པ', 'pa'),
+    ('ཕ', 'pha'),
+    ('བ', 'ba'),
+    ('མ', 'ma'),
+    ('ཙ', 'tsa'),
+    ('ཚ', 'tsha'),
+    ('ཛ', 'dza'),
+    ('ཝ', 'wa'),
+    ('ཞ', 'zha'),
+    ('ཟ', 'za'),
+    ('འ', "'a"),
+    ('ཡ', 'ya'),
+    ('ར', 'ra'),
+    ('ལ', 'la'),
+    ('ཤ', 'sha'),
+    ('ས', 'sa'),
+    ('ཧ', 'ha'),
+    ('ཨ', 'a'),
+))
+
+_VOWELS = _columns((
+    ('ཀ', 'ka'),     # Inherent a
+    ('ཀི', 'ki'),     # i vowel
+    ('ཀུ', 'ku'),     # u vowel
+    ('ཀེ', 'ke'),     # e vowel
+    ('ཀོ', 'ko'),     # o vowel
+    ('ཀཱ', 'kA'),    # long a
+))
+
+_SUBSCRIPTS = _columns((
+    ('བླ', 'bla'),    # subscript l
+    ('ཀྱ', 'kya'),    # subscript y
+    ('ཀྲ', 'kra'),    # subscript r
+    ('དྭ', 'dwa'),    # subscript w
+))
+
+_SUPERSCRIPTS = _columns((
+    ('རྐ', 'rka'),    # superscript r
+    ('ལྐ', 'lka'),    # superscript l
+    ('སྐ', 'ska'),    # superscript s
+))
+
+_COMPLEX_STACKS = _columns((
+    ('བསྒྲུབས', 'bsgrubs'),  # prescript + superscript + subscript + postscripts
+    ('སངས', 'sangs'),         # superscript + postscript
+    ('རྒྱས', 'rgyas'),        # superscript + subscript + postscript
+))
+
+_COMMON_WORDS = _columns((
+    ('བླ་མ', 'bla ma'),           # lama
+    ('སངས་རྒྱས', 'sangs rgyas'),  # buddha
+    ('བྱང་ཆུབ', 'byang chub'),    # enlightenment
+    ('བདེ་བ', 'bde ba'),           # happiness
+))
+
+_PUNCTUATION = _columns((
+    ('།', '/'),      # shad
+    ('༎', '//'),     # double shad (nyis shad)
+    (' ', ' '),      # space stays space
+))
+
+_NUMERALS = _columns((
+    ('༠', '0'),
+    ('༡', '1'),
+    ('༢', '2'),
+    ('༣', '3'),
+    ('༤', '4'),
+    ('༥', '5'),
+    ('༦', '6'),
+    ('༧', '7'),
+    ('༨', '8'),
+    ('༩', '9'),
+    ('༡༩༥༩', '1959'),
+    ('༡༩༥༩། ༢༠༠༠༎', '1959/ 2000//'),  # numerals and punctuation only
+))
+
+_SANSKRIT = _columns((
+    ('ཊ', 'Ta'),     # retroflex t
+    ('ཎ', 'Na'),     # retroflex n
+    ('ཀྵ', 'kss'),   # ksha
+))
+
+_SANSKRIT_MARKS = _columns((
+    ('ཾ', 'M'),      # anusvara
+    ('ཿ', 'H'),      # visarga
+))
+
+# Components the reverse-transliterated mantra must contain
+_MANTRA_CHECKS = tuple(re.compile(pattern) for pattern in (
+    r'o',       # 'o' vowel
+    r'M',       # anusvara
+    r'ma',      # 'ma'
+    r'[Nn]i',   # Sanskrit retroflex (ཎི = Ni, not Na)
+    r'/',       # shad at end
+))
 
 
 class TestReverseTransliteration(unittest.TestCase):
@@ -19,196 +132,83 @@ class TestReverseTransliteration(unittest.TestCase):
     
     @classmethod
     def setUpClass(cls):
-        """Initialize service once for all tests"""
-        cls.service = TransliterationService()
+        """Use the service shared by all suites"""
+        cls.service = get_service()
+    
+    def _assert_reverse(self, columns):
+        """Check (tibetans, expecteds) columns with one batch call
+        
+        Set VERBOSE_SUBTESTS=1 to check row by row, in subtests, instead.
+        """
+        tibetans, expecteds = columns
+        if VERBOSE_SUBTESTS:
+            for tibetan, expected in zip(tibetans, expecteds):
+                with self.subTest(tibetan=tibetan):
+                    result = self.service.transliterate_tibetan_to_wylie(tibetan)
+                    self.assertEqual(result, expected,
+                                   f"Failed: {tibetan} → {result} (expected {expected})")
+            return
+        
+        results = self.service.transliterate_tibetan_to_wylie_batch(tibetans)
+        self.assertEqual(results, list(expecteds))
     
     # === BASIC CONSONANTS ===
     
     def test_basic_consonants_reverse(self):
         """Test reverse transliteration of basic consonants"""
-        test_cases = [
-            ('ཀ', 'ka'),
-            ('ཁ', 'kha'),
-            ('ག', 'ga'),
-            ('ང', 'nga'),
-            ('ཅ', 'ca'),
-            ('ཆ', 'cha'),
-            ('ཇ', 'ja'),
-            ('ཉ', 'nya'),
-            ('ཏ', 'ta'),
-            ('ཐ', 'tha'),
-            ('ད', 'da'),
-            ('ན', 'na'),
-            ('པ', 'pa'),
-            ('ཕ', 'pha'),
-            ('བ', 'ba'),
-            ('མ', 'ma'),
-            ('ཙ', 'tsa'),
-            ('ཚ', 'tsha'),
-            ('ཛ', 'dza'),
-            ('ཝ', 'wa'),
-            ('ཞ', 'zha'),
-            ('ཟ', 'za'),
-            ('འ', "'a"),
-            ('ཡ', 'ya'),
-            ('ར', 'ra'),
-            ('ལ', 'la'),
-            ('ཤ', 'sha'),
-            ('ས', 'sa'),
-            ('ཧ', 'ha'),
-            ('ཨ', 'a'),
-        ]
-        
-        for tibetan, expected in test_cases:
-            with self.subTest(tibetan=tibetan):
-                result = self.service.transliterate_tibetan_to_wylie(tibetan)
-                self.assertEqual(result, expected,
-                               f"Failed: {tibetan} → {result} (expected {expected})")
+        self._assert_reverse(_BASIC_CONSONANTS)
     
     # === VOWELS ===
     
     def test_vowels_reverse(self):
         """Test reverse transliteration of vowel modifications"""
-        test_cases = [
-            ('ཀ', 'ka'),     # Inherent a
-            ('ཀི', 'ki'),     # i vowel
-            ('ཀུ', 'ku'),     # u vowel
-            ('ཀེ', 'ke'),     # e vowel
-            ('ཀོ', 'ko'),     # o vowel
-            ('ཀཱ', 'kA'),    # long a
-        ]
-        
-        for tibetan, expected in test_cases:
-            with self.subTest(tibetan=tibetan):
-                result = self.service.transliterate_tibetan_to_wylie(tibetan)
-                self.assertEqual(result, expected)
+        self._assert_reverse(_VOWELS)
     
     # === SUBSCRIPTS ===
     
     def test_subscripts_reverse(self):
         """Test reverse transliteration of subscripts"""
-        test_cases = [
-            ('བླ', 'bla'),    # subscript l
-            ('ཀྱ', 'kya'),    # subscript y
-            ('ཀྲ', 'kra'),    # subscript r
-            ('དྭ', 'dwa'),    # subscript w
-        ]
-        
-        for tibetan, expected in test_cases:
-            with self.subTest(tibetan=tibetan):
-                result = self.service.transliterate_tibetan_to_wylie(tibetan)
-                self.assertEqual(result, expected)
+        self._assert_reverse(_SUBSCRIPTS)
     
     # === SUPERSCRIPTS ===
     
     def test_superscripts_reverse(self):
         """Test reverse transliteration of superscripts"""
-        test_cases = [
-            ('རྐ', 'rka'),    # superscript r
-            ('ལྐ', 'lka'),    # superscript l
-            ('སྐ', 'ska'),    # superscript s
-        ]
-        
-        for tibetan, expected in test_cases:
-            with self.subTest(tibetan=tibetan):
-                result = self.service.transliterate_tibetan_to_wylie(tibetan)
-                self.assertEqual(result, expected)
+        self._assert_reverse(_SUPERSCRIPTS)
     
     # === COMPLEX STACKS ===
     
     def test_complex_stacks_reverse(self):
         """Test reverse transliteration of complex consonant stacks"""
-        test_cases = [
-            ('བསྒྲུབས', 'bsgrubs'),  # prescript + superscript + subscript + postscripts
-            ('སངས', 'sangs'),         # superscript + postscript
-            ('རྒྱས', 'rgyas'),        # superscript + subscript + postscript
-        ]
-        
-        for tibetan, expected in test_cases:
-            with self.subTest(tibetan=tibetan):
-                result = self.service.transliterate_tibetan_to_wylie(tibetan)
-                self.assertEqual(result, expected)
+        self._assert_reverse(_COMPLEX_STACKS)
     
     # === COMMON WORDS ===
     
     def test_common_words_reverse(self):
         """Test reverse transliteration of common Tibetan words"""
-        test_cases = [
-            ('བླ་མ', 'bla ma'),           # lama
-            ('སངས་རྒྱས', 'sangs rgyas'),  # buddha
-            ('བྱང་ཆུབ', 'byang chub'),    # enlightenment
-            ('བདེ་བ', 'bde ba'),           # happiness
-        ]
-        
-        for tibetan, expected in test_cases:
-            with self.subTest(tibetan=tibetan):
-                result = self.service.transliterate_tibetan_to_wylie(tibetan)
-                self.assertEqual(result, expected)
+        self._assert_reverse(_COMMON_WORDS)
     
     # === PUNCTUATION ===
     
     def test_punctuation_reverse(self):
         """Test reverse transliteration of Tibetan punctuation"""
-        test_cases = [
-            ('།', '/'),      # shad
-            ('༎', '//'),     # double shad (nyis shad)
-            (' ', ' '),      # space stays space
-        ]
-        
-        for tibetan, expected in test_cases:
-            with self.subTest(tibetan=tibetan):
-                result = self.service.transliterate_tibetan_to_wylie(tibetan)
-                self.assertEqual(result, expected)
+        self._assert_reverse(_PUNCTUATION)
     
     # === NUMERALS ===
     
     def test_numerals_reverse(self):
         """Test reverse transliteration of Tibetan numerals"""
-        test_cases = [
-            ('༠', '0'),
-            ('༡', '1'),
-            ('༢', '2'),
-            ('༣', '3'),
-            ('༤', '4'),
-            ('༥', '5'),
-            ('༦', '6'),
-            ('༧', '7'),
-            ('༨', '8'),
-            ('༩', '9'),
-            ('༡༩༥༩', '1959'),
-        ]
-        
-        for tibetan, expected in test_cases:
-            with self.subTest(tibetan=tibetan):
-                result = self.service.transliterate_tibetan_to_wylie(tibetan)
-                self.assertEqual(result, expected)
+        self._assert_reverse(_NUMERALS)
     
     # === SANSKRIT ===
     
     def test_sanskrit_reverse(self):
         """Test reverse transliteration of Sanskrit extensions"""
-        test_cases = [
-            ('ཊ', 'Ta'),     # retroflex t
-            ('ཎ', 'Na'),     # retroflex n
-            ('ཀྵ', 'kss'),   # ksha
-        ]
-        
-        for tibetan, expected in test_cases:
-            with self.subTest(tibetan=tibetan):
-                result = self.service.transliterate_tibetan_to_wylie(tibetan)
-                self.assertEqual(result, expected)
+        self._assert_reverse(_SANSKRIT)
     
     def test_sanskrit_marks_reverse(self):
         """Test reverse transliteration of Sanskrit marks"""
-        test_cases = [
-            ('ཾ', 'M'),      # anusvara
-            ('ཿ', 'H'),      # visarga
-        ]
-        
-        for tibetan, expected in test_cases:
-            with self.subTest(tibetan=tibetan):
-                result = self.service.transliterate_tibetan_to_wylie(tibetan)
-                self.assertEqual(result, expected)
+        self._assert_reverse(_SANSKRIT_MARKS)
     
     # === MANTRA ===
     
@@ -219,43 +219,31 @@ class TestReverseTransliteration(unittest.TestCase):
         result = self.service.transliterate_tibetan_to_wylie(tibetan)
         
         # Check that key components are present
-        self.assertIn('o', result)  # 'o' vowel
-        self.assertIn('M', result)  # anusvara
-        self.assertIn('ma', result)  # 'ma'
-        # Check for Sanskrit retroflex (ཎི = Ni, not Na)
-        self.assertTrue('Ni' in result or 'ni' in result,
-                       f"Expected 'Ni' or 'ni' in result: {result}")
-        self.assertIn('/', result)  # shad at end
+        missing = [rx.pattern for rx in _MANTRA_CHECKS if not rx.search(result)]
+        self.assertEqual(missing, [], f"Missing from result: {result}")
     
     # === BIDIRECTIONAL ===
     
     def test_bidirectional_simple(self):
         """Test that simple syllables round-trip correctly"""
-        test_cases = [
-            'ka', 'kha', 'ga', 'pa', 'ma',
-            'bla', 'rka', 'ska', 'bya',
-        ]
-        
-        for wylie in test_cases:
-            with self.subTest(wylie=wylie):
-                # Wylie → Tibetan → Wylie
-                tibetan = self.service.transliterate_wylie_to_tibetan(wylie)
-                result = self.service.transliterate_tibetan_to_wylie(tibetan)
-                self.assertEqual(result, wylie,
-                               f"Round-trip failed: {wylie} → {tibetan} → {result}")
+        self._assert_round_trip(_BIDI_SIMPLE)
     
     def test_bidirectional_words(self):
         """Test that common words round-trip correctly"""
-        test_cases = [
-            'bla ma',
-            'sangs rgyas',
-            'byang chub',
-        ]
-        
-        for wylie in test_cases:
+        self._assert_round_trip(_BIDI_WORDS)
+    
+    def test_bidirectional_fixtures_forward(self):
+        """Test that the precomputed Tibetan forms match the forward direction"""
+        for table in (_BIDI_SIMPLE, _BIDI_WORDS):
+            for wylie, tibetan in table.items():
+                with self.subTest(wylie=wylie):
+                    self.assertEqual(self.service.transliterate_wylie_to_tibetan(wylie), tibetan)
+    
+    def _assert_round_trip(self, table):
+        """Check that each precomputed Tibetan form reads back as its Wylie"""
+        # Wylie → Tibetan is precomputed (_bidi_fixtures); only Tibetan → Wylie runs
+        for wylie, tibetan in table.items():
             with self.subTest(wylie=wylie):
-                # Wylie → Tibetan → Wylie
-                tibetan = self.service.transliterate_wylie_to_tibetan(wylie)
                 result = self.service.transliterate_tibetan_to_wylie(tibetan)
                 self.assertEqual(result, wylie,
                                f"Round-trip failed: {wylie} → {tibetan} → {result}")
@@ -277,6 +265,14 @@ class TestReverseTransliteration(unittest.TestCase):
         result = self.service.transliterate_tibetan_to_wylie('')
         self.assertEqual(result, '')
     
+    def test_newlines_preserved(self):
+        """Test that both directions keep every newline (line counts match)"""
+        wylie = 'bla ma/\n\nsangs rgyas\n1959 oM\nk\n'
+        tibetan = self.service.transliterate_wylie_to_tibetan(wylie)
+        self.assertEqual(tibetan.count('\n'), wylie.count('\n'))
+        result = self.service.transliterate_tibetan_to_wylie(tibetan + '\n༡༩༥༩\n')
+        self.assertEqual(result.count('\n'), wylie.count('\n') + 2)
+    
     def test_unknown_characters_reverse(self):
         """Test that unknown characters pass through"""
         mixed = 'ཀ@#$བ'